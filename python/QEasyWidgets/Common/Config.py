@@ -1,4 +1,45 @@
+import os
+import sys
+import importlib.util
 from enum import Enum
+from typing import Callable
+
+##############################################################################################################################
+
+class LazyAttribute:
+    '''
+    Class attribute that is computed on first access and then cached on the class
+    '''
+    def __init__(self, function: Callable):
+        self.function = function
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        value = self.function()
+        setattr(owner, self.name, value)
+        return value
+
+
+def importSubmodule(name: str):
+    '''
+    Import a submodule without running the __init__ of its package, for packages that import all of their dependencies up front
+    '''
+    module = sys.modules.get(name)
+    if module is None:
+        packageName, _, moduleName = name.rpartition('.')
+        location = importlib.util.find_spec(packageName).submodule_search_locations[0]
+        spec = importlib.util.spec_from_file_location(name, os.path.join(location, f'{moduleName}.py'))
+        module = importlib.util.module_from_spec(spec)
+        # Registered under its own name, so that importing the package later reuses it
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+# PyEasyUtils loads its process, database and web helpers (psutil, sqlalchemy, polars...) on import, the components only need this
+singledispatchmethod = importSubmodule('PyEasyUtils.overload').singledispatchmethod
 
 ##############################################################################################################################
 
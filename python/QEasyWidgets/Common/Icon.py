@@ -1,33 +1,137 @@
+import math
 from enum import Enum
 from pathlib import Path
+from collections import OrderedDict
 from typing import Union, Optional
-from PySide6.QtCore import Qt, QFile, QRect, QRectF, QSize
+from PySide6.QtCore import Qt, QRect, QRectF, QSize
 from PySide6.QtGui import QIcon, QIconEngine, QPainter, QPixmap, QImage
 from PySide6.QtSvg import QSvgRenderer
-from PySide6.QtXml import QDomDocument
+from shiboken6 import Shiboken
 
+from .Signals import componentsSignals
 from .Theme import Theme, currentTheme
+from ..Resources import loadResources
+
+##############################################################################################################################
+
+class IconPixmapCache:
+    '''
+    Process-wide LRU cache of rasterized icons, bounded by a byte budget
+    '''
+    def __init__(self, maxBytes: int = 32 * 1024 * 1024):
+        self._pixmaps: OrderedDict[tuple, QPixmap] = OrderedDict()
+        self._maxBytes = maxBytes
+        self._currentBytes = 0
+
+    @staticmethod
+    def _sizeOf(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth() // 8, 1)
+
+    def setMaxBytes(self, maxBytes: int) -> None:
+        self._maxBytes = maxBytes
+        self._evict()
+
+    def maxBytes(self) -> int:
+        return self._maxBytes
+
+    def currentBytes(self) -> int:
+        return self._currentBytes
+
+    def get(self, key: tuple) -> Optional[QPixmap]:
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def insert(self, key: tuple, pixmap: QPixmap) -> None:
+        if key in self._pixmaps:
+            self._currentBytes -= self._sizeOf(self._pixmaps.pop(key))
+        size = self._sizeOf(pixmap)
+        if size > self._maxBytes:
+            return
+        self._pixmaps[key] = pixmap
+        self._currentBytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._currentBytes > self._maxBytes and self._pixmaps:
+            _, pixmap = self._pixmaps.popitem(last = False)
+            self._currentBytes -= self._sizeOf(pixmap)
+
+    def clear(self) -> None:
+        self._pixmaps.clear()
+        self._currentBytes = 0
+
+
+iconPixmapCache = IconPixmapCache()
+
+
+componentsSignals.setTheme.connect(iconPixmapCache.clear)
+
+##############################################################################################################################
+
+class SVGRendererPool:
+    '''
+    Parsed SVG renderers shared per (icon, theme)
+    '''
+    def __init__(self):
+        self._renderers: dict[str, QSvgRenderer] = {}
+
+    def renderer(self, path: str) -> QSvgRenderer:
+        renderer = self._renderers.get(path)
+        if renderer is None:
+            # Register the bundle of the icon's theme only, e.g. ':/Icons/icons/dark/X.svg'
+            loadResources('Icons', Path(path).parent.name) if path.startswith(':/Icons/') else None
+            renderer = QSvgRenderer(path)
+            self._renderers[path] = renderer
+        return renderer
+
+    def icon(self, path: str) -> QIcon:
+        # Each icon gets its own engine, only the parsed renderer is shared
+        engine = IconEngine()
+        engine.setRenderer(self.renderer(path))
+        return QIcon(engine)
+
+    def clear(self) -> None:
+        self._renderers.clear()
+
+
+svgRendererPool = SVGRendererPool()
 
 ##############################################################################################################################
 
 class IconEngine(QIconEngine):
     '''
     '''
+    # Clones handed to Qt, kept referenced until the QIcon owning them deletes them
+    _clones: set = set()
+
     def __init__(self, icon: Optional[QIcon] = None):
         super().__init__()
 
         self.icon = icon
 
         self.isIconSVG = False
+        self.renderer = None
 
     def loadSVG(self, svgString: str):
+        self.setRenderer(QSvgRenderer(svgString.encode(errors = 'replace')))
+
+    def setRenderer(self, renderer: QSvgRenderer):
         self.isIconSVG = True
-        self.icon = svgString.encode(errors = 'replace')
+        self.renderer = renderer
+
+    def clone(self) -> QIconEngine:
+        # Called by Qt when a QIcon detaches (e.g. addPixmap on a copy), the clone shares the renderer
+        IconEngine._clones.difference_update([engine for engine in IconEngine._clones if not Shiboken.isValid(engine)])
+        engine = IconEngine(self.icon)
+        engine.setRenderer(self.renderer) if self.isIconSVG else None
+        IconEngine._clones.add(engine)
+        return engine
 
     def paint(self, painter: QPainter, rect: QRect, mode: QIcon.Mode, state: QIcon.State) -> None:
         if self.isIconSVG:
-            renderer = QSvgRenderer(self.icon)
-            renderer.render(painter, QRectF(rect))
+            self.renderer.render(painter, QRectF(rect))
         else:
             super().paint(painter, rect, mode, state)
 
@@ -39,6 +143,7 @@ class IconEngine(QIconEngine):
         painter = QPainter(pixmap)
         rect = QRect(0, 0, size.width(), size.height())
         self.paint(painter, rect, mode, state)
+        painter.end()
 
         return pixmap
 
@@ -69,27 +174,42 @@ class IconBase(Enum):
     Pause = 'Pause'
     Stop = 'Stop'
 
-    def paint(self, painter: QPainter, rect: Union[QRect, QRectF], theme: Optional[Theme] = None):
-        prefix = 'Icons'
-        iconPath = f'icons/{theme if theme is not None else currentTheme()}/{self.value}.svg'
-        iconPath = Path(f':/{prefix}').joinpath(iconPath).as_posix()
-        renderer = QSvgRenderer(iconPath)
-        renderer.render(painter, QRectF(rect))
-
-    def create(self, theme: Optional[Theme] = None) -> QIcon:
+    def _path(self, theme: Optional[Theme] = None) -> str:
         prefix = 'Icons'
         iconPath = f'icons/{theme if theme is not None else currentTheme()}/{self.value}.svg'
-        file = QFile(Path(f':/{prefix}').joinpath(iconPath))
-        file.open(QFile.ReadOnly)
-        domDocument = QDomDocument()
-        domDocument.setContent(file.readAll())
-        file.close()
+        return Path(f':/{prefix}').joinpath(iconPath).as_posix()
+
+    def pixmap(self, size: QSize, devicePixelRatio: float = 1., theme: Optional[Theme] = None, mode: QIcon.Mode = QIcon.Normal) -> QPixmap:
+        theme = theme if theme is not None else currentTheme()
+        key = (self, theme, size.width(), size.height(), devicePixelRatio, mode)
+        pixmap = iconPixmapCache.get(key)
+        if pixmap is not None:
+            return pixmap
+        image = QImage(math.ceil(size.width() * devicePixelRatio), math.ceil(size.height() * devicePixelRatio), QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
+        painter.setOpacity(0.5) if mode == QIcon.Disabled else None
+        svgRendererPool.renderer(self._path(theme)).render(painter, QRectF(image.rect()))
+        painter.end()
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(devicePixelRatio)
+        iconPixmapCache.insert(key, pixmap)
+        return pixmap
 
-        engine = IconEngine()
-        engine.loadSVG(domDocument.toString())
-        icon = QIcon(engine)
+    def paint(self, painter: QPainter, rect: Union[QRect, QRectF], theme: Optional[Theme] = None, mode: QIcon.Mode = QIcon.Normal):
+        rect = QRectF(rect)
+        if rect.isEmpty():
+            return
+        device = painter.device()
+        devicePixelRatio = device.devicePixelRatioF() if device is not None else 1.
+        # Scale up when the painter is transformed so rotated/zoomed icons stay sharp
+        devicePixelRatio *= max(abs(painter.worldTransform().m11()), abs(painter.worldTransform().m22()), 1.)
+        pixmap = self.pixmap(QSize(math.ceil(rect.width()), math.ceil(rect.height())), devicePixelRatio, theme, mode)
+        painter.drawPixmap(rect, pixmap, QRectF(pixmap.rect()))
 
-        return icon
+    def create(self, theme: Optional[Theme] = None) -> QIcon:
+        return svgRendererPool.icon(self._path(theme))
 
 
 def Function_DrawIcon(
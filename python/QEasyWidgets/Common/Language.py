@@ -1,20 +1,25 @@
-import locale
+from .Config import LazyAttribute
 
 ##############################################################################################################################
 
+def _detectLanguage():
+    import locale
+    return locale.getdefaultlocale()[0]
+
+
 class Language:
     '''
     '''
     ZH = 'zh'
     EN = 'en'
 
-    Auto = locale.getdefaultlocale()[0]
+    Auto = LazyAttribute(_detectLanguage)
 
 
 class LanguageBase:
     '''
     '''
-    LANG = Language.ZH if Language.Auto in ('zh', 'zh_CN') else Language.EN
+    LANG = LazyAttribute(lambda: Language.ZH if Language.Auto in ('zh', 'zh_CN') else Language.EN)
 
     def update(self, language: str):
         if language in (Language.ZH, Language.EN):
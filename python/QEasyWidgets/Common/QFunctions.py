@@ -1,7 +1,6 @@
 import os
 from pathlib import Path
 from typing import Union, Optional, Sequence
-from PyEasyUtils import toIterable, normPath, runCMD
 from PySide6.QtCore import Qt, QSettings, QPoint, QRect, QSize, QPropertyAnimation, QParallelAnimationGroup, QEasingCurve, QUrl
 from PySide6.QtGui import QColor, QRgba64, QFont, QScreen, QDesktopServices, QAction, QCursor
 from PySide6.QtWidgets import *
@@ -255,6 +254,7 @@ def getFileDialog(
 ##############################################################################################################################
 
 def setContextMenu(parent: QWidget, contextMenu: QMenu, actions: dict):
+    from PyEasyUtils import toIterable
     for actionName, events in actions.items():
         action = QAction(actionName, parent)
         for event in toIterable(events):
@@ -276,6 +276,8 @@ def openURL(
     """
     Function to open web/local url
     """
+    from PyEasyUtils import toIterable, normPath, runCMD
+
     def OpenURL(url):
         QURL = QUrl().fromLocalFile(normPath(url))
         if QURL.isValid():
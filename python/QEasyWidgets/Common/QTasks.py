@@ -1,7 +1,5 @@
 import os
 import sys
-import psutil
-import pynvml
 from pathlib import Path
 from PySide6.QtCore import QThread, QMutex, Signal, Slot, QTimer, QEventLoop
 
@@ -56,12 +54,15 @@ class MonitorUsage(QThread):
         super().__init__()
 
         try:
+            import pynvml
             pynvml.nvmlInit()
             self.isNVIDIAGPU = True
         except:
             self.isNVIDIAGPU = False
 
     def run(self):
+        import psutil
+        import pynvml
         while self.isNVIDIAGPU:
             Usage_CPU_Percent = psutil.cpu_percent(interval = 1.)
             Usage_CPU = f"{Usage_CPU_Percent}%"
@@ -1,15 +1,134 @@
+import re
+import time
+import weakref
 from enum import Enum
 from pathlib import Path
+from collections import deque
 from typing import Union, Optional
-from PySide6.QtCore import QFile
+from PySide6.QtCore import QObject, Signal, QFile, QTimer
 from PySide6.QtWidgets import QApplication, QWidget
 
 from .Signals import componentsSignals
 from .Theme import EasyTheme, currentTheme
+from ..Resources import loadResources
 
 ##############################################################################################################################
 
-registratedWidgets = {}
+class WidgetRegistry:
+    '''
+    Registry of styled widgets indexed by stylesheet, holding weak references only
+    '''
+    def __init__(self):
+        self._widgets: dict[Enum, dict[int, weakref.ref]] = {}
+        self._members: dict[int, Enum] = {}
+
+    def add(self, widget: QWidget, member: Enum) -> None:
+        key = id(widget)
+        previous = self._members.get(key)
+        if previous is member:
+            return
+        if previous is not None:
+            ref = self._widgets[previous].pop(key)
+        else:
+            # Entries drop out when the wrapper is collected or the C++ object is destroyed
+            ref = weakref.ref(widget, lambda ref, key = key: self._discard(key, ref))
+            widget.destroyed.connect(lambda obj = None, key = key, ref = ref: self._discard(key, ref))
+        self._members[key] = member
+        self._widgets.setdefault(member, {})[key] = ref
+
+    def _discard(self, key: int, ref: weakref.ref) -> None:
+        member = self._members.get(key)
+        if member is None or self._widgets[member].get(key) is not ref:
+            return
+        del self._members[key]
+        del self._widgets[member][key]
+
+    def discard(self, widget: QWidget) -> None:
+        key = id(widget)
+        member = self._members.pop(key, None)
+        self._widgets[member].pop(key) if member is not None else None
+
+    def member(self, widget: QWidget) -> Optional[Enum]:
+        return self._members.get(id(widget))
+
+    def widgets(self, member: Enum) -> list[QWidget]:
+        return [widget for widget in (ref() for ref in list(self._widgets.get(member, {}).values())) if widget is not None]
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+
+registratedWidgets = WidgetRegistry()
+
+
+class StyleSheetStore:
+    '''
+    In-memory store of QSS, each (theme, component) sheet is read from the resources only once
+    '''
+    def __init__(self):
+        self._styleSheets: dict[tuple[str, str], str] = {}
+        self._scopes: dict[tuple[str, str], bool] = {}
+        self._mergedStyleSheets: dict[str, str] = {}
+
+    def styleSheet(self, name: str, theme: Optional[str] = None) -> str:
+        key = (theme or currentTheme(), name)
+        if key not in self._styleSheets:
+            # Sheets refer to the icons of their theme through url()
+            loadResources('QSS', key[0])
+            loadResources('Icons', key[0])
+            Prefix = 'QSS'
+            FilePath = f'qss/{key[0]}/{name}.qss'
+            File = QFile(Path(f':/{Prefix}').joinpath(FilePath))
+            File.open(QFile.ReadOnly | QFile.Text)
+            self._styleSheets[key] = str(File.readAll(), encoding = 'utf-8')
+            File.close()
+        return self._styleSheets[key]
+
+    def isScoped(self, name: str, theme: Optional[str] = None) -> bool:
+        '''
+        Whether every selector of the sheet targets a QEasyWidgets class, so that it is safe to be applied application-wide
+        '''
+        key = (theme or currentTheme(), name)
+        if key not in self._scopes:
+            QSS = re.sub(r'/\*.*?\*/', '', self.styleSheet(name, key[0]), flags = re.S)
+            selectors = [selector.strip() for block in re.findall(r'([^{}]+)\{', QSS) for selector in block.split(',')]
+            self._scopes[key] = not any(re.match(r'Q[A-Z]', selector) for selector in selectors)
+        return self._scopes[key]
+
+    def mergedStyleSheet(self, theme: Optional[str] = None) -> str:
+        '''
+        All application-wide safe sheets of the theme joined into one
+        '''
+        theme = theme or currentTheme()
+        if theme not in self._mergedStyleSheets:
+            self._mergedStyleSheets[theme] = '\n'.join(
+                self.styleSheet(Value.value, theme) for Value in StyleSheetBase if self.isScoped(Value.value, theme)
+            )
+        return self._mergedStyleSheets[theme]
+
+    def preload(self, theme: Optional[str] = None) -> None:
+        for Value in StyleSheetBase:
+            self.styleSheet(Value.value, theme)
+
+    def clear(self) -> None:
+        self._styleSheets.clear()
+        self._scopes.clear()
+        self._mergedStyleSheets.clear()
+
+
+styleSheetStore = StyleSheetStore()
+
+
+applicationStyleSheetMode = False
+
+# The application's own sheet, kept ahead of the merged one and restored when the mode is left
+userApplicationStyleSheet = ''
+installedApplicationStyleSheet = None
+
+
+def _isMerged(widget: QWidget, member: Enum) -> bool:
+    # Widgets extending setStyleSheet (hover colors, alert borders) keep a sheet of their own
+    return applicationStyleSheetMode and styleSheetStore.isScoped(member.value) and type(widget).setStyleSheet is QWidget.setStyleSheet
 
 
 class StyleSheetBase(Enum):
@@ -38,25 +157,126 @@ class StyleSheetBase(Enum):
     DockWidget = 'DockWidget'
     Menu = 'Menu'
 
-    def registrate(self, widget, value):
-        registratedWidgets[widget] = value
+    def registrate(self, widget, value = None):
+        registratedWidgets.add(widget, self)
 
     def deregistrate(self, widget):
-        registratedWidgets.pop(widget)
+        registratedWidgets.discard(widget)
 
     def apply(self, widget: QWidget, theme: Optional[str] = None, registrate: bool = True):
         EasyTheme.update(theme) if theme is not None else None
 
-        Prefix = 'QSS'
-        FilePath = f'qss/{currentTheme()}/{self.value}.qss'
-        File = QFile(Path(f':/{Prefix}').joinpath(FilePath))
-        File.open(QFile.ReadOnly | QFile.Text)
-        QSS = str(File.readAll(), encoding = 'utf-8')
-        File.close()
+        if not _isMerged(widget, self):
+            widget.setStyleSheet(styleSheetStore.styleSheet(self.value))
+
+        self.registrate(widget) if registrate else None
+
+
+def _installApplicationStyleSheet():
+    global userApplicationStyleSheet, installedApplicationStyleSheet
+
+    application = QApplication.instance()
+    # A sheet set on the application since the last install is the user's
+    if application.styleSheet() != installedApplicationStyleSheet:
+        userApplicationStyleSheet = application.styleSheet()
+    installedApplicationStyleSheet = '\n'.join(
+        styleSheet for styleSheet in (userApplicationStyleSheet, styleSheetStore.mergedStyleSheet()) if styleSheet
+    ) if applicationStyleSheetMode else userApplicationStyleSheet
+    application.setStyleSheet(installedApplicationStyleSheet)
+
+
+def setApplicationStyleSheetMode(
+    enabled: bool = True
+):
+    '''
+    Install one merged stylesheet on the application instead of one sheet per widget,
+    sheets that also target stock Qt classes and widgets extending setStyleSheet stay per-widget;
+    a sheet the application already had is kept ahead of the merged one and restored when disabled
+    '''
+    global applicationStyleSheetMode
+
+    if enabled == applicationStyleSheetMode:
+        return
+    applicationStyleSheetMode = enabled
+
+    if enabled:
+        for Value in StyleSheetBase:
+            for widget in registratedWidgets.widgets(Value):
+                QWidget.setStyleSheet(widget, '') if _isMerged(widget, Value) else None
+    _installApplicationStyleSheet()
+    Function_UpdateStyleSheet() if not enabled else None
+
+
+def isApplicationStyleSheetMode():
+    return applicationStyleSheetMode
+
+
+class StyleSheetUpdater(QObject):
+    '''
+    Re-apply stylesheets after a theme switch in time-budgeted slices, visible widgets first
+    '''
+    progressChanged = Signal(int, int)
+    finished = Signal()
+
+    def __init__(self, timeBudget: int = 8):
+        super().__init__()
+
+        self._timeBudget = timeBudget
+        self._queue = deque()
+        self._total = 0
+        self._done = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._processSlice)
+
+    def setTimeBudget(self, timeBudget: int) -> None:
+        '''
+        Set the milliseconds spent restyling per event-loop iteration
+        '''
+        self._timeBudget = max(timeBudget, 1)
+
+    def timeBudget(self) -> int:
+        return self._timeBudget
+
+    def isRunning(self) -> bool:
+        return len(self._queue) > 0
+
+    def update(self, theme: Optional[str] = None) -> None:
+        EasyTheme.update(theme) if theme is not None else None
+        _installApplicationStyleSheet() if applicationStyleSheetMode else None
+
+        visibleTasks, hiddenTasks = [], []
+        for Value in StyleSheetBase:
+            for widget in registratedWidgets.widgets(Value):
+                if _isMerged(widget, Value):
+                    continue
+                (visibleTasks if widget.isVisible() else hiddenTasks).append((weakref.ref(widget), Value))
+        self._queue = deque(visibleTasks + hiddenTasks)
+        self._total = len(self._queue)
+        self._done = 0
 
-        widget.setStyleSheet(QSS)
+        self._timer.stop()
+        self._processSlice()
 
-        self.registrate(widget, self.value) if registrate else None
+    def _processSlice(self) -> None:
+        deadline = time.perf_counter() + self._timeBudget / 1000
+        while self._queue and time.perf_counter() < deadline:
+            ref, Value = self._queue.popleft()
+            widget = ref()
+            # Skip widgets destroyed or deregistrated since the switch started
+            if widget is not None and registratedWidgets.member(widget) is Value:
+                widget.setStyleSheet(styleSheetStore.styleSheet(Value.value))
+            self._done += 1
+        self.progressChanged.emit(self._done, self._total)
+        if self._queue:
+            self._timer.start()
+        else:
+            self.finished.emit()
+
+
+styleSheetUpdater = StyleSheetUpdater()
 
 
 def Function_UpdateStyleSheet(
@@ -64,17 +284,7 @@ def Function_UpdateStyleSheet(
 ):
     '''
     '''
-    for widget, value in list(registratedWidgets.items()):
-        for Value in StyleSheetBase:
-            if Value.value != value:
-                continue
-            try:
-                Value.apply(widget, theme)
-            except RuntimeError:
-                Value.deregistrate(widget)
-            finally:
-                #QApplication.instance().processEvents()
-                continue
+    styleSheetUpdater.update(theme)
 
 
 componentsSignals.setTheme.connect(Function_UpdateStyleSheet)
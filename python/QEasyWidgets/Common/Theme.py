@@ -1,26 +1,33 @@
-import darkdetect
+import time
+import weakref
 from enum import Enum
-from typing import Union
-from PySide6.QtCore import QEvent, QObject, QPropertyAnimation, Property
+from typing import Union, Optional, Callable
+from PySide6.QtCore import QEvent, QObject, QTimer, Property
 from PySide6.QtGui import Qt, QColor, QPainter
 
+from .Config import LazyAttribute
 from .Signals import componentsSignals
 
 ##############################################################################################################################
 
+def _detectTheme():
+    import darkdetect
+    return darkdetect.theme().lower() if darkdetect.isDark() or darkdetect.isLight() else None
+
+
 class Theme:
     """
     """
     Dark = 'dark'
     Light = 'light'
 
-    Auto = darkdetect.theme().lower() if darkdetect.isDark() or darkdetect.isLight() else None
+    Auto = LazyAttribute(_detectTheme)
 
 
 class ThemeBase:
     """
     """
-    THEME = Theme.Auto if Theme.Auto is not None else Theme.Dark
+    THEME = LazyAttribute(lambda: Theme.Auto if Theme.Auto is not None else Theme.Dark)
 
     def update(self, theme: str):
         if theme in (Theme.Dark, Theme.Light):
@@ -59,6 +66,105 @@ def currentColor():
 
 ##############################################################################################################################
 
+class ColorAnimationDriver(QObject):
+    """
+    Drive every color transition from one shared timer
+    """
+    def __init__(self, interval: int = 16, duration: int = 210):
+        super().__init__()
+
+        self._enabled = True
+        self._duration = duration
+        self._transitions: dict[tuple[int, str], tuple] = {}
+        self._themedWidgets = weakref.WeakKeyDictionary()
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._tick)
+
+        componentsSignals.setTheme.connect(self._onThemeChanged)
+
+    def setAnimationsEnabled(self, enabled: bool) -> None:
+        """
+        Disable to jump straight to the final colors, e.g. for low-power or remote-desktop deployments
+        """
+        self._enabled = enabled
+        self._finishAll() if not enabled else None
+
+    def animationsEnabled(self) -> bool:
+        return self._enabled
+
+    def setDuration(self, duration: int) -> None:
+        self._duration = duration
+
+    def duration(self) -> int:
+        return self._duration
+
+    def registrate(self, widget, slot: Callable) -> None:
+        """
+        Call slot(widget) on theme switch, the widget is only weakly referenced
+        """
+        self._themedWidgets.setdefault(widget, []).append(slot)
+
+    def _onThemeChanged(self, theme: str) -> None:
+        # This slot may run before the stylesheet updater, so switch the theme here too
+        EasyTheme.update(theme)
+        for widget, slots in list(self._themedWidgets.items()):
+            try:
+                for slot in slots:
+                    slot(widget)
+            except RuntimeError:
+                self._themedWidgets.pop(widget, None)
+
+    def animate(self, target: QObject, channel: str, startColor: QColor, endColor: QColor, apply: Callable[[QObject, QColor], None], finish: Optional[Callable[[QObject, QColor], None]] = None) -> None:
+        """
+        Transition a color of target, apply(target, color) is called for every frame and finish(target, color) (defaults to apply) for the last one
+        """
+        key = (id(target), channel)
+        finish = finish or apply
+        if not self._enabled or not target.isVisible() or self._duration <= 0:
+            self._transitions.pop(key, None)
+            return finish(target, QColor(endColor))
+        self._transitions[key] = (weakref.ref(target), QColor(startColor).getRgb(), QColor(endColor), time.perf_counter(), apply, finish)
+        self._timer.start() if not self._timer.isActive() else None
+
+    def stop(self, target: QObject, channel: str) -> None:
+        self._transitions.pop((id(target), channel), None)
+
+    def isAnimating(self, target: QObject, channel: str) -> bool:
+        return (id(target), channel) in self._transitions
+
+    def _tick(self) -> None:
+        now = time.perf_counter()
+        for key, (ref, startRgb, endColor, startTime, apply, finish) in list(self._transitions.items()):
+            target = ref()
+            try:
+                progress = (now - startTime) * 1000 / self._duration
+                if target is None or progress >= 1 or not target.isVisible():
+                    del self._transitions[key]
+                    finish(target, QColor(endColor)) if target is not None else None
+                    continue
+                endRgb = endColor.getRgb()
+                apply(target, QColor(*(round(start + (end - start) * progress) for start, end in zip(startRgb, endRgb))))
+            except RuntimeError:
+                self._transitions.pop(key, None)
+        self._timer.stop() if not self._transitions else None
+
+    def _finishAll(self) -> None:
+        self._timer.stop()
+        transitions, self._transitions = self._transitions, {}
+        for ref, _, endColor, _, _, finish in transitions.values():
+            target = ref()
+            try:
+                finish(target, QColor(endColor)) if target is not None else None
+            except RuntimeError:
+                continue
+
+
+colorAnimationDriver = ColorAnimationDriver()
+
+##############################################################################################################################
+
 class BackgroundColorObject(QObject):
     """
     Background color object
@@ -93,10 +199,8 @@ class BackgroundColorAnimationBase:
 
         self.bgColorObject = BackgroundColorObject(self)
 
-        self.bgColorAnim = QPropertyAnimation(self.bgColorObject, b'backgroundColor', self)
-        self.bgColorAnim.setDuration(210)
-
-        componentsSignals.setTheme.connect(self._updateBackgroundColor)
+        # Dispatched through the widget so that overrides are called, a bound method would keep the widget alive
+        colorAnimationDriver.registrate(self, lambda widget: widget._updateBackgroundColor())
 
     def _normalBackgroundColor(self):
         return self._darkBackgroundColor if isDarkTheme() else self._lightBackgroundColor
@@ -124,9 +228,7 @@ class BackgroundColorAnimationBase:
             color = self._hoverBackgroundColor()
         else:
             color = self._normalBackgroundColor()
-        self.bgColorAnim.stop()
-        self.bgColorAnim.setEndValue(color)
-        self.bgColorAnim.start()
+        colorAnimationDriver.animate(self, 'backgroundColor', self.getBackgroundColor(), color, lambda widget, color: widget.setBackgroundColor(color))
 
     def setBackgroundColor(self, color: Union[QColor, str, int]):
         self.bgColorObject.backgroundColor = QColor(color)
@@ -140,6 +242,7 @@ class BackgroundColorAnimationBase:
 
     def eventFilter(self, obj, e):
         if obj is self and e.type() == QEvent.Type.EnabledChange:
+            colorAnimationDriver.stop(self, 'backgroundColor')
             self.setBackgroundColor(self._normalBackgroundColor() if self.isEnabled() else self._disabledBackgroundColor())
         return super().eventFilter(obj, e)
 
@@ -196,10 +299,18 @@ class TextColorObject(QObject):
         # Update the widget's palette to apply the new text color
         if hasattr(self.parent(), 'palette'):
             palette = self.parent().palette()
-            palette.setColor(palette.ColorRole.WindowText, color)
-            palette.setColor(palette.ColorRole.Text, color)
-            palette.setColor(palette.ColorRole.ButtonText, color)
-            self.parent().setPalette(palette)
+            if palette.color(palette.ColorRole.WindowText) != color or palette.color(palette.ColorRole.Text) != color or palette.color(palette.ColorRole.ButtonText) != color:
+                palette.setColor(palette.ColorRole.WindowText, color)
+                palette.setColor(palette.ColorRole.Text, color)
+                palette.setColor(palette.ColorRole.ButtonText, color)
+                self.parent().setPalette(palette)
+        self.parent().update()
+
+    def setAnimatedTextColor(self, color: QColor):
+        '''
+        Set the color of an animation frame, only widgets painting with textColor pick it up until the palette is applied at the end
+        '''
+        self._textColor = color
         self.parent().update()
 
 
@@ -212,12 +323,9 @@ class TextColorAnimationBase:
 
     def __init__(self, *args, **kwargs) -> None:
         self.textColorObject = TextColorObject(self)
-        
-        self.textColorAnim = QPropertyAnimation(self.textColorObject, b'textColor', self)
-        self.textColorAnim.setDuration(210)
-        
-        componentsSignals.setTheme.connect(self._updateTextColor)
-        
+
+        colorAnimationDriver.registrate(self, lambda widget: widget._updateTextColor())
+
         # Set initial text color
         self._updateTextColor()
 
@@ -232,7 +340,7 @@ class TextColorAnimationBase:
 
     def _disabledTextColor(self):
         # Slightly transparent version of normal color for disabled state
-        color = self._normalTextColor()
+        color = QColor(self._normalTextColor())
         color.setAlpha(128)
         return color
 
@@ -245,10 +353,11 @@ class TextColorAnimationBase:
             color = self._hoverTextColor()
         else:
             color = self._normalTextColor()
-        
-        self.textColorAnim.stop()
-        self.textColorAnim.setEndValue(color)
-        self.textColorAnim.start()
+        # Frames only repaint with the interpolated color, the palette is propagated once at the end
+        colorAnimationDriver.animate(self, 'textColor', self.getTextColor(), color, lambda widget, color: widget._setAnimatedTextColor(color), lambda widget, color: widget.setTextColor(color))
+
+    def _setAnimatedTextColor(self, color: QColor):
+        self.textColorObject.setAnimatedTextColor(color)
 
     def setTextColor(self, color: Union[QColor, str, int]):
         self.textColorObject.textColor = QColor(color)
@@ -1,9 +1,38 @@
+import importlib
+
 from .Config import Status, ChatRole
 from .Signals import componentsSignals
 from .Theme import Theme, EasyTheme, currentTheme, isDarkTheme, ThemeColor, currentColor
 from .Language import Language, EasyLanguage, currentLanguage
 from .Translator import TranslationBase, updateLanguage
-from .Icon import IconBase
-from .QFunctions import FileDialogMode #from .QFunctions import *
-#from .QWorker import *
-#from .QTasks import *
\ No newline at end of file
+
+##############################################################################################################################
+
+# Heavy modules are only imported on first access: name -> (module, attribute)
+_lazyAttributes = {
+    'IconBase': ('.Icon', 'IconBase'),
+    'FileDialogMode': ('.QFunctions', 'FileDialogMode'), #from .QFunctions import *
+    #from .QWorker import *
+    #from .QTasks import *
+}
+
+__all__ = [
+    'Status', 'ChatRole',
+    'componentsSignals',
+    'Theme', 'EasyTheme', 'currentTheme', 'isDarkTheme', 'ThemeColor', 'currentColor',
+    'Language', 'EasyLanguage', 'currentLanguage',
+    'TranslationBase', 'updateLanguage'
+] + list(_lazyAttributes)
+
+
+def __getattr__(name: str):
+    if name not in _lazyAttributes:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    moduleName, attributeName = _lazyAttributes[name]
+    value = getattr(importlib.import_module(moduleName, __name__), attributeName)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazyAttributes))
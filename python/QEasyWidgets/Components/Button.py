@@ -1,10 +1,10 @@
 import platform
 from typing import Optional, Union, overload
-from PyEasyUtils import singledispatchmethod
 from PySide6.QtGui import *
 from PySide6.QtCore import *
 from PySide6.QtWidgets import *
 
+from ..Common.Config import singledispatchmethod
 from ..Common.Icon import *
 from ..Common.StyleSheet import *
 from ..Common.QFunctions import *
@@ -24,6 +24,9 @@ class ButtonBase(QPushButton):
 
     _alignment = Qt.AlignCenter
 
+    _contentGeometry = None
+    _minimumSizeHint = None
+
     @singledispatchmethod
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -47,10 +50,15 @@ class ButtonBase(QPushButton):
 
     def setSpacing(self, spacing: int) -> None:
         self._spacing = spacing
+        self._invalidateGeometry()
 
     def spacing(self) -> int:
         return self._spacing
 
+    def setText(self, text: str) -> None:
+        super().setText(text)
+        self._invalidateGeometry()
+
     def setIcon(self, icon: Optional[Union[QIcon, QPixmap, IconBase]]) -> None:
         if icon is not None:
             super().setProperty('hasIcon', True)
@@ -58,63 +66,105 @@ class ButtonBase(QPushButton):
         else:
             super().setProperty('hasIcon', False)
             self._icon = QIcon()
+        self._invalidateGeometry()
         super().setStyle(QApplication.style())
 
     def icon(self) -> QIcon:
         return Function_ToQIcon(self._icon)
 
+    def _hasIcon(self) -> bool:
+        if self._icon is None:
+            return False
+        if isinstance(self._icon, IconBase):
+            return True
+        return not self.icon().isNull()
+
+    def setIconSize(self, size: QSize) -> None:
+        super().setIconSize(size)
+        self._invalidateGeometry()
+
     def _drawIcon(self, icon, painter, rect):
         Function_DrawIcon(icon, painter, rect)
 
     def setAlignment(self, alignment: Qt.AlignmentFlag) -> None:
         self._alignment = alignment
+        self._invalidateGeometry()
 
     def alignment(self) -> Qt.AlignmentFlag:
         return self._alignment
 
-    def minimumSizeHint(self):
-        icon_size = self.iconSize() if not self.icon().isNull() else None
-        text_width = self.fontMetrics().horizontalAdvance(self.text()) if self.text().__len__() > 0 else None
-        return QSize(
-            ((self.spacing() + icon_size.width()) if icon_size else 0) + self.spacing() + ((text_width + self.spacing()) if text_width else 0),
-            (max(icon_size.height(), self.fontMetrics().height()) if icon_size else self.fontMetrics().height()) + self.spacing() // 2
-        )
+    def _invalidateGeometry(self, sizeOnly: bool = False) -> None:
+        self._contentGeometry = None
+        self._minimumSizeHint = None if not sizeOnly else self._minimumSizeHint
 
-    def paintEvent(self, e: QPaintEvent) -> None:
-        icon_size = self.iconSize() if not self.icon().isNull() else None
+    def _updateGeometry(self):
+        """
+        Calculate the content/icon/text rects and the elided text, only called after invalidation
+        """
+        icon_size = self.iconSize() if self._hasIcon() else None
         text_width = self.fontMetrics().horizontalAdvance(self.text()) if self.text().__len__() > 0 else None
-        painter = QStylePainter(self)
-        painter.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
-        # Draw background
-        option = QStyleOptionButton()
-        self.initStyleOption(option)
-        self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
         # Calculate content rect
-        content_width = self.minimumSizeHint().width()
-        content_height = self.minimumSizeHint().height()
+        content_size = self.minimumSizeHint()
         content_rect = QRect(
-            (self.rect().center().x() - content_width // 2) if self.property("isHorizontal") == True else 0,
-            self.rect().center().y() - content_height // 2,
-            content_width,
-            content_height
+            (self.rect().center().x() - content_size.width() // 2) if self.property("isHorizontal") == True else 0,
+            self.rect().center().y() - content_size.height() // 2,
+            content_size.width(),
+            content_size.height()
         )
         content_rect.moveCenter(self.rect().center()) if self.alignment() == Qt.AlignCenter else None
-        # Draw icon
+        # Calculate icon rect
         icon_rect = QRect(
             content_rect.left() + self.spacing(),
             content_rect.top(),
             icon_size.width(),
             icon_size.height()
         ) if icon_size else None
-        self._drawIcon(self._icon, painter, icon_rect) if icon_size else None
-        # Draw text
+        # Calculate text rect
         text_rect = QRect(
             (icon_rect.right() if icon_size else content_rect.left()) + self.spacing(),
             content_rect.top(),
             text_width,
             content_rect.height()
         ) if text_width else None
-        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, self.text()) if text_width else None
+        # Elide text that runs past the button
+        text = self.text()
+        if text_rect is not None and text_rect.right() > self.rect().right():
+            text_rect.setRight(self.rect().right())
+            text = self.fontMetrics().elidedText(text, Qt.ElideRight, text_rect.width())
+        self._contentGeometry = (content_rect, icon_rect, text_rect, text)
+
+    def minimumSizeHint(self):
+        if self._minimumSizeHint is None:
+            icon_size = self.iconSize() if self._hasIcon() else None
+            text_width = self.fontMetrics().horizontalAdvance(self.text()) if self.text().__len__() > 0 else None
+            self._minimumSizeHint = QSize(
+                ((self.spacing() + icon_size.width()) if icon_size else 0) + self.spacing() + ((text_width + self.spacing()) if text_width else 0),
+                (max(icon_size.height(), self.fontMetrics().height()) if icon_size else self.fontMetrics().height()) + self.spacing() // 2
+            )
+        return QSize(self._minimumSizeHint)
+
+    def changeEvent(self, e: QEvent) -> None:
+        if e.type() in (QEvent.FontChange, QEvent.StyleChange, QEvent.LanguageChange):
+            self._invalidateGeometry()
+        super().changeEvent(e)
+
+    def resizeEvent(self, e: QResizeEvent) -> None:
+        self._invalidateGeometry(sizeOnly = True)
+        super().resizeEvent(e)
+
+    def paintEvent(self, e: QPaintEvent) -> None:
+        self._updateGeometry() if self._contentGeometry is None else None
+        _, icon_rect, text_rect, text = self._contentGeometry
+        painter = QStylePainter(self)
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
+        # Draw background
+        option = QStyleOptionButton()
+        self.initStyleOption(option)
+        self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
+        # Draw icon
+        self._drawIcon(self._icon, painter, icon_rect) if icon_rect is not None else None
+        # Draw text
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, text) if text_rect is not None else None
 
     def setStyleSheet(self, styleSheet: str) -> None:
         super().setStyleSheet(styleSheet + "ButtonBase:hover {background-color: rgba%s;}" % self._hoverBackgroundColor.getRgb().__str__())
@@ -290,5 +340,6 @@ class NavigationButton(ButtonBase):
 
     def setHorizontal(self, horizontal: bool) -> None:
         self.setProperty("isHorizontal", horizontal)
+        self._invalidateGeometry(sizeOnly = True)
 
 ##############################################################################################################################
\ No newline at end of file
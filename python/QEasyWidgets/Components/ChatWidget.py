@@ -1,26 +1,321 @@
-from typing import Optional, overload
-from PyEasyUtils import singledispatchmethod
+import math
+import sqlite3
+import warnings
+from collections import OrderedDict
+from typing import Union, Optional, overload
 from PySide6.QtGui import *
 from PySide6.QtCore import *
 from PySide6.QtWidgets import *
 
-from ..Common.Config import ChatRole
+from ..Common.Config import Status, ChatRole, singledispatchmethod
 from ..Common.StyleSheet import *
 from .Frame import FrameBase
-from .StatusWidget import StatusWidgetBase
-from .ScrollArea import VerticalScrollArea
+from .ScrollArea import ScrollDelegate
+from .Menu import MenuBase
+from .StatusWidget import LoadingStatus, loadingDotGeometry, paintLoadingDots
 
 ##############################################################################################################################
 
+class ChatMessage:
+    '''
+    One message of a chat, a notice when role is None
+    '''
+    def __init__(self, text: str, role: Optional[ChatRole] = None, status: Optional[Status] = None, id: Optional[int] = None):
+        self.text = text
+        self.role = role
+        self.status = status
+        # Key in the history store, None when not persisted
+        self.id = id
+        # (text, text width, bubble size) of the last layout
+        self.sizeCache: Optional[tuple[str, int, QSize]] = None
+        # Set while the text still grows, its markdown is then rendered incrementally
+        self.streaming = False
+        self.streamDocument: Optional[ChatStreamDocument] = None
+
+
+class ChatStreamDocument:
+    '''
+    Markdown of a growing message kept as a stack of documents: blocks finished by a blank line (outside of code fences)
+    are parsed once into a segment, only the trailing unfinished block is parsed again when the text grows
+    '''
+    def __init__(self, font: QFont):
+        self.font = font
+        self._textWidth = -1
+        self._text = ''
+        self._stableLength = 0
+        self._inFence = False
+        self._segments: list[QTextDocument] = []
+        self._tail = self._newDocument('')
+        self._segmentsHeight = 0.
+        self._segmentsIdealWidth = 0.
+        # Space between two blocks of one document, lost between two segments
+        self._blockSpacing = self._newDocument('a\n\nb').size().height() - 2 * self._newDocument('a').size().height()
+
+    def _newDocument(self, text: str) -> QTextDocument:
+        document = QTextDocument()
+        document.setDefaultFont(self.font)
+        document.setDocumentMargin(0)
+        document.setMarkdown(text)
+        document.setTextWidth(self._textWidth) if self._textWidth > 0 else None
+        return document
+
+    def _scanBlocks(self, text: str) -> tuple[int, bool]:
+        # End of the last finished block after the stable part, and whether it ends inside a code fence
+        inFence, boundary, boundaryInFence = self._inFence, self._stableLength, self._inFence
+        position = self._stableLength
+        for line in text[self._stableLength:].splitlines(keepends = True):
+            position += len(line)
+            if not line.endswith('\n'):
+                break
+            if line.lstrip().startswith(('```', '~~~')):
+                inFence = not inFence
+            elif line.strip() == '' and not inFence:
+                boundary, boundaryInFence = position, inFence
+        return boundary, boundaryInFence
+
+    def setText(self, text: str) -> None:
+        if text == self._text:
+            return
+        if not text.startswith(self._text[:self._stableLength]):
+            # Not a continuation, start over
+            self._stableLength, self._inFence = 0, False
+            self._segments.clear()
+            self._segmentsHeight = self._segmentsIdealWidth = 0.
+        self._text = text
+        boundary, self._inFence = self._scanBlocks(text)
+        if boundary > self._stableLength:
+            segment = self._newDocument(text[self._stableLength:boundary])
+            self._segments.append(segment)
+            self._segmentsHeight += segment.size().height() + self._blockSpacing
+            self._segmentsIdealWidth = max(self._segmentsIdealWidth, segment.idealWidth())
+            self._stableLength = boundary
+        self._tail = self._newDocument(text[self._stableLength:])
+
+    def setTextWidth(self, textWidth: int) -> None:
+        if textWidth == self._textWidth:
+            return
+        self._textWidth = textWidth
+        for document in self._segments:
+            document.setTextWidth(textWidth)
+        self._tail.setTextWidth(textWidth)
+        self._segmentsHeight = sum(document.size().height() + self._blockSpacing for document in self._segments)
+        self._segmentsIdealWidth = max((document.idealWidth() for document in self._segments), default = 0.)
+
+    def idealWidth(self) -> float:
+        return max(self._segmentsIdealWidth, self._tail.idealWidth())
+
+    def size(self) -> QSizeF:
+        return QSizeF(self._textWidth, self._segmentsHeight + self._tail.size().height())
+
+    def draw(self, painter: QPainter, context: QAbstractTextDocumentLayout.PaintContext, visibleRect: Optional[QRectF] = None) -> None:
+        '''
+        Paint the segments intersecting visibleRect (in document coordinates), all of them if it is None
+        '''
+        painter.save()
+        top = 0.
+        for document in self._segments + [self._tail]:
+            height = document.size().height()
+            if visibleRect is None or (top < visibleRect.bottom() and top + height > visibleRect.top()):
+                document.documentLayout().draw(painter, context)
+            painter.translate(0, height + self._blockSpacing)
+            top += height + self._blockSpacing
+        painter.restore()
+
+
+class ChatMessageModel(QAbstractListModel):
+    '''
+    Flat list of chat messages and notices
+    '''
+    MessageRole = Qt.UserRole + 1
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+
+        self._messages: list[ChatMessage] = []
+        self._loadingMessages: set[ChatMessage] = set()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._messages)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == self.MessageRole:
+            return self._messages[index.row()]
+        if role == Qt.DisplayRole:
+            return self._messages[index.row()].text
+        return None
+
+    def message(self, row: int) -> ChatMessage:
+        return self._messages[row]
+
+    def appendMessage(self, text: str, role: Optional[ChatRole] = None, status: Optional[Status] = None) -> int:
+        row = len(self._messages)
+        self.insertMessages(row, [ChatMessage(text, role, status)])
+        return row
+
+    def insertMessages(self, row: int, messages: list[ChatMessage]) -> None:
+        '''
+        Insert a block of messages with one rowsInserted notification
+        '''
+        if len(messages) == 0:
+            return
+        self.beginInsertRows(QModelIndex(), row, row + len(messages) - 1)
+        self._messages[row:row] = messages
+        self._loadingMessages.update(message for message in messages if message.status == Status.Loading)
+        self.endInsertRows()
+
+    def removeMessages(self, row: int, count: int) -> None:
+        if count <= 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        self._loadingMessages.difference_update(self._messages[row:row + count])
+        del self._messages[row:row + count]
+        self.endRemoveRows()
+
+    def setMessageText(self, row: int, text: str) -> None:
+        self._messages[row].text = text
+        self.dataChanged.emit(self.index(row), self.index(row), [Qt.DisplayRole])
+
+    def setMessageStatus(self, row: int, status: Optional[Status]) -> None:
+        message = self._messages[row]
+        if message.status == status:
+            return
+        message.status = status
+        self._loadingMessages.add(message) if status == Status.Loading else self._loadingMessages.discard(message)
+        self.dataChanged.emit(self.index(row), self.index(row), [])
+
+    def setMessageStreaming(self, row: int, streaming: bool) -> None:
+        '''
+        Render the message incrementally while its text grows, or as one document again once it is complete
+        '''
+        message = self._messages[row]
+        if message.streaming == streaming:
+            return
+        message.streaming = streaming
+        message.streamDocument = None
+        message.sizeCache = None
+        self.dataChanged.emit(self.index(row), self.index(row), [])
+
+    def hasLoadingMessages(self) -> bool:
+        return len(self._loadingMessages) > 0
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._messages.clear()
+        self._loadingMessages.clear()
+        self.endResetModel()
+
+
+class ChatHistoryStore:
+    '''
+    Append-only SQLite log of chat messages, read back in pages by message id
+    '''
+    def __init__(self, path: str = ':memory:'):
+        self.path = path
+        self._connection = sqlite3.connect(path, isolation_level = None)
+        self._connection.execute('PRAGMA journal_mode = WAL') if path != ':memory:' else None
+        self._connection.execute('PRAGMA synchronous = NORMAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS messages (id INTEGER PRIMARY KEY AUTOINCREMENT, role INTEGER, text TEXT NOT NULL)')
+
+    def append(self, text: str, role: Optional[ChatRole] = None) -> int:
+        return self._connection.execute('INSERT INTO messages (role, text) VALUES (?, ?)', (role.value if role is not None else None, text)).lastrowid
+
+    def appendMessages(self, messages: list[ChatMessage]) -> None:
+        '''
+        Log messages in one transaction, setting their ids
+        '''
+        self._connection.execute('BEGIN')
+        for message in messages:
+            message.id = self.append(message.text, message.role)
+        self._connection.execute('COMMIT')
+
+    def setText(self, id: int, text: str) -> None:
+        '''
+        Store the final text of a message that was streamed
+        '''
+        self._connection.execute('UPDATE messages SET text = ? WHERE id = ?', (text, id))
+
+    def _messages(self, rows) -> list[ChatMessage]:
+        return [ChatMessage(text, ChatRole(role) if role is not None else None, None, id) for id, role, text in rows]
+
+    def before(self, id: Optional[int], limit: int, floor: int = 0) -> list[ChatMessage]:
+        '''
+        Return at most limit messages older than id (the newest ones if id is None) and newer than floor, oldest first
+        '''
+        rows = self._connection.execute(
+            'SELECT id, role, text FROM messages WHERE id < ? AND id > ? ORDER BY id DESC LIMIT ?', (id if id is not None else 2 ** 63 - 1, floor, limit)
+        ).fetchall()
+        return self._messages(reversed(rows))
+
+    def after(self, id: int, limit: int) -> list[ChatMessage]:
+        '''
+        Return at most limit messages newer than id, oldest first
+        '''
+        return self._messages(self._connection.execute('SELECT id, role, text FROM messages WHERE id > ? ORDER BY id LIMIT ?', (id, limit)).fetchall())
+
+    def lastId(self) -> int:
+        return self._connection.execute('SELECT COALESCE(MAX(id), 0) FROM messages').fetchone()[0]
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class AvatarStore(QObject):
+    '''
+    One avatar per role shared by every bubble, decoded once and kept pre-scaled for each device pixel ratio in use
+    '''
+    avatarChanged = Signal(ChatRole)
+
+    def __init__(self, size: QSize = QSize(45, 45), parent: Optional[QObject] = None):
+        super().__init__(parent)
+
+        self._size = size
+        self._sources: dict[ChatRole, QPixmap] = {}
+        self._pixmaps: dict[tuple[ChatRole, float], QPixmap] = {}
+
+    def setAvatar(self, avatar: Union[str, QPixmap], role: ChatRole) -> None:
+        if isinstance(avatar, str):
+            # Files are decoded once per process, whichever chat shows them
+            pixmap = QPixmapCache.find(avatar)
+            if pixmap is None:
+                pixmap = QPixmap(avatar)
+                QPixmapCache.insert(avatar, pixmap)
+            avatar = pixmap
+        self._sources[role] = avatar
+        for key in [key for key in self._pixmaps if key[0] == role]:
+            del self._pixmaps[key]
+        self.avatarChanged.emit(role)
+
+    def pixmap(self, role: ChatRole, devicePixelRatio: float = 1.) -> Optional[QPixmap]:
+        pixmap = self._pixmaps.get((role, devicePixelRatio))
+        if pixmap is not None:
+            return pixmap
+        source = self._sources.get(role)
+        if source is None or source.isNull():
+            return None
+        pixmap = source.scaled(self._size * devicePixelRatio, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        pixmap.setDevicePixelRatio(devicePixelRatio)
+        self._pixmaps[(role, devicePixelRatio)] = pixmap
+        return pixmap
+
+    def size(self) -> QSize:
+        return self._size
+
+
 class AvatarDisplay(QLabel):
-    """
-    """
+    '''
+    Avatar of a role as emitted by ChatWidgetBase.onAvatarClicked, setting it sets the avatar of every bubble of the role
+    '''
     clicked = Signal()
 
     @singledispatchmethod
-    def __init__(self, parent: Optional[QWidget] = None):
+    def __init__(self, parent: Optional[QWidget] = None, role: Optional[ChatRole] = None, avatarStore: Optional[AvatarStore] = None):
         super().__init__(parent)
 
+        self.role = role
+        self.avatarStore = avatarStore
+
     @__init__.register
     def _(self, size: QSize, avatar: Union[str, QPixmap], parent: Optional[QWidget] = None):
         self.__init__(parent)
@@ -32,99 +327,252 @@ class AvatarDisplay(QLabel):
         self.clicked.emit()
 
     def setAvatar(self, avatar: Union[str, QPixmap], size: QSize = QSize(45, 45)):
-        if isinstance(avatar, str):
-            self.setPixmap(QPixmap(avatar).scaled(size))
-        elif isinstance(avatar, QPixmap):
-            self.setPixmap(avatar.scaled(size))
-
-
-class MessageDisplay(QLabel):
-    """
-    """
-    def __init__(self, text: str, role: ChatRole, parent: Optional[QWidget] = None):
+        pixmap = QPixmap(avatar) if isinstance(avatar, str) else avatar
+        self.setPixmap(pixmap.scaled(size))
+        self.avatarStore.setAvatar(avatar, self.role) if self.avatarStore is not None and self.role is not None else None
+
+
+class ChatMessageDelegate(QStyledItemDelegate):
+    '''
+    Lays out and paints message bubbles (avatar, triangle, markdown text and status) and notices,
+    markdown documents are only built for the rows being measured or painted
+    '''
+    avatarSize = QSize(45, 45)
+    statusSize = QSize(24, 24)
+    _margin = 12
+    _spacing = 12
+    _padding = 12
+    _triangleWidth = 6
+
+    def __init__(self, parent: Optional[QObject] = None):
         super().__init__(parent)
 
-        self.role = role
-
-        self.setFont(QFont('微软雅黑', 12))
-        self.setWordWrap(True)
-        self.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
-        self.setTextInteractionFlags(Qt.TextSelectableByMouse)
-
-        self.setMarkdown(text)
-
-    def paintEvent(self, arg__1: QPaintEvent):
-        painter = QPainter(self)
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor('#b2e281') if self.role == ChatRole.User else QColor('white'))
-        painter.drawRoundedRect(self.rect(), 6, 6)
+        self.font = QFont('微软雅黑', 12)
+        self.avatarStore = AvatarStore(self.avatarSize, self)
+        self._documents: OrderedDict[tuple[str, int, bool], QTextDocument] = OrderedDict()
+        self._maxDocuments = 64
+        self._loadingDots: Optional[tuple[int, list, list]] = None
+
+    def _document(self, text: str, textWidth: int, isNotice: bool = False) -> QTextDocument:
+        key = (text, textWidth, isNotice)
+        document = self._documents.get(key)
+        if document is not None:
+            self._documents.move_to_end(key)
+            return document
+        document = QTextDocument()
+        document.setDefaultFont(self.font)
+        document.setDocumentMargin(0)
+        if isNotice:
+            document.setPlainText(text)
+            document.setDefaultTextOption(QTextOption(Qt.AlignCenter))
+        else:
+            document.setMarkdown(text)
+        document.setTextWidth(textWidth)
+        self._documents[key] = document
+        while len(self._documents) > self._maxDocuments:
+            self._documents.popitem(last = False)
+        return document
+
+    def _messageDocument(self, message: ChatMessage, textWidth: int) -> Union[QTextDocument, ChatStreamDocument]:
+        if not message.streaming or message.role is None:
+            return self._document(message.text, textWidth, message.role is None)
+        if message.streamDocument is None:
+            message.streamDocument = ChatStreamDocument(self.font)
+        message.streamDocument.setTextWidth(textWidth)
+        message.streamDocument.setText(message.text)
+        return message.streamDocument
+
+    def _drawDocument(self, painter: QPainter, document: Union[QTextDocument, ChatStreamDocument], context: QAbstractTextDocumentLayout.PaintContext, visibleRect: QRectF) -> None:
+        # Only the part of the document inside visibleRect (in document coordinates) is painted
+        context.clip = visibleRect
+        document.draw(painter, context, visibleRect) if isinstance(document, ChatStreamDocument) else document.documentLayout().draw(painter, context)
+
+    def clearCache(self) -> None:
+        self._documents.clear()
+
+    def _textWidth(self, message: ChatMessage, width: int) -> int:
+        # Room left for the text once margins, avatar, triangle, status and the spacer on the other side are taken
+        if message.role is None:
+            return max(width - 2 * self._margin, 1)
+        reserved = 2 * (self.avatarSize.width() + self._triangleWidth) + (self.statusSize.width() if message.status is not None else 0)
+        return max(width - 2 * self._margin - reserved - 2 * self._padding, 1)
+
+    def bubbleSize(self, message: ChatMessage, width: int) -> QSize:
         '''
-        painter.setPen(QColor('#000000'))
-        painter.drawText(self.rect(), self.alignment() | Qt.TextWordWrap, self.text())
+        Size of the bubble (the text block of a notice) in a row of the given width
         '''
-        super().paintEvent(arg__1)
-
-    def setMarkdown(self, text: str):
-        self.setTextFormat(Qt.MarkdownText)
-        self.setText(text)
-
+        textWidth = self._textWidth(message, width)
+        if message.sizeCache is not None and message.sizeCache[0] is message.text and message.sizeCache[1] == textWidth:
+            return message.sizeCache[2]
+        document = self._messageDocument(message, textWidth)
+        if message.role is None:
+            size = QSize(textWidth, math.ceil(document.size().height()))
+        else:
+            size = QSize(min(math.ceil(document.idealWidth()), textWidth) + 2 * self._padding, math.ceil(document.size().height()) + 2 * self._padding)
+        message.sizeCache = (message.text, textWidth, size)
+        return size
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        message = index.data(ChatMessageModel.MessageRole)
+        width = option.rect.width() if option.rect.width() > 0 else option.widget.viewport().width() if option.widget is not None else 400
+        bubble = self.bubbleSize(message, width)
+        height = bubble.height() if message.role is None else max(bubble.height(), self.avatarSize.height())
+        return QSize(width, height + self._spacing)
+
+    def _layout(self, message: ChatMessage, rect: QRect) -> tuple[QRect, QRect, QRect, Optional[QRect]]:
+        # Avatar, triangle, bubble and status rects of a message drawn in rect
+        bubble = self.bubbleSize(message, rect.width())
+        inner = rect.adjusted(self._margin, self._spacing // 2, -self._margin, -self._spacing // 2)
+        if message.role == ChatRole.User:
+            avatarRect = QRect(inner.right() - self.avatarSize.width() + 1, inner.top(), self.avatarSize.width(), self.avatarSize.height())
+            triangleRect = QRect(avatarRect.left() - self._triangleWidth, inner.top(), self._triangleWidth, self.avatarSize.height())
+            bubbleRect = QRect(triangleRect.left() - bubble.width(), inner.top(), bubble.width(), bubble.height())
+            statusRect = QRect(bubbleRect.left() - self.statusSize.width(), inner.top(), self.statusSize.width(), self.statusSize.height())
+        else:
+            avatarRect = QRect(inner.left(), inner.top(), self.avatarSize.width(), self.avatarSize.height())
+            triangleRect = QRect(avatarRect.right() + 1, inner.top(), self._triangleWidth, self.avatarSize.height())
+            bubbleRect = QRect(triangleRect.right() + 1, inner.top(), bubble.width(), bubble.height())
+            statusRect = QRect(bubbleRect.right() + 1, inner.top(), self.statusSize.width(), self.statusSize.height())
+        return avatarRect, triangleRect, bubbleRect, statusRect if message.status is not None else None
+
+    def avatarRect(self, index: QModelIndex, rect: QRect) -> Optional[QRect]:
+        message = index.data(ChatMessageModel.MessageRole)
+        return self._layout(message, rect)[0] if message is not None and message.role is not None else None
+
+    def _paintLoading(self, painter: QPainter, rect: QRect) -> None:
+        # The dots of LoadingStatus, their geometry computed once per size
+        side = min(rect.width(), rect.height())
+        if self._loadingDots is None or self._loadingDots[0] != side:
+            self._loadingDots = (side, *loadingDotGeometry(side, LoadingStatus.defaultDotCount))
+        painter.setPen(LoadingStatus.defaultDotColor)
+        painter.setBrush(LoadingStatus.defaultDotColor)
+        paintLoadingDots(painter, self._loadingDots[1], self._loadingDots[2], LoadingStatus.defaultInterval, QPointF(rect.topLeft()))
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        message = index.data(ChatMessageModel.MessageRole)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        context = QAbstractTextDocumentLayout.PaintContext()
+        if message.role is None:
+            inner = option.rect.adjusted(self._margin, self._spacing // 2, -self._margin, -self._spacing // 2)
+            document = self._document(message.text, self._textWidth(message, option.rect.width()), True)
+            context.palette.setColor(QPalette.Text, option.palette.color(QPalette.Text))
+            painter.translate(inner.topLeft())
+            document.documentLayout().draw(painter, context)
+            painter.restore()
+            return
+        avatarRect, triangleRect, bubbleRect, statusRect = self._layout(message, option.rect)
+        device = painter.device()
+        avatar = self.avatarStore.pixmap(message.role, device.devicePixelRatioF() if device is not None else 1.)
+        painter.drawPixmap(avatarRect.topLeft(), avatar) if avatar is not None else None
+        color = QColor('#b2e281') if message.role == ChatRole.User else QColor('white')
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(color)
+        points = [QPoint(0, 20), QPoint(0, 34), QPoint(6, 27)] if message.role == ChatRole.User else [QPoint(0, 27), QPoint(6, 20), QPoint(6, 34)]
+        painter.drawPolygon(QPolygon([point + triangleRect.topLeft() for point in points]))
+        painter.drawRoundedRect(bubbleRect, 6, 6)
+        self._paintLoading(painter, statusRect) if statusRect is not None and message.status == Status.Loading else None
+        # Bubbles are always light, their text stays dark whatever the theme
+        document = self._messageDocument(message, self._textWidth(message, option.rect.width()))
+        context.palette.setColor(QPalette.Text, QColor('black'))
+        origin = bubbleRect.topLeft() + QPoint(self._padding, self._padding)
+        visibleRect = QRectF(option.widget.viewport().rect() if isinstance(option.widget, QAbstractScrollArea) else option.rect).translated(-QPointF(origin))
+        painter.translate(origin)
+        self._drawDocument(painter, document, context, visibleRect)
+        painter.restore()
+
+
+class ChatMessageView(QListView):
+    '''
+    List view showing a ChatMessageModel through a ChatMessageDelegate, rows are laid out in batches and only visible ones painted
+    '''
+    avatarDoubleClicked = Signal(QModelIndex)
 
-class Triangle(QWidget):
-    """
-    """
-    def __init__(self, role: ChatRole, parent: Optional[QWidget] = None):
+    def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
-        self.role = role
-
-        self.setFixedSize(QSize(6, 45))
-
-    def paintEvent(self, arg__1: QPaintEvent):
-        painter = QPainter(self)
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor('#b2e281') if self.role == ChatRole.User else QColor('white'))
-        painter.drawPolygon(QPolygon([QPoint(0, 20), QPoint(0, 34), QPoint(6, 27)] if self.role == ChatRole.User else [QPoint(0, 27), QPoint(6, 20), QPoint(6, 34)]))
-
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setResizeMode(QListView.Adjust)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+        self.setFrameShape(QFrame.NoFrame)
 
-class MessageLayout(QHBoxLayout):
-    """
-    """
-    def __init__(self, message, role, status, parent = None):
-        super().__init__(parent)
+    def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
+        position = event.position().toPoint()
+        index = self.indexAt(position)
+        avatarRect = self.itemDelegate().avatarRect(index, self.visualRect(index)) if index.isValid() else None
+        self.avatarDoubleClicked.emit(index) if avatarRect is not None and avatarRect.contains(position) else None
+        super().mouseDoubleClickEvent(event)
 
-        self.setSpacing(0)
-        self.setContentsMargins(0, 0, 0, 0)
-
-        self.avatarDisplay = AvatarDisplay(None)
-        self.messageDisplay = MessageDisplay(message, role)
-        self.triangle = Triangle(role)
-        self.status = StatusWidgetBase(status)
-        self.spacer = QSpacerItem(self.avatarDisplay.sizeHint().width()+self.triangle.sizeHint().width(), 0, QSizePolicy.MinimumExpanding, QSizePolicy.Minimum)
-
-        if role == ChatRole.User:
-            self.addSpacerItem(self.spacer)
-            self.addWidget(self.status, 0, Qt.AlignTop) if status is not None else None
-            self.addWidget(self.messageDisplay)
-            self.addWidget(self.triangle, 0, Qt.AlignTop)
-            self.addWidget(self.avatarDisplay, 0, Qt.AlignTop)
+    def copyMessage(self, index: QModelIndex) -> None:
+        '''
+        Copy the text of a message to the clipboard, as shown and (for bubbles) as its markdown source
+        '''
+        message = index.data(ChatMessageModel.MessageRole) if index.isValid() else None
+        if message is None:
+            return
+        mimeData = QMimeData()
+        if message.role is not None:
+            document = QTextDocument()
+            document.setMarkdown(message.text)
+            mimeData.setText(document.toPlainText())
+            mimeData.setData('text/markdown', message.text.encode('utf-8'))
         else:
-            self.addWidget(self.avatarDisplay, 0, Qt.AlignTop)
-            self.addWidget(self.triangle, 0, Qt.AlignTop)
-            self.addWidget(self.messageDisplay)
-            self.addWidget(self.status, 0, Qt.AlignTop) if status is not None else None
-            self.addSpacerItem(self.spacer)
+            mimeData.setText(message.text)
+        QApplication.clipboard().setMimeData(mimeData)
 
+    def keyPressEvent(self, event: QKeyEvent) -> None:
+        if event.matches(QKeySequence.Copy) and self.currentIndex().isValid():
+            self.copyMessage(self.currentIndex())
+            return
+        super().keyPressEvent(event)
 
-class NoticeDisplay(QLabel):
-    """
-    """
-    def __init__(self, text: str, parent = None):
-        super().__init__(text, parent)
+    def contextMenuEvent(self, event: QContextMenuEvent) -> None:
+        index = self.indexAt(event.pos())
+        if not index.isValid():
+            return
+        self.setCurrentIndex(index)
+        menu = MenuBase(self)
+        menu.addAction(QAction('Copy', menu, triggered = lambda: self.copyMessage(index)))
+        menu.exec(event.globalPos())
+
+    def dataChanged(self, topLeft: QModelIndex, bottomRight: QModelIndex, roles: list[int] = []) -> None:
+        super().dataChanged(topLeft, bottomRight, roles)
+        # Rows are only laid out again when an edited message changes size
+        width = self.viewport().width()
+        for row in range(topLeft.row(), bottomRight.row() + 1):
+            message = self.model().index(row, 0).data(ChatMessageModel.MessageRole)
+            previousSize = message.sizeCache[2] if message.sizeCache is not None else None
+            if self.itemDelegate().bubbleSize(message, width) != previousSize:
+                self.scheduleDelayedItemsLayout()
+                break
+
+    def anchor(self) -> tuple[QPersistentModelIndex, int]:
+        '''
+        The first visible row and its offset from the top of the viewport
+        '''
+        index = self.indexAt(QPoint(0, 0))
+        return QPersistentModelIndex(index), self.visualRect(index).top() if index.isValid() else 0
 
-        self.setFont(QFont('微软雅黑', 12))
-        self.setWordWrap(True)
-        self.setAlignment(Qt.AlignCenter)
-        self.setTextInteractionFlags(Qt.TextSelectableByMouse)
+    def restoreAnchor(self, anchor: tuple[QPersistentModelIndex, int]) -> None:
+        '''
+        Scroll so that the anchored row is back at its offset, after rows were inserted or removed above it
+        '''
+        index, offset = anchor
+        if not index.isValid():
+            return
+        self.executeDelayedItemsLayout()
+        scrollBar = self.verticalScrollBar()
+        scrollBar.setValue(scrollBar.value() + self.visualRect(QModelIndex(index)).top() - offset)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        # Bubbles wrap to the viewport width, a width change relays every row out again
+        if event.size().width() != event.oldSize().width():
+            self.scheduleDelayedItemsLayout()
+        super().resizeEvent(event)
 
 ##############################################################################################################################
 
@@ -133,79 +581,414 @@ class ChatWidgetBase(FrameBase):
     Base class for chatWidget components
     """
     onAvatarClicked = Signal(AvatarDisplay)
+    avatarClicked = Signal(ChatRole)
 
     def __init__(self, parent = None):
         super().__init__(parent)
 
-        self.avatarDisplays = {}
-
-        self.scrollArea = VerticalScrollArea()
-        self.scrollAreaContent = QWidget()
-        self.scrollArea.setWidget(self.scrollAreaContent)
-        self.scrollAreaContentLayout = QVBoxLayout(self.scrollAreaContent)
-        self.scrollAreaContentLayout.setSpacing(12)
-        self.scrollAreaContentLayout.setContentsMargins(12, 12, 12, 12)
-        self.scrollAreaContentSpacer = QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
-        self.scrollAreaContentLayout.addSpacerItem(self.scrollAreaContentSpacer)
+        self.messageModel = ChatMessageModel(self)
+        self.messageDelegate = ChatMessageDelegate(self)
+
+        self.messageView = ChatMessageView(self)
+        self.messageView.setModel(self.messageModel)
+        self.messageView.setItemDelegate(self.messageDelegate)
+        self.messageDelegate.avatarStore.avatarChanged.connect(self._updateAvatarRows)
+        self.messageView.avatarDoubleClicked.connect(self._onAvatarDoubleClicked)
+        self._avatarDisplays: dict[ChatRole, AvatarDisplay] = {}
+        self.scrollDelegate = ScrollDelegate(self.messageView)
+
+        # Repaints the visible loading indicators
+        self.statusTimer = QTimer(self)
+        self.statusTimer.setInterval(LoadingStatus.defaultInterval)
+        self.statusTimer.timeout.connect(self._updateLoadingRows)
+
+        # Streamed text is applied at most once per frame
+        self._pendingStream: Optional[tuple[str, Optional[Status]]] = None
+        self.streamTimer = QTimer(self)
+        self.streamTimer.setSingleShot(True)
+        self.streamTimer.timeout.connect(self.flushStream)
+
+        # The view sticks to the bottom until the user scrolls away, appends are followed with one scroll per frame
+        self.isFollowingBottom = True
+        self.scrollTimer = QTimer(self)
+        self.scrollTimer.setSingleShot(True)
+        self.scrollTimer.timeout.connect(self._followBottom)
+        self.messageView.verticalScrollBar().rangeChanged.connect(lambda minimum, maximum: self._scheduleScroll() if self.isFollowingBottom else None)
+
+        self.role = None
+
+        # Bounded history, older messages are paged in from the store when scrolling to the top
+        self.historyStore: Optional[ChatHistoryStore] = None
+        self._ownsHistoryStore = False
+        self.maximumMessageCount = 0
+        self.historyPageSize = 50
+        self._historyFloor = 0
+        # Newest message while the rows below the viewport are unloaded, new messages are then only logged until they are paged back in
+        self._tailMessage: Optional[ChatMessage] = None
+        self.messageView.verticalScrollBar().valueChanged.connect(self._onScrolled)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(0)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.scrollArea)
+        layout.addWidget(self.messageView)
 
         StyleSheetBase.ChatWidget.apply(self)
 
-    def update(self) -> None:
-        self.scrollArea.verticalScrollBar().setValue(self.scrollArea.verticalScrollBar().maximum())
-        super().update()
-
-    def _removeallwidgets(self, layout: QLayout, selfIgnored: bool = True):
-        for i in range(min(10, layout.count())): # 每次最多处理10个项目
-            item = layout.takeAt(0)
-            if item is None:
-                return
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-                widget.hide()
-            sublayout = item.layout()
-            if sublayout is not None:
-                self._removeallwidgets(sublayout, selfIgnored = False)
-        if layout.count() > 0:
-            QTimer.singleShot(0, lambda: self._removeallwidgets(layout, selfIgnored))
-        else:
-            layout.deleteLater() if not selfIgnored else None
+    def _frameInterval(self) -> int:
+        screen = self.screen()
+        return max(int(1000 / screen.refreshRate()), 1) if screen is not None and screen.refreshRate() > 0 else 16
+
+    def _scheduleScroll(self) -> None:
+        self.scrollTimer.start(self._frameInterval()) if not self.scrollTimer.isActive() else None
+
+    def _followBottom(self) -> None:
+        # Runs once the layout has settled (the range is already up to date), the scroll animation is cut short instead of fought
+        if self.isFollowingBottom:
+            self.scrollDelegate.vScrollBar.setValueImmediately(self.messageView.verticalScrollBar().maximum())
+
+    def scrollToBottom(self) -> None:
+        '''
+        Scroll to the last message on the next frame and keep following new ones
+        '''
+        self._loadNewestMessages() if self._tailMessage is not None else None
+        self.isFollowingBottom = True
+        self._scheduleScroll()
+
+    def _updateLoadingRows(self) -> None:
+        if not self.messageModel.hasLoadingMessages():
+            self.statusTimer.stop()
+            return
+        viewport = self.messageView.viewport()
+        for row in self._visibleRows():
+            viewport.update(self.messageView.visualRect(self.messageModel.index(row))) if self.messageModel.message(row).status == Status.Loading else None
+
+    def _syncStatusTimer(self) -> None:
+        self.statusTimer.start() if self.messageModel.hasLoadingMessages() and not self.statusTimer.isActive() else None
+
+    def _isHistoryStore(self, store: Union[str, ChatHistoryStore, None]) -> bool:
+        if isinstance(store, ChatHistoryStore):
+            return store is self.historyStore
+        return self.historyStore.path == (store if store is not None else ':memory:')
+
+    def setHistoryMode(self, enabled: bool = True, store: Union[str, ChatHistoryStore, None] = None, maximumMessageCount: int = 500, pageSize: int = 50) -> None:
+        '''
+        Log every message to a ChatHistoryStore (a SQLite file path, in memory if None) and keep at most maximumMessageCount of them loaded
+        while the view follows the bottom; pageSize older messages are read back each time the view is scrolled to the top.
+        Messages already shown are logged first, a store opened from a path is closed when the mode is disabled;
+        enabling again with the same store or path only changes the limits
+        '''
+        self._finishStream()
+        self._loadNewestMessages() if self._tailMessage is not None and (not enabled or not self._isHistoryStore(store)) else None
+        if self.historyStore is not None and (not enabled or not self._isHistoryStore(store)):
+            # The loaded rows no longer refer to the previous store, which is closed if it was opened here
+            self.historyStore.close() if self._ownsHistoryStore else None
+            for row in range(self.messageModel.rowCount()):
+                self.messageModel.message(row).id = None
+            self.historyStore = None
+        if not enabled:
+            self.maximumMessageCount = 0
+            self.messageView.setLayoutMode(QListView.Batched)
+            return
+        self.maximumMessageCount = maximumMessageCount
+        self.historyPageSize = pageSize
+        if self.historyStore is not None:
+            self._trimHistory()
+            return
+        self._ownsHistoryStore = not isinstance(store, ChatHistoryStore)
+        self.historyStore = store if isinstance(store, ChatHistoryStore) else ChatHistoryStore(store if store is not None else ':memory:')
+        self._historyFloor = 0
+        # Rows shown before the mode was enabled are logged first, so that trimming them does not lose them
+        self.historyStore.appendMessages([self.messageModel.message(row) for row in range(self.messageModel.rowCount())])
+        # The loaded rows are bounded, they can be laid out in one pass, which anchoring after paging relies on
+        self.messageView.setLayoutMode(QListView.SinglePass)
+        if self.messageModel.rowCount() == 0:
+            messages = self.historyStore.before(None, pageSize)
+            self.messageModel.insertMessages(0, messages)
+            self.role = messages[-1].role if len(messages) > 0 else None
+            self.scrollToBottom()
+
+    def _storeMessage(self, row: int) -> None:
+        if self.historyStore is None:
+            return
+        message = self.messageModel.message(row)
+        message.id = self.historyStore.append(message.text, message.role)
+
+    def _trimHead(self, count: int) -> None:
+        # Only rows above the viewport are dropped, the visible rows stay in place
+        count = min(count, self._visibleRows().start)
+        if count <= 0:
+            return
+        anchor = self.messageView.anchor()
+        self.messageModel.removeMessages(0, count)
+        self.messageView.restoreAnchor(anchor)
+
+    def _trimTail(self, count: int) -> int:
+        # Only rows below the viewport are dropped, the newest one is kept aside until they are paged back in
+        visibleRows = self._visibleRows()
+        rowCount = self.messageModel.rowCount()
+        count = min(count, rowCount - visibleRows.stop) if len(visibleRows) > 0 else 0
+        if count <= 0:
+            return 0
+        self.flushStream()
+        self._tailMessage = self.messageModel.message(rowCount - 1) if self._tailMessage is None else self._tailMessage
+        self.messageModel.removeMessages(rowCount - count, count)
+        return count
+
+    def _trimHistory(self) -> None:
+        if self.historyStore is None or self.maximumMessageCount <= 0:
+            return
+        rowCount = self.messageModel.rowCount()
+        excess = rowCount - self.maximumMessageCount
+        if excess <= 0:
+            return
+        if self.isFollowingBottom:
+            self.messageModel.removeMessages(0, excess)
+            return
+        # The reader has scrolled away, rows below the viewport are dropped first (paged back in when the view returns to the bottom), then rows above it
+        self._trimHead(excess - self._trimTail(excess))
+
+    def _onScrolled(self, value: int) -> None:
+        scrollBar = self.messageView.verticalScrollBar()
+        self.isFollowingBottom = value >= scrollBar.maximum() and self._tailMessage is None
+        if self.historyStore is None:
+            return
+        if value <= scrollBar.minimum() and scrollBar.maximum() > scrollBar.minimum():
+            QTimer.singleShot(0, self.loadOlderMessages)
+        elif value >= scrollBar.maximum():
+            QTimer.singleShot(0, self.loadNewerMessages if self._tailMessage is not None else self._trimHistory)
+
+    def loadOlderMessages(self) -> int:
+        '''
+        Page the messages preceding the first loaded one in from the history store, keeping the visible rows in place
+        '''
+        if self.historyStore is None or self.messageModel.rowCount() == 0 or self.messageModel.message(0).id is None:
+            return 0
+        messages = self.historyStore.before(self.messageModel.message(0).id, self.historyPageSize, self._historyFloor)
+        if len(messages) > 0:
+            anchor = self.messageView.anchor()
+            self.messageModel.insertMessages(0, messages)
+            self.messageView.restoreAnchor(anchor)
+            self._trimTail(self.messageModel.rowCount() - self.maximumMessageCount) if self.maximumMessageCount > 0 else None
+        return len(messages)
+
+    def _pageMessages(self, messages: list[ChatMessage]) -> list[ChatMessage]:
+        # The newest message is read back as the object kept while it was unloaded, with its status and streaming state
+        if self._tailMessage is None:
+            return messages
+        messages = [self._tailMessage if message.id == self._tailMessage.id else message for message in messages]
+        self._tailMessage = None if len(messages) == 0 or messages[-1] is self._tailMessage else self._tailMessage
+        return messages
+
+    def loadNewerMessages(self) -> int:
+        '''
+        Page the messages following the last loaded one back in from the history store, after they were unloaded while the view was scrolled away
+        '''
+        rowCount = self.messageModel.rowCount()
+        if self._tailMessage is None or rowCount == 0:
+            return 0
+        messages = self._pageMessages(self.historyStore.after(self.messageModel.message(rowCount - 1).id, self.historyPageSize))
+        self.messageModel.insertMessages(rowCount, messages)
+        self._trimHead(self.messageModel.rowCount() - self.maximumMessageCount)
+        self._syncStatusTimer()
+        return len(messages)
+
+    def _loadNewestMessages(self) -> None:
+        self.messageModel.clear()
+        self.messageModel.insertMessages(0, self._pageMessages(self.historyStore.before(None, self.historyPageSize, self._historyFloor)))
+        self._tailMessage = None
+        self._syncStatusTimer()
+
+    def flushStream(self) -> None:
+        '''
+        Apply the latest streamed text and status to the last message
+        '''
+        self.streamTimer.stop()
+        if self._pendingStream is None:
+            return
+        (message, status), self._pendingStream = self._pendingStream, None
+        if self._tailMessage is not None:
+            # The streamed message is unloaded, its text goes to the store and is read back with the message
+            self._setTailStreaming(True)
+            self._tailMessage.text, self._tailMessage.status = message, status
+            self.historyStore.setText(self._tailMessage.id, message)
+            return
+        lastRow = self.messageModel.rowCount() - 1
+        self.messageModel.setMessageStreaming(lastRow, True)
+        self.messageModel.setMessageText(lastRow, message)
+        self.messageModel.setMessageStatus(lastRow, status)
+        self._syncStatusTimer()
+
+    def _finishStream(self) -> None:
+        # The streamed message is complete once anything else is added
+        self.flushStream()
+        if self._tailMessage is not None:
+            self._setTailStreaming(False)
+            return
+        lastRow = self.messageModel.rowCount() - 1
+        if lastRow < 0 or not self.messageModel.message(lastRow).streaming:
+            return
+        self.messageModel.setMessageStreaming(lastRow, False)
+        message = self.messageModel.message(lastRow)
+        self.historyStore.setText(message.id, message.text) if self.historyStore is not None and message.id is not None else None
+
+    def _setTailStreaming(self, streaming: bool) -> None:
+        if self._tailMessage.streaming != streaming:
+            self._tailMessage.streaming = streaming
+            self._tailMessage.streamDocument = None
+            self._tailMessage.sizeCache = None
+
+    def _storeTailMessage(self, text: str, role: Optional[ChatRole] = None, status: Optional[Status] = None) -> None:
+        # Only logged while the rows below the viewport are unloaded, it is shown once they are paged back in
+        self._tailMessage = ChatMessage(text, role, status)
+        self._tailMessage.id = self.historyStore.append(text, role)
 
     def clear(self):
-        self._removeallwidgets(self.scrollAreaContentLayout)
-        self.scrollAreaContentLayout.addSpacerItem(self.scrollAreaContentSpacer)
+        self._finishStream()
+        self._tailMessage = None
+        self.messageModel.clear()
+        # Messages logged before are not paged back in
+        self._historyFloor = self.historyStore.lastId() if self.historyStore is not None else 0
+        self.messageDelegate.clearCache()
+        self.role = None
 
     def addNotice(self, notice: str):
-        self.notice = NoticeDisplay(notice)
-        self.scrollAreaContentLayout.insertWidget(self.scrollAreaContentLayout.indexOf(self.scrollAreaContentSpacer), self.notice)
-        self.update()
-
-    def _storeAvatar(self, avatarDisplay: AvatarDisplay, role: ChatRole):
-        self.avatarDisplays[avatarDisplay] = role
-        avatarDisplay.clicked.connect(lambda: self.onAvatarClicked.emit(avatarDisplay))
+        self._finishStream()
+        if self._tailMessage is not None:
+            self._storeTailMessage(notice)
+            self.role = None
+            return
+        self._storeMessage(self.messageModel.appendMessage(notice))
+        self._trimHistory()
+        self.role = None
 
     def setAvatar(self, avatar, role):
-        for avatarDisplay, avatarRole in self.avatarDisplays.items():
-            avatarDisplay.setAvatar(avatar) if avatarRole == role else None
+        self.messageDelegate.avatarStore.setAvatar(avatar, role)
+
+    def _onAvatarDoubleClicked(self, index: QModelIndex) -> None:
+        role = self.messageModel.message(index.row()).role
+        self.avatarClicked.emit(role)
+        self.onAvatarClicked.emit(self._avatarDisplay(role))
+
+    def _avatarDisplay(self, role: ChatRole) -> AvatarDisplay:
+        # Bubbles have no widgets, one hidden display per role keeps the payload of onAvatarClicked
+        avatarStore = self.messageDelegate.avatarStore
+        avatarDisplay = self._avatarDisplays.get(role)
+        if avatarDisplay is None:
+            avatarDisplay = self._avatarDisplays[role] = AvatarDisplay(self, role, avatarStore)
+            avatarDisplay.hide()
+        pixmap = avatarStore.pixmap(role)
+        avatarDisplay.setPixmap(pixmap) if pixmap is not None else avatarDisplay.clear()
+        return avatarDisplay
+
+    @property
+    def avatarDisplays(self) -> dict[AvatarDisplay, ChatRole]:
+        '''
+        Deprecated, use setAvatar; setting the avatar of a display still sets it for every bubble of its role
+        '''
+        warnings.warn("ChatWidgetBase.avatarDisplays is deprecated, use setAvatar", DeprecationWarning, stacklevel = 2)
+        return {self._avatarDisplay(role): role for role in ChatRole}
+
+    @property
+    def scrollArea(self) -> ChatMessageView:
+        '''
+        Deprecated, the messages are shown by messageView
+        '''
+        warnings.warn("ChatWidgetBase.scrollArea is deprecated, use messageView", DeprecationWarning, stacklevel = 2)
+        return self.messageView
+
+    def _visibleRows(self) -> range:
+        viewport = self.messageView.viewport()
+        first = self.messageView.indexAt(QPoint(0, 0))
+        last = self.messageView.indexAt(QPoint(0, viewport.height() - 1))
+        if not first.isValid():
+            return range(0)
+        return range(first.row(), (last.row() if last.isValid() else self.messageModel.rowCount() - 1) + 1)
+
+    def _updateAvatarRows(self, role: ChatRole) -> None:
+        # Only the visible bubbles of the role are repainted, the others pick the new avatar up when scrolled in
+        viewport = self.messageView.viewport()
+        for row in self._visibleRows():
+            viewport.update(self.messageView.visualRect(self.messageModel.index(row))) if self.messageModel.message(row).role == role else None
 
     def addMessage(self, message, role, status, stream: bool = False):
-        if stream and hasattr(self, "messageLayout") and hasattr(self, 'role') and self.role == role:
-            self.messageLayout.messageDisplay.setMarkdown(message)
-            self.messageLayout.status.setStatus(status)
-            self.update()
+        lastRow = self.messageModel.rowCount() - 1
+        if stream and lastRow >= 0 and self.role == role:
+            self._pendingStream = (message, status)
+            self.streamTimer.start(self._frameInterval()) if not self.streamTimer.isActive() else None
             return
+        self._finishStream()
         self.role = role
-        self.messageLayout = MessageLayout(message, role, status)
-        self._storeAvatar(self.messageLayout.avatarDisplay, role)
-        self.scrollAreaContentLayout.insertLayout(self.scrollAreaContentLayout.indexOf(self.scrollAreaContentSpacer), self.messageLayout)
-        self.update()
+        if self._tailMessage is not None:
+            self._storeTailMessage(message, role, status)
+            self._setTailStreaming(stream)
+            # Sending a message brings the view back to the bottom, which loads the newest messages again
+            self.scrollToBottom() if role == ChatRole.User else None
+            return
+        row = self.messageModel.appendMessage(message, role, status)
+        self.messageModel.setMessageStreaming(row, True) if stream else None
+        self._storeMessage(row)
+        self._trimHistory()
+        self._syncStatusTimer()
+        # Sending a message brings the view back to the bottom, incoming ones are only followed when already there
+        self.scrollToBottom() if role == ChatRole.User else None
 
     def clearDefaultStyleSheet(self) -> None:
         StyleSheetBase.ChatWidget.deregistrate(self)
 
-##############################################################################################################################
\ No newline at end of file
+##############################################################################################################################
+
+class MessageDisplay(QLabel):
+    '''
+    Deprecated, messages are painted by ChatMessageDelegate and ChatWidgetBase no longer creates this widget
+    '''
+    def __init__(self, text: str, role: ChatRole, parent: Optional[QWidget] = None):
+        warnings.warn("MessageDisplay is deprecated, messages are painted by ChatMessageDelegate", DeprecationWarning, stacklevel = 2)
+        super().__init__(parent)
+
+        self.role = role
+        self.setWordWrap(True)
+        self.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.setMarkdown(text)
+
+    def setMarkdown(self, text: str):
+        self.setTextFormat(Qt.MarkdownText)
+        self.setText(text)
+
+
+class Triangle(QWidget):
+    '''
+    Deprecated, bubble triangles are painted by ChatMessageDelegate
+    '''
+    def __init__(self, role: ChatRole, parent: Optional[QWidget] = None):
+        warnings.warn("Triangle is deprecated, bubble triangles are painted by ChatMessageDelegate", DeprecationWarning, stacklevel = 2)
+        super().__init__(parent)
+
+        self.role = role
+        self.setFixedSize(6, 45)
+
+
+class MessageLayout(QHBoxLayout):
+    '''
+    Deprecated, messages are rows of ChatMessageModel laid out by ChatMessageDelegate
+    '''
+    def __init__(self, message, role, status, parent = None):
+        warnings.warn("MessageLayout is deprecated, messages are rows of ChatMessageModel", DeprecationWarning, stacklevel = 2)
+        super().__init__(parent)
+
+        self.message = message
+        self.role = role
+        self.status = status
+
+
+class NoticeDisplay(QLabel):
+    '''
+    Deprecated, notices are painted by ChatMessageDelegate
+    '''
+    def __init__(self, text: str, parent = None):
+        warnings.warn("NoticeDisplay is deprecated, notices are painted by ChatMessageDelegate", DeprecationWarning, stacklevel = 2)
+        super().__init__(text, parent)
+
+        self.setAlignment(Qt.AlignCenter)
+        self.setWordWrap(True)
+
+##############################################################################################################################
@@ -1,10 +1,9 @@
 from typing import List, Union, Optional, overload
-from PyEasyUtils import singledispatchmethod
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
 
-from ..Common.Config import Direction
+from ..Common.Config import Direction, singledispatchmethod
 from ..Common.Icon import *
 from ..Common.Theme import *
 from ..Common.StyleSheet import StyleSheetBase
@@ -1,9 +1,9 @@
 from typing import Optional, overload
-from PyEasyUtils import singledispatchmethod
 from PySide6.QtGui import *
 from PySide6.QtCore import *
 from PySide6.QtWidgets import *
 
+from ..Common.Config import singledispatchmethod
 from ..Common.Icon import *
 from ..Common.Theme import *
 from ..Common.StyleSheet import *
@@ -10,16 +10,48 @@ from ..Common.Config import Status
 
 ##############################################################################################################################
 
+def loadingDotGeometry(squareWidth: float, count: int) -> tuple[list[tuple[float, float]], list[float]]:
+    '''
+    Centers (in a square of squareWidth) and radii of the dots of a loading indicator
+    '''
+    _maxDiameter = squareWidth / 6
+    _minDiameter = _maxDiameter - squareWidth/12
+    half = squareWidth / 2
+    _centerDistance = half - _maxDiameter/2 - 1
+    gap = (_maxDiameter - _minDiameter) / (count-1) / 2
+    angleGap = 360 / count
+    locationList, radiiList = [], []
+    for i in range(count):
+        radiiList.append(_maxDiameter/2 - i*gap)
+        radian = math.radians(- angleGap*i)
+        locationList.append((half + _centerDistance*math.cos(radian), half - _centerDistance*math.sin(radian)))
+    return locationList, radiiList
+
+
+def paintLoadingDots(painter: QPainter, locationList: list[tuple[float, float]], radiiList: list[float], interval: int, origin: QPointF = QPointF()) -> None:
+    '''
+    Draw the dots with the current pen and brush, turning one step every interval ms
+    '''
+    step = int(time.time() * 1000 / interval)
+    for index, location in enumerate(locationList):
+        radii = radiiList[(index + step) % len(radiiList)]
+        painter.drawEllipse(origin + QPointF(*location), radii, radii)
+
+
 class LoadingStatus(QWidget):
     locationList = []
     radiiList = []
 
-    def __init__(self, dotcount: int = 12, interval: int = 50, parent: Optional[QWidget] = None):
+    defaultDotCount = 12
+    defaultInterval = 50
+    defaultDotColor = QColor(48, 177, 222)
+
+    def __init__(self, dotcount: int = defaultDotCount, interval: int = defaultInterval, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
         self.setAttribute(Qt.WA_TranslucentBackground, True)
 
-        self.setDotColor(QColor(48, 177, 222))
+        self.setDotColor(self.defaultDotColor)
         self.setDotCount(dotcount)
 
         self.timer = QTimer()
@@ -34,25 +66,11 @@ class LoadingStatus(QWidget):
         self._dotColor = color
 
     def resizeEvent(self, event: QResizeEvent):
-        _squareWidth = min(self.width(), self.height())
-        _maxDiameter = _squareWidth / 6
-        _minDiameter = _maxDiameter - _squareWidth/12
-        half = _squareWidth / 2
-        _centerDistance = half - _maxDiameter/2 - 1
-        gap = (_maxDiameter - _minDiameter) / (self._count-1) / 2
-        angleGap = 360 / self._count
-        self.locationList.clear()
-        self.radiiList.clear()
-        for i in range(self._count):
-            self.radiiList.append(_maxDiameter/2 - i*gap)
-            radian = math.radians(- angleGap*i)
-            self.locationList.append((half + _centerDistance*math.cos(radian), half - _centerDistance*math.sin(radian)))
+        self.locationList, self.radiiList = loadingDotGeometry(min(self.width(), self.height()), self._count)
 
     def _paintDot(self, painter: QPainter):
-        for index in range(self._count):
-            painter.setPen(self._dotColor)
-            radii = self.radiiList[(index + int(time.time() * 1000 / self.timer.interval())) % self._count]
-            painter.drawEllipse(QPointF(*self.locationList[index]), radii, radii)
+        painter.setPen(self._dotColor)
+        paintLoadingDots(painter, self.locationList, self.radiiList, self.timer.interval())
 
     def paintEvent(self, event: QPaintEvent):
         painter = QPainter(self)
@@ -1,20 +1,88 @@
-from typing import Optional, overload
+import io
+import csv
+import html
+import time
+import array
+import threading
+from enum import Enum
+from typing import Union, Optional, overload
 from PySide6.QtGui import *
 from PySide6.QtCore import *
 from PySide6.QtWidgets import *
+from shiboken6 import Shiboken
 
 from ..Common.Theme import *
 from ..Common.StyleSheet import *
+from ..Common.QWorker import WorkerManager
 from .ScrollArea import ScrollDelegate
 
 ##############################################################################################################################
 
+class TableCellType(Enum):
+    Label = 1
+    Button = 2
+    CheckBox = 3
+    ProgressBar = 4
+
+
 class TableItemDelegate(QStyledItemDelegate):
     '''
+    Paints labels, buttons, checkboxes and progress bars from model data, no widget lives in the cells
     '''
+    CellTypeRole = Qt.UserRole + 1
+
+    buttonClicked = Signal(QModelIndex)
+
+    editorKept = Signal(QWidget)
+
     _margin = 3
+    # Horizontal padding of QTableView::item in Table.qss, added by the style on both sides of the text of label cells
+    _textPadding = 6
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+
+        self._columnCellTypes: dict[int, TableCellType] = {}
+        self._pressedIndex = QPersistentModelIndex()
+        self._uniformRowHeight: Optional[int] = None
+        # (style, text margin) of the last measured cell
+        self._textMargin: Optional[tuple[QStyle, int]] = None
+        self._keptEditors: set[QWidget] = set()
+
+    def setColumnCellType(self, column: int, cellType: TableCellType) -> None:
+        self._columnCellTypes[column] = cellType
+
+    def keepEditors(self, editors: set[QWidget]) -> None:
+        '''
+        Have the view only hide these cell widgets when it releases them (the set is shared, not copied), editorKept is emitted instead
+        '''
+        self._keptEditors = editors
+
+    def destroyEditor(self, editor: QWidget, index: QModelIndex) -> None:
+        self.editorKept.emit(editor) if editor in self._keptEditors else super().destroyEditor(editor, index)
+
+    def cellType(self, index: QModelIndex) -> TableCellType:
+        '''
+        The type stored in CellTypeRole, falling back to the type of the column
+        '''
+        cellType = index.data(self.CellTypeRole)
+        return cellType if isinstance(cellType, TableCellType) else self._columnCellTypes.get(index.column(), TableCellType.Label)
+
+    def setUniformRowHeight(self, height: Optional[int]) -> None:
+        '''
+        Report this height for every cell, None measures each cell again
+        '''
+        self._uniformRowHeight = height
+        self.sizeHintChanged.emit(QModelIndex())
 
     def sizeHint(self, option, index):
+        if self._uniformRowHeight is not None:
+            # Only the width is measured, from the display text alone plus the padding and text margin the style paints around it
+            text = index.data(Qt.DisplayRole)
+            style = option.widget.style() if option.widget is not None else QApplication.style()
+            if self._textMargin is None or self._textMargin[0] is not style:
+                self._textMargin = (style, style.pixelMetric(QStyle.PM_FocusFrameHMargin, None, option.widget) + 1)
+            return QSize(option.fontMetrics.horizontalAdvance(str(text) if text is not None else '') + 2 * (self._textPadding + self._textMargin[1]), self._uniformRowHeight)
         size = super().sizeHint(option, index)
         size.setHeight(33)
         size = size.grownBy(QMargins(self._margin, 2 * self._margin, self._margin, 2 * self._margin))
@@ -33,6 +101,869 @@ class TableItemDelegate(QStyledItemDelegate):
         option.palette.setColor(QPalette.Text, textColor)
         option.palette.setColor(QPalette.HighlightedText, textColor)
 
+    def _isChecked(self, index: QModelIndex) -> bool:
+        checkState = index.data(Qt.CheckStateRole)
+        return Qt.CheckState(checkState) == Qt.Checked if checkState is not None else bool(index.data(Qt.EditRole))
+
+    def _controlRect(self, option: QStyleOptionViewItem) -> QRect:
+        return option.rect.marginsRemoved(QMargins(self._margin, self._margin, self._margin, self._margin))
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        cellType = self.cellType(index)
+        if cellType == TableCellType.Label:
+            return super().paint(painter, option, index)
+
+        viewOption = QStyleOptionViewItem(option)
+        self.initStyleOption(viewOption, index)
+        widget = viewOption.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, viewOption, painter, widget)
+        # Controls are drawn without the view and with the application palette,
+        # the view's stylesheet makes its own palette transparent
+        palette = QApplication.palette()
+
+        if cellType == TableCellType.Button:
+            buttonOption = QStyleOptionButton()
+            buttonOption.initFrom(widget) if widget is not None else None
+            buttonOption.rect = self._controlRect(viewOption)
+            buttonOption.text = viewOption.text
+            buttonOption.palette = palette
+            buttonOption.state |= QStyle.State_Sunken if self._pressedIndex == index else QStyle.State_Raised
+            style.drawControl(QStyle.CE_PushButton, buttonOption, painter, None)
+        elif cellType == TableCellType.CheckBox:
+            checkOption = QStyleOptionButton()
+            checkOption.initFrom(widget) if widget is not None else None
+            indicatorSize = QSize(style.pixelMetric(QStyle.PM_IndicatorWidth, None, None), style.pixelMetric(QStyle.PM_IndicatorHeight, None, None))
+            checkOption.rect = QStyle.alignedRect(viewOption.direction, Qt.AlignCenter, indicatorSize, viewOption.rect)
+            checkOption.palette = palette
+            checkOption.state |= QStyle.State_On if self._isChecked(index) else QStyle.State_Off
+            style.drawPrimitive(QStyle.PE_IndicatorCheckBox, checkOption, painter, None)
+        elif cellType == TableCellType.ProgressBar:
+            try:
+                value = max(0, min(100, int(float(index.data(Qt.EditRole)))))
+            except (TypeError, ValueError):
+                value = 0
+            progressOption = QStyleOptionProgressBar()
+            progressOption.initFrom(widget) if widget is not None else None
+            progressOption.rect = self._controlRect(viewOption)
+            progressOption.palette = palette
+            progressOption.minimum = 0
+            progressOption.maximum = 100
+            progressOption.progress = value
+            progressOption.text = f"{value}%"
+            progressOption.textVisible = True
+            progressOption.state |= QStyle.State_Horizontal
+            style.drawControl(QStyle.CE_ProgressBar, progressOption, painter, None)
+
+    def editorEvent(self, event: QEvent, model: QAbstractItemModel, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        cellType = self.cellType(index)
+        if cellType == TableCellType.Button and event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease) and event.button() == Qt.LeftButton:
+            inside = self._controlRect(option).contains(event.position().toPoint())
+            if event.type() == QEvent.MouseButtonPress:
+                self._pressedIndex = QPersistentModelIndex(index) if inside else QPersistentModelIndex()
+            else:
+                clicked = inside and self._pressedIndex == index
+                self._pressedIndex = QPersistentModelIndex()
+                self.buttonClicked.emit(QModelIndex(index)) if clicked else None
+            option.widget.update(index) if isinstance(option.widget, QAbstractItemView) else None
+            return True
+        if cellType == TableCellType.CheckBox and index.flags() & Qt.ItemIsEnabled:
+            toggled = (
+                (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton and option.rect.contains(event.position().toPoint())) or
+                (event.type() == QEvent.KeyPress and event.key() in (Qt.Key_Space, Qt.Key_Select))
+            )
+            if toggled:
+                checked = not self._isChecked(index)
+                if index.data(Qt.CheckStateRole) is not None:
+                    model.setData(index, Qt.Checked if checked else Qt.Unchecked, Qt.CheckStateRole)
+                else:
+                    model.setData(index, checked, Qt.EditRole)
+            return toggled or event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonDblClick)
+        if cellType == TableCellType.ProgressBar:
+            return False
+        return super().editorEvent(event, model, option, index)
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex) -> Optional[QWidget]:
+        # Only labels are edited through a real widget, created for the cell being edited
+        return super().createEditor(parent, option, index) if self.cellType(index) == TableCellType.Label else None
+
+
+class TableItemModel(QStandardItemModel):
+    '''
+    Item model whose first column shows the row number, computed on the fly instead of stored in items
+    '''
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if index.column() == 0 and role == Qt.DisplayRole and index.isValid():
+            return f"{index.row() + 1}"
+        return super().data(index, role)
+
+    def insertRowValues(self, row: int, rows: list[list]) -> None:
+        '''
+        Insert a block of rows (values of the data columns) with one rowsInserted and one dataChanged notification
+        '''
+        if len(rows) == 0:
+            return
+        self.insertRows(row, len(rows))
+        blocked = self.blockSignals(True)
+        for offset, values in enumerate(rows):
+            for column, value in enumerate(values, start = 1):
+                if value is None:
+                    continue
+                if not isinstance(value, QStandardItem):
+                    item = QStandardItem()
+                    item.setData(value, Qt.EditRole)
+                    value = item
+                self.setItem(row + offset, column, value)
+        self.blockSignals(blocked)
+        self.dataChanged.emit(self.index(row, 1), self.index(row + len(rows) - 1, self.columnCount() - 1), [])
+
+    def columnValues(self, column: int) -> list:
+        '''
+        Return the values of the column in row order
+        '''
+        return [None if item is None else item.data(Qt.EditRole) for item in (self.item(row, column) for row in range(self.rowCount()))]
+
+    def rowValues(self, row: int) -> list:
+        '''
+        Return the values of the data columns of the row
+        '''
+        return [None if item is None else item.data(Qt.EditRole) for item in (self.item(row, column) for column in range(1, self.columnCount()))]
+
+    def setBlockValues(self, row: int, column: int, rows: list[list]) -> None:
+        '''
+        Overwrite the block of cells starting at (row, column) with one dataChanged notification
+        '''
+        if len(rows) == 0:
+            return
+        blocked = self.blockSignals(True)
+        for offset, values in enumerate(rows):
+            for cellColumn, value in enumerate(values, start = column):
+                item = self.item(row + offset, cellColumn)
+                if item is None:
+                    item = QStandardItem()
+                    self.setItem(row + offset, cellColumn, item)
+                item.setData(value, Qt.EditRole)
+        self.blockSignals(blocked)
+        self.dataChanged.emit(self.index(row, column), self.index(row + len(rows) - 1, column + max(len(values) for values in rows) - 1), [])
+
+    def clearRows(self) -> None:
+        '''
+        Remove every row in one model reset, columns and header items are kept
+        '''
+        self.beginResetModel()
+        blocked = self.blockSignals(True)
+        self.removeRows(0, self.rowCount())
+        self.blockSignals(blocked)
+        self.endResetModel()
+
+
+def _coerceValue(columnType: Optional[str], value):
+    '''
+    Convert a value (or its text) to the typecode of a column, None and empty text fall back to the column default;
+    raises ValueError, TypeError or OverflowError when it does not fit
+    '''
+    if columnType is None:
+        return value
+    value = value.data(Qt.EditRole) if isinstance(value, QStandardItem) else value
+    if value is None or value == '':
+        return 0
+    # The range of the typecode is checked by the array itself
+    return array.array(columnType, [(float if columnType in ('f', 'd') else int)(value)])[0]
+
+
+def _coerceValueOrDefault(columnType: Optional[str], value):
+    try:
+        return _coerceValue(columnType, value)
+    except (ValueError, TypeError, OverflowError):
+        return 0
+
+
+class TableColumnModel(QAbstractTableModel):
+    '''
+    Table model keeping one buffer per column, cells are only materialized when the view asks for them through data()
+
+    A column declared with an `array` typecode (e.g. 'd', 'q') is stored unboxed in an array.array,
+    other columns are stored in a list; like TableItemModel, column 0 is the computed index column
+    '''
+    def __init__(self, parent: Optional[QObject] = None, columnTypes: Optional[list[Optional[str]]] = None):
+        super().__init__(parent)
+
+        self._rowCount = 0
+        self._columnTypes: list[Optional[str]] = []
+        self._columns: list = []
+        self._headers: list[Optional[str]] = ['Index']
+
+        self.setColumnTypes(columnTypes or [])
+
+    def _newBuffer(self, columnType: Optional[str], count: int = 0):
+        return array.array(columnType, bytes(array.array(columnType).itemsize * count)) if columnType is not None else [None] * count
+
+    def setColumnTypes(self, columnTypes: list[Optional[str]]) -> None:
+        '''
+        Reset the model to empty columns of the given typecodes (None for arbitrary values)
+        '''
+        self.beginResetModel()
+        self._rowCount = 0
+        self._columnTypes = list(columnTypes)
+        self._columns = [self._newBuffer(columnType) for columnType in columnTypes]
+        self._headers = ['Index'] + [None] * len(columnTypes)
+        self.endResetModel()
+
+    def columnType(self, column: int) -> Optional[str]:
+        return self._columnTypes[column - 1]
+
+    def columnValues(self, column: int):
+        '''
+        Return the buffer of the column, it must not be resized from outside
+        '''
+        return self._columns[column - 1]
+
+    def setColumnValues(self, column: int, values) -> None:
+        if len(values) != self._rowCount:
+            raise ValueError(f'expected {self._rowCount} values, got {len(values)}')
+        columnType = self._columnTypes[column - 1]
+        self._columns[column - 1] = array.array(columnType, values) if columnType is not None else list(values)
+        self.dataChanged.emit(self.index(0, column), self.index(self._rowCount - 1, column), []) if self._rowCount > 0 else None
+
+    def _position(self, row: int) -> int:
+        # Position of the row in the column buffers
+        return row
+
+    def rowValues(self, row: int) -> list:
+        '''
+        Return the values of the data columns of the row
+        '''
+        position = self._position(row)
+        return [column[position] for column in self._columns]
+
+    def setBlockValues(self, row: int, column: int, rows: list[list]) -> None:
+        '''
+        Overwrite the block of cells starting at (row, column) with one dataChanged notification,
+        None values fall back to the column default
+        '''
+        if len(rows) == 0:
+            return
+        for offset, values in enumerate(rows):
+            position = self._position(row + offset)
+            for cellColumn, value in enumerate(values, start = column):
+                self._columns[cellColumn - 1][position] = value if value is not None or self._columnTypes[cellColumn - 1] is None else 0
+        self.dataChanged.emit(self.index(row, column), self.index(row + len(rows) - 1, column + max(len(values) for values in rows) - 1), [])
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._rowCount
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns) + 1
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if index.column() == 0:
+            return f"{index.row() + 1}" if role == Qt.DisplayRole else None
+        if role == Qt.DisplayRole:
+            value = self._columns[index.column() - 1][self._position(index.row())]
+            return str(value) if value is not None else None
+        if role == Qt.EditRole:
+            return self._columns[index.column() - 1][self._position(index.row())]
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or index.column() == 0 or role not in (Qt.EditRole, Qt.DisplayRole):
+            return False
+        try:
+            value = _coerceValue(self._columnTypes[index.column() - 1], value)
+        except (ValueError, TypeError, OverflowError):
+            return False
+        self._columns[index.column() - 1][self._position(index.row())] = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | (Qt.ItemIsEditable if index.column() > 0 else Qt.NoItemFlags)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section] if 0 <= section < len(self._headers) else None
+        return f"{section + 1}"
+
+    def setHeaderData(self, section: int, orientation: Qt.Orientation, value, role: int = Qt.EditRole) -> bool:
+        if orientation != Qt.Horizontal or role not in (Qt.EditRole, Qt.DisplayRole) or not 0 <= section < len(self._headers):
+            return False
+        self._headers[section] = value
+        self.headerDataChanged.emit(orientation, section, section)
+        return True
+
+    def insertRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid() or count <= 0 or not 0 <= row <= self._rowCount:
+            return False
+        self.beginInsertRows(QModelIndex(), row, row + count - 1)
+        for column, columnType in enumerate(self._columnTypes):
+            self._columns[column][row:row] = self._newBuffer(columnType, count)
+        self._rowCount += count
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid() or count <= 0 or row < 0 or row + count > self._rowCount:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        for buffer in self._columns:
+            del buffer[row:row + count]
+        self._rowCount -= count
+        self.endRemoveRows()
+        return True
+
+    def insertColumns(self, column: int, count: int, parent: QModelIndex = QModelIndex(), columnType: Optional[str] = None) -> bool:
+        # Column 0 is the index column, data columns start at 1
+        if parent.isValid() or count <= 0 or not 1 <= column <= len(self._columns) + 1:
+            return False
+        self.beginInsertColumns(QModelIndex(), column, column + count - 1)
+        self._columnTypes[column - 1:column - 1] = [columnType] * count
+        self._columns[column - 1:column - 1] = [self._newBuffer(columnType, self._rowCount) for _ in range(count)]
+        self._headers[column:column] = [None] * count
+        self.endInsertColumns()
+        return True
+
+    def removeColumns(self, column: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid() or count <= 0 or column < 1 or column + count > len(self._columns) + 1:
+            return False
+        self.beginRemoveColumns(QModelIndex(), column, column + count - 1)
+        del self._columnTypes[column - 1:column - 1 + count]
+        del self._columns[column - 1:column - 1 + count]
+        del self._headers[column:column + count]
+        self.endRemoveColumns()
+        return True
+
+    def setRowCount(self, rows: int) -> None:
+        self.insertRows(self._rowCount, rows - self._rowCount) if rows > self._rowCount else self.removeRows(rows, self._rowCount - rows)
+
+    def setColumnCount(self, columns: int) -> None:
+        current = len(self._columns) + 1
+        self.insertColumns(current, columns - current) if columns > current else self.removeColumns(columns, current - columns)
+
+    def insertRowValues(self, row: int, rows: list[list]) -> None:
+        '''
+        Insert a block of rows (values of the data columns) inside one beginInsertRows/endInsertRows
+        '''
+        if len(rows) == 0:
+            return
+        self.beginInsertRows(QModelIndex(), row, row + len(rows) - 1)
+        width = len(self._columns)
+        # Transpose once, missing or None values fall back to the column default
+        columns = zip(*((list(values[:width]) + [None] * (width - len(values)) for values in rows)))
+        for column, (columnType, values) in enumerate(zip(self._columnTypes, columns)):
+            values = [value.data(Qt.EditRole) if isinstance(value, QStandardItem) else value for value in values]
+            if columnType is None:
+                self._columns[column][row:row] = values
+                continue
+            try:
+                buffer = array.array(columnType, (0 if value is None else value for value in values))
+            except (ValueError, TypeError, OverflowError):
+                # Text or out-of-range values are converted one by one, the ones that do not fit fall back to the default
+                buffer = array.array(columnType, (_coerceValueOrDefault(columnType, value) for value in values))
+            self._columns[column][row:row] = buffer
+        self._rowCount += len(rows)
+        self.endInsertRows()
+
+    def clearRows(self) -> None:
+        '''
+        Remove every row in one model reset, columns and header labels are kept
+        '''
+        self.beginResetModel()
+        self._columns = [self._newBuffer(columnType) for columnType in self._columnTypes]
+        self._rowCount = 0
+        self.endResetModel()
+
+    def item(self, row: int, column: int = 0) -> Optional[QStandardItem]:
+        '''
+        Materialize a detached copy of the cell, use setItem to write it back
+        '''
+        if not (0 <= row < self._rowCount and 0 <= column < len(self._columns) + 1):
+            return None
+        item = QStandardItem()
+        item.setData(self.data(self.index(row, column), Qt.EditRole if column > 0 else Qt.DisplayRole), Qt.EditRole)
+        return item
+
+    def setItem(self, row: int, column: int, item: QStandardItem) -> None:
+        self.setRowCount(row + 1) if row >= self._rowCount else None
+        self.setColumnCount(column + 1) if column >= len(self._columns) + 1 else None
+        self.setData(self.index(row, column), item.data(Qt.EditRole))
+
+    def horizontalHeaderItem(self, column: int) -> Optional[QStandardItem]:
+        return QStandardItem(self._headers[column]) if 0 <= column < len(self._headers) and self._headers[column] is not None else None
+
+    def setHorizontalHeaderItem(self, column: int, item: QStandardItem) -> None:
+        self.setColumnCount(column + 1) if column >= len(self._headers) else None
+        self.setHeaderData(column, Qt.Horizontal, item.text())
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        if column < 1 or self._rowCount < 2:
+            return
+        self.layoutAboutToBeChanged.emit()
+        values = self._columns[column - 1]
+        # Same keys as TableSortFilterProxyModel, so that both order a column alike and mixed types never compare
+        keys = [_sortKey(values[row]) for row in range(self._rowCount)]
+        rows = sorted(range(self._rowCount), key = keys.__getitem__, reverse = order == Qt.DescendingOrder)
+        for index, (columnType, buffer) in enumerate(zip(self._columnTypes, self._columns)):
+            self._columns[index] = array.array(columnType, (buffer[row] for row in rows)) if columnType is not None else [buffer[row] for row in rows]
+        positions = [0] * self._rowCount
+        for position, row in enumerate(rows):
+            positions[row] = position
+        persistentIndexes = self.persistentIndexList()
+        self.changePersistentIndexList(persistentIndexes, [self.index(positions[index.row()], index.column()) for index in persistentIndexes])
+        self.layoutChanged.emit()
+
+
+class TableStreamModel(TableColumnModel):
+    '''
+    Append-only column model on fixed-size ring buffers, appending beyond the maximum row count evicts the oldest rows in O(1)
+
+    Rows can only be appended, removed from the top or cleared; sorting is left to a proxy model
+    '''
+    def __init__(self, parent: Optional[QObject] = None, columnTypes: Optional[list[Optional[str]]] = None, maximumRowCount: int = 10000):
+        self._capacity = max(maximumRowCount, 1)
+        self._start = 0
+
+        super().__init__(parent, columnTypes)
+
+    def _newBuffer(self, columnType: Optional[str], count: int = 0):
+        # Ring buffers are always allocated at full capacity
+        return super()._newBuffer(columnType, self._capacity)
+
+    def _position(self, row: int) -> int:
+        return (self._start + row) % self._capacity
+
+    def maximumRowCount(self) -> int:
+        return self._capacity
+
+    def setMaximumRowCount(self, rows: int) -> None:
+        '''
+        Resize the ring buffers, keeping the newest rows
+        '''
+        rows = max(rows, 1)
+        if rows == self._capacity:
+            return
+        self.beginResetModel()
+        keep = min(self._rowCount, rows)
+        positions = [self._position(row) for row in range(self._rowCount - keep, self._rowCount)]
+        self._capacity = rows
+        for index, (columnType, buffer) in enumerate(zip(self._columnTypes, self._columns)):
+            values = [buffer[position] for position in positions]
+            newBuffer = self._newBuffer(columnType)
+            newBuffer[:keep] = array.array(columnType, values) if columnType is not None else values
+            self._columns[index] = newBuffer
+        self._start = 0
+        self._rowCount = keep
+        self.endResetModel()
+
+    def setColumnTypes(self, columnTypes: list[Optional[str]]) -> None:
+        self._start = 0
+        super().setColumnTypes(columnTypes)
+
+    def columnValues(self, column: int) -> list:
+        '''
+        Return a copy of the column in row order
+        '''
+        buffer = self._columns[column - 1]
+        return [buffer[self._position(row)] for row in range(self._rowCount)]
+
+    def setColumnValues(self, column: int, values) -> None:
+        if len(values) != self._rowCount:
+            raise ValueError(f'expected {self._rowCount} values, got {len(values)}')
+        buffer = self._columns[column - 1]
+        for row, value in enumerate(values):
+            buffer[self._position(row)] = value
+        self.dataChanged.emit(self.index(0, column), self.index(self._rowCount - 1, column), []) if self._rowCount > 0 else None
+
+    def appendRowValues(self, rows: list[list]) -> None:
+        '''
+        Append a block of rows, evicting the oldest rows when the maximum row count is exceeded
+        '''
+        rows = rows[-self._capacity:]
+        if len(rows) == 0:
+            return
+        self.removeRows(0, self._rowCount + len(rows) - self._capacity) if self._rowCount + len(rows) > self._capacity else None
+        self.beginInsertRows(QModelIndex(), self._rowCount, self._rowCount + len(rows) - 1)
+        for offset, values in enumerate(rows):
+            position = self._position(self._rowCount + offset)
+            for column, columnType in enumerate(self._columnTypes):
+                value = values[column] if column < len(values) else None
+                value = value.data(Qt.EditRole) if isinstance(value, QStandardItem) else value
+                try:
+                    self._columns[column][position] = (0 if value is None else value) if columnType is not None else value
+                except (ValueError, TypeError, OverflowError):
+                    self._columns[column][position] = _coerceValueOrDefault(columnType, value)
+        self._rowCount += len(rows)
+        self.endInsertRows()
+
+    def insertRowValues(self, row: int, rows: list[list]) -> None:
+        if row != self._rowCount:
+            raise ValueError('rows can only be appended to a stream model')
+        self.appendRowValues(rows)
+
+    def insertRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid() or count <= 0 or row != self._rowCount:
+            return False
+        self.appendRowValues([[]] * count)
+        return True
+
+    def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid() or count <= 0 or row + count > self._rowCount:
+            return False
+        if count == self._rowCount:
+            self.clearRows()
+            return True
+        if row != 0:
+            return False
+        self.beginRemoveRows(QModelIndex(), 0, count - 1)
+        # Evicted cells of list columns are released right away
+        for columnType, buffer in zip(self._columnTypes, self._columns):
+            if columnType is None:
+                for offset in range(count):
+                    buffer[self._position(offset)] = None
+        self._start = self._position(count)
+        self._rowCount -= count
+        self.endRemoveRows()
+        return True
+
+    def clearRows(self) -> None:
+        self._start = 0
+        super().clearRows()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        return
+
+
+def _sortKey(value):
+    # Typed keys: numbers before strings before empty cells, no mixed-type comparison
+    if value is None:
+        return (2, 0)
+    if isinstance(value, (int, float)):
+        return (0, value)
+    return (1, str(value))
+
+
+class TableSortFilterProxyModel(QAbstractProxyModel):
+    '''
+    Sort and filter proxy for the table models, the source model is never touched
+
+    Rows are sorted on the typed EditRole values of a column and filtered on a case-insensitive substring,
+    both computed from per-column caches in Python instead of one data() call per comparison;
+    source inserts, removals and edits are merged into the current order instead of re-sorting from scratch
+    '''
+    _incrementalLimit = 512
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+
+        self._rows: list[int] = []
+        self._positions: Optional[dict[int, int]] = None
+        self._sortColumn = -1
+        self._sortOrder = Qt.AscendingOrder
+        self._keys: Optional[list] = None
+        self._filterText = ''
+        self._filterColumn = -1
+        self._texts: Optional[list[str]] = None
+        self._sourceConnections: list[tuple] = []
+
+    def setSourceModel(self, sourceModel: QAbstractItemModel) -> None:
+        self.beginResetModel()
+        for signal, slot in self._sourceConnections:
+            signal.disconnect(slot)
+        super().setSourceModel(sourceModel)
+        self._sourceConnections = [
+            (sourceModel.dataChanged, self._onSourceDataChanged),
+            (sourceModel.headerDataChanged, self.headerDataChanged),
+            (sourceModel.rowsInserted, self._onSourceRowsInserted),
+            (sourceModel.rowsAboutToBeRemoved, self._onSourceRowsAboutToBeRemoved),
+            (sourceModel.rowsRemoved, self._onSourceRowsRemoved),
+        ]
+        # Any other structural change rebuilds the mapping
+        for aboutToChange, changed in (
+            (sourceModel.modelAboutToBeReset, sourceModel.modelReset),
+            (sourceModel.layoutAboutToBeChanged, sourceModel.layoutChanged),
+            (sourceModel.columnsAboutToBeInserted, sourceModel.columnsInserted),
+            (sourceModel.columnsAboutToBeRemoved, sourceModel.columnsRemoved),
+            (sourceModel.columnsAboutToBeMoved, sourceModel.columnsMoved),
+            (sourceModel.rowsAboutToBeMoved, sourceModel.rowsMoved),
+        ):
+            self._sourceConnections += [(aboutToChange, lambda *args: self.beginResetModel()), (changed, lambda *args: self._onSourceReset())]
+        for signal, slot in self._sourceConnections:
+            signal.connect(slot)
+        self._rebuild()
+        self.endResetModel()
+
+    ##### Mapping
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if parent.isValid() or not (0 <= row < len(self._rows) and 0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        return QModelIndex()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() or self.sourceModel() is None else self.sourceModel().columnCount()
+
+    def mapToSource(self, proxyIndex: QModelIndex) -> QModelIndex:
+        if not proxyIndex.isValid() or proxyIndex.row() >= len(self._rows):
+            return QModelIndex()
+        return self.sourceModel().index(self._rows[proxyIndex.row()], proxyIndex.column())
+
+    def mapFromSource(self, sourceIndex: QModelIndex) -> QModelIndex:
+        if not sourceIndex.isValid():
+            return QModelIndex()
+        position = self._proxyPositions().get(sourceIndex.row())
+        return self.createIndex(position, sourceIndex.column()) if position is not None else QModelIndex()
+
+    def sourceRows(self) -> list[int]:
+        '''
+        Return the source rows in view order
+        '''
+        return list(self._rows)
+
+    def _proxyPositions(self) -> dict[int, int]:
+        if self._positions is None:
+            self._positions = {row: position for position, row in enumerate(self._rows)}
+        return self._positions
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        # The index column numbers the visible rows
+        if index.column() == 0 and role == Qt.DisplayRole and index.isValid():
+            return f"{index.row() + 1}"
+        return super().data(index, role)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            return self.sourceModel().headerData(section, orientation, role) if self.sourceModel() is not None else None
+        return f"{section + 1}" if role == Qt.DisplayRole else None
+
+    ##### Caches
+
+    def _columnValues(self, column: int) -> list:
+        sourceModel = self.sourceModel()
+        if hasattr(sourceModel, 'columnValues'):
+            return sourceModel.columnValues(column)
+        return [sourceModel.index(row, column).data(Qt.EditRole) for row in range(sourceModel.rowCount())]
+
+    def _cellValue(self, row: int, column: int):
+        return self.sourceModel().index(row, column).data(Qt.EditRole)
+
+    def _filterColumns(self) -> list[int]:
+        return list(range(1, self.sourceModel().columnCount())) if self._filterColumn < 0 else [self._filterColumn]
+
+    def _rowText(self, values) -> str:
+        return '\x1f'.join('' if value is None else str(value) for value in values).lower()
+
+    def _buildKeys(self) -> None:
+        self._keys = [_sortKey(value) for value in self._columnValues(self._sortColumn)] if self._sortColumn > 0 else None
+
+    def _buildTexts(self) -> None:
+        self._texts = [self._rowText(values) for values in zip(*(self._columnValues(column) for column in self._filterColumns()))] if self._filterText else None
+
+    def _updateCaches(self, first: int, last: int, insert: bool = False) -> None:
+        rows = range(first, last + 1)
+        keys = [_sortKey(self._cellValue(row, self._sortColumn)) for row in rows] if self._keys is not None else None
+        texts = [self._rowText([self._cellValue(row, column) for column in self._filterColumns()]) for row in rows] if self._texts is not None else None
+        end = first if insert else last + 1
+        if keys is not None:
+            self._keys[first:end] = keys
+        if texts is not None:
+            self._texts[first:end] = texts
+
+    def _accepts(self, row: int) -> bool:
+        return self._texts is None or self._filterText in self._texts[row]
+
+    def _order(self, rows: list[int]) -> list[int]:
+        if self._keys is None:
+            return sorted(rows)
+        # Nearly sorted input (a few inserted or edited rows) is merged in linear time by timsort
+        return sorted(rows, key = self._keys.__getitem__, reverse = self._sortOrder == Qt.DescendingOrder)
+
+    def _rebuild(self) -> None:
+        self._positions = None
+        if self.sourceModel() is None:
+            self._rows, self._keys, self._texts = [], None, None
+            return
+        self._buildKeys()
+        self._buildTexts()
+        rows = range(self.sourceModel().rowCount())
+        self._rows = self._order([row for row in rows if self._accepts(row)] if self._texts is not None else list(rows))
+
+    ##### Sorting and filtering
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        '''
+        Sort on the typed values of the column, column 0 (the index column) restores the source order
+        '''
+        self._sortColumn, self._sortOrder = (column if column > 0 else -1), order
+        self._buildKeys()
+        self._reorder()
+
+    def sortColumn(self) -> int:
+        return self._sortColumn
+
+    def sortOrder(self) -> Qt.SortOrder:
+        return self._sortOrder
+
+    def _reorder(self) -> None:
+        self._setRows(self._order(self._rows))
+
+    def _setRows(self, rows: list[int]) -> None:
+        # One layout change, persistent indexes (index widgets, selection, resized sections) follow their source rows
+        self.layoutAboutToBeChanged.emit()
+        persistentIndexes = self.persistentIndexList()
+        sourceRows = [self._rows[index.row()] if index.isValid() and index.row() < len(self._rows) else None for index in persistentIndexes]
+        self._rows = rows
+        self._positions = None
+        positions = self._proxyPositions()
+        self.changePersistentIndexList(persistentIndexes, [self.index(positions[row], index.column()) if row in positions else QModelIndex() for row, index in zip(sourceRows, persistentIndexes)])
+        self.layoutChanged.emit()
+
+    def setFilterText(self, text: str, column: int = -1) -> None:
+        '''
+        Keep the rows containing text (case-insensitive) in the given column, or in any column for -1
+        '''
+        text = text.lower()
+        if text == self._filterText and column == self._filterColumn:
+            return
+        # Typing more characters only narrows the current rows, their order is kept
+        cached = self._texts is not None and column == self._filterColumn
+        narrowing = cached and self._filterText in text
+        self._filterText, self._filterColumn = text, column
+        if narrowing:
+            rows = [row for row in self._rows if text in self._texts[row]]
+        else:
+            self._buildTexts() if not cached else None
+            rows = range(self.sourceModel().rowCount())
+            rows = self._order([row for row in rows if self._accepts(row)] if self._texts is not None else list(rows))
+        self._setRows(rows)
+
+    def filterText(self) -> str:
+        return self._filterText
+
+    ##### Source changes
+
+    def _onSourceReset(self) -> None:
+        self._rebuild()
+        self.endResetModel()
+
+    def _removePositions(self, positions: list[int]) -> None:
+        if len(positions) > self._incrementalLimit:
+            self.beginResetModel()
+            keep = set(positions)
+            self._rows = [row for position, row in enumerate(self._rows) if position not in keep]
+            self._positions = None
+            return self.endResetModel()
+        # Remove contiguous ranges from the bottom up so that the positions stay valid
+        positions = sorted(positions, reverse = True)
+        while positions:
+            last = first = positions.pop(0)
+            while positions and positions[0] == first - 1:
+                first = positions.pop(0)
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self._positions = None
+            self.endRemoveRows()
+
+    def _appendRows(self, rows: list[int]) -> None:
+        if len(rows) == 0:
+            return
+        ordered = self._keys is None and (len(self._rows) == 0 or rows[0] > self._rows[-1])
+        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1)
+        self._rows.extend(rows)
+        self._positions = None
+        self.endInsertRows()
+        # New rows are appended first, then merged into place in one layout change
+        self._reorder() if not ordered else None
+
+    def _onSourceRowsInserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        count = last - first + 1
+        if first < self.sourceModel().rowCount() - count:
+            self._rows = [row + count if row >= first else row for row in self._rows]
+            self._positions = None
+        self._updateCaches(first, last, insert = True)
+        self._appendRows([row for row in range(first, last + 1) if self._accepts(row)])
+
+    def _onSourceRowsAboutToBeRemoved(self, parent: QModelIndex, first: int, last: int) -> None:
+        positions = self._proxyPositions()
+        self._removePositions([positions[row] for row in range(first, last + 1) if row in positions])
+
+    def _onSourceRowsRemoved(self, parent: QModelIndex, first: int, last: int) -> None:
+        count = last - first + 1
+        self._rows = [row - count if row > last else row for row in self._rows]
+        self._positions = None
+        if self._keys is not None:
+            del self._keys[first:last + 1]
+        if self._texts is not None:
+            del self._texts[first:last + 1]
+
+    def _onSourceDataChanged(self, topLeft: QModelIndex, bottomRight: QModelIndex, roles: list = []) -> None:
+        first, last = topLeft.row(), bottomRight.row()
+        if last - first + 1 > self._incrementalLimit:
+            self.beginResetModel()
+            return self._onSourceReset()
+        self._updateCaches(first, last)
+        positions = self._proxyPositions()
+        rejected = [positions[row] for row in range(first, last + 1) if row in positions and not self._accepts(row)]
+        self._removePositions(rejected) if rejected else None
+        positions = self._proxyPositions()
+        self._appendRows([row for row in range(first, last + 1) if row not in positions and self._accepts(row)])
+        if self._keys is not None and topLeft.column() <= self._sortColumn <= bottomRight.column():
+            self._reorder()
+        positions = self._proxyPositions()
+        changed = [positions[row] for row in range(first, last + 1) if row in positions]
+        if changed:
+            self.dataChanged.emit(self.index(min(changed), topLeft.column()), self.index(max(changed), bottomRight.column()), roles)
+
+
+def _readDelimitedChunks(filePath: str, delimiter: str, encoding: str, hasHeader: bool, chunkSize: int, columnTypes: list, cancelled: threading.Event, pendingChunks: threading.Semaphore):
+    '''
+    Read a delimited text file in lists of at most chunkSize rows, values are converted to the column types on the reading thread;
+    the header row, left as is, leads the first chunk
+    '''
+    converters = [_columnConverter(columnType) for columnType in columnTypes]
+    with open(filePath, 'r', encoding = encoding, newline = '') as file:
+        reader = csv.reader(file, delimiter = delimiter)
+        chunk = [next(reader, [])] if hasHeader else []
+        for values in reader:
+            # Empty fields of typed columns are left to the column default
+            try:
+                row = [value if converter is None else converter(value) if value != '' else None for converter, value in zip(converters, values)]
+            except (ValueError, TypeError):
+                # Malformed fields fall back to the column default, like pasted or inserted values
+                row = [_coerceValueOrDefault(columnType, value) for columnType, value in zip(columnTypes, values)]
+            chunk.append(row + values[len(converters):])
+            if len(chunk) < chunkSize + hasHeader:
+                continue
+            # Wait for the table to take in earlier chunks, so that at most a few of them are held in memory
+            if not _waitForChunkRoom(pendingChunks, cancelled):
+                return
+            yield chunk
+            chunk, hasHeader = [], False
+        if chunk and _waitForChunkRoom(pendingChunks, cancelled):
+            yield chunk
+
+
+def _waitForChunkRoom(pendingChunks: threading.Semaphore, cancelled: threading.Event) -> bool:
+    # Polls the event too, so that the reader never outlives a table destroyed without cancelling
+    while not pendingChunks.acquire(timeout = 0.1):
+        if cancelled.is_set():
+            return False
+    return not cancelled.is_set()
+
+
+def _columnConverter(columnType: Optional[str]):
+    return None if columnType is None else float if columnType in ('f', 'd') else int
+
 
 class TableBase(QTableView):
     """
@@ -40,10 +971,17 @@ class TableBase(QTableView):
     """
     sorted = Signal()
 
+    cellButtonClicked = Signal(int, int)
+
+    importFinished = Signal(int)
+    importFailed = Signal(Exception)
+
+    copied = Signal(int)
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
-        self.StandardItemModel = QStandardItemModel(self)
+        self.StandardItemModel = TableItemModel(self)
         super().setModel(self.StandardItemModel)
 
         super().setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
@@ -62,24 +1000,87 @@ class TableBase(QTableView):
         self.model().insertColumn(0)
         self.model().setHorizontalHeaderItem(0, QStandardItem('Index'))
         super().horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.model().rowsInserted.connect(self.setIndex)
-        self.model().rowsRemoved.connect(self.setIndex)
-        self.sorted.connect(self.setIndex)
 
         self.isIndexShown = False
         self.setIndexHeaderVisible(True)
 
         self.setItemDelegate(TableItemDelegate(self))
+        self.itemDelegate().buttonClicked.connect(lambda index: self.cellButtonClicked.emit(self._sourceRow(index), index.column() - 1))
+
+        # Cell widgets by the source cell they were placed at; the view only hides them when their row is filtered out
+        # or the view model is switched, they are placed again or deleted with their row afterwards
+        self._cellWidgets: dict[QPersistentModelIndex, QWidget] = {}
+        self._keptCellWidgets: set[QWidget] = set()
+        self._cellWidgetTimer = QTimer(self)
+        self._cellWidgetTimer.setSingleShot(True)
+        self._cellWidgetTimer.setInterval(0)
+        self._cellWidgetTimer.timeout.connect(self._syncCellWidgets)
+        self.itemDelegate().keepEditors(self._keptCellWidgets)
+        self.itemDelegate().editorKept.connect(self._scheduleCellWidgetSync)
+        self.StandardItemModel.rowsRemoved.connect(self._scheduleCellWidgetSync)
+        self.StandardItemModel.modelReset.connect(self._scheduleCellWidgetSync)
 
         self.scrollDelegate = ScrollDelegate(self)
 
+        self.isStreaming = False
+        self._pendingRows: list[list] = []
+        self._streamTimer = QTimer(self)
+        self._streamTimer.setSingleShot(True)
+        self._streamTimer.setInterval(50)
+        self._streamTimer.timeout.connect(self.flushStream)
+
+        self.uniformRowHeight: Optional[int] = None
+
+        self.sortFilterModel: Optional[TableSortFilterProxyModel] = None
+        self._filterTimer = QTimer(self)
+        self._filterTimer.setSingleShot(True)
+        self._filterTimer.timeout.connect(lambda: self.setFilterText(self._filterEdit.text(), self._filterEditColumn) if self._filterEdit is not None else None)
+        self._filterEdit: Optional[QLineEdit] = None
+        self._filterEditColumn: Optional[int] = None
+
+        self._importManager: Optional[WorkerManager] = None
+        self._importCancelled: Optional[threading.Event] = None
+        self._importChunks: Optional[threading.Semaphore] = None
+        self._importHeader = False
+        self._importedRows = 0
+
+        self._copyJob = None
+        self._copyTimeBudget = 8
+        self._copyTimer = QTimer(self)
+        self._copyTimer.setSingleShot(True)
+        self._copyTimer.setInterval(0)
+        self._copyTimer.timeout.connect(self._runCopySlice)
+
         StyleSheetBase.Table.apply(self)
 
-    def model(self) -> QStandardItemModel:
+    def model(self) -> Union[TableItemModel, TableColumnModel]:
         return self.StandardItemModel
 
+    def setModel(self, model: Union[TableItemModel, TableColumnModel]) -> None:
+        '''
+        Plug in another model with the QStandardItemModel-like API of TableItemModel, its column 0 is shown as the index column
+        '''
+        if model is not self.StandardItemModel:
+            # Widgets of rows removed while filtered out are deleted on the next sync
+            for signal, connect in ((self.StandardItemModel.rowsRemoved, model.rowsRemoved), (self.StandardItemModel.modelReset, model.modelReset)):
+                signal.disconnect(self._scheduleCellWidgetSync)
+                connect.connect(self._scheduleCellWidgetSync)
+        self.StandardItemModel = model
+        self.sortFilterModel.setSourceModel(model) if self.sortFilterModel is not None else None
+        super().setModel(self.sortFilterModel or model)
+        super().horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        super().setColumnHidden(0, not self.isIndexShown)
+
+    def _viewIndex(self, row: int, column: int) -> QModelIndex:
+        # Rows are addressed in the source model, the view may show them through the sort/filter proxy
+        index = self.model().index(row, column)
+        return self.sortFilterModel.mapFromSource(index) if self.sortFilterModel is not None else index
+
+    def _sourceRow(self, index: QModelIndex) -> int:
+        return self.sortFilterModel.mapToSource(index).row() if self.sortFilterModel is not None else index.row()
+
     def currentRow(self) -> int:
-        return super().currentIndex().row()
+        return self._sourceRow(super().currentIndex())
 
     def insertRow(self, row: int) -> None:
         self.model().insertRow(row)
@@ -129,10 +1130,30 @@ class TableBase(QTableView):
         self.model().setItem(row, column + 1, item)
 
     def cellWidget(self, row: int, column: int) -> QWidget:
-        return super().indexWidget(self.model().index(row, column + 1))
+        return super().indexWidget(self._viewIndex(row, column + 1))
 
     def setCellWidget(self, row: int, column: int, widget: QWidget) -> None:
-        super().setIndexWidget(self.model().index(row, column + 1), widget)
+        index = QPersistentModelIndex(self.model().index(row, column + 1))
+        self._keptCellWidgets.discard(self._cellWidgets.pop(index)) if index in self._cellWidgets else None
+        super().setIndexWidget(self._viewIndex(row, column + 1), widget)
+        if index.isValid() and widget is not None:
+            self._cellWidgets[index] = widget
+            self._keptCellWidgets.add(widget)
+
+    def _scheduleCellWidgetSync(self, *args) -> None:
+        self._cellWidgetTimer.start() if self._cellWidgets else None
+
+    def _syncCellWidgets(self) -> None:
+        self._cellWidgetTimer.stop()
+        for index, widget in list(self._cellWidgets.items()):
+            if Shiboken.isValid(widget) and index.isValid():
+                viewIndex = self._viewIndex(index.row(), index.column())
+                super().setIndexWidget(viewIndex, widget) if viewIndex.isValid() and super().indexWidget(viewIndex) is not widget else None
+                continue
+            # The row is gone (or the widget was deleted from outside)
+            del self._cellWidgets[index]
+            self._keptCellWidgets.discard(widget)
+            widget.deleteLater() if Shiboken.isValid(widget) else None
 
     def setHorizontalHeaderItem(self, column: int, item: QStandardItem) -> None:
         self.model().setHorizontalHeaderItem(column + 1, item)
@@ -158,12 +1179,84 @@ class TableBase(QTableView):
             self.isIndexShown = False
 
     def setIndex(self) -> None:
-        for index in range(self.model().rowCount()):
-            self.model().setItem(index, 0, QStandardItem(f"{index + 1}"))
+        '''
+        Repaint the index column, the row numbers themselves are computed by the model
+        '''
+        if self.model().rowCount() > 0:
+            self.model().dataChanged.emit(self.model().index(0, 0), self.model().index(self.model().rowCount() - 1, 0), [Qt.DisplayRole])
+
+    def setSortFilterEnabled(self, enabled: bool = True) -> None:
+        '''
+        Show the model through a TableSortFilterProxyModel, so that sorting and filtering leave it untouched
+        '''
+        if enabled == (self.sortFilterModel is not None):
+            return
+        headerState = super().horizontalHeader().saveState()
+        # Row heights go along with the old model, they are set again by source row
+        rowHeights = {}
+        verticalHeader = super().verticalHeader()
+        if verticalHeader.count() > 0 and verticalHeader.sectionResizeMode(0) != QHeaderView.Fixed:
+            for row in range(verticalHeader.count()):
+                height = verticalHeader.sectionSize(row)
+                if height != verticalHeader.defaultSectionSize():
+                    rowHeights[self._sourceRow(super().model().index(row, 0))] = height
+        self.sortFilterModel = TableSortFilterProxyModel(self) if enabled else None
+        if enabled:
+            # Rows shown again by a wider filter get their cell widgets back
+            self.sortFilterModel.layoutChanged.connect(self._scheduleCellWidgetSync)
+            self.sortFilterModel.rowsInserted.connect(self._scheduleCellWidgetSync)
+        self.setModel(self.model())
+        super().horizontalHeader().restoreState(headerState)
+        self._syncCellWidgets()
+        for row, height in rowHeights.items():
+            super().setRowHeight(self._viewIndex(row, 0).row(), height)
+
+    def setFilterText(self, text: str, column: Optional[int] = None) -> None:
+        '''
+        Show only the rows containing text in the given column (any column if None), enabling the sort/filter proxy if needed
+        '''
+        self.setSortFilterEnabled(True)
+        self.sortFilterModel.setFilterText(text, column + 1 if column is not None else -1)
+        self._syncCellWidgets() if self._cellWidgets else None
+
+    def setFilterEdit(self, edit: QLineEdit, column: Optional[int] = None, delay: int = 100) -> None:
+        '''
+        Filter the rows as the user types in edit, keystrokes within delay ms are applied at once
+        '''
+        self._filterTimer.setInterval(delay)
+        self._filterEdit.textChanged.disconnect(self._restartFilterTimer) if self._filterEdit is not None else None
+        self._filterEdit, self._filterEditColumn = edit, column
+        edit.textChanged.connect(self._restartFilterTimer)
+
+    def _restartFilterTimer(self, text: str = '') -> None:
+        self._filterTimer.start()
+
+    def setUniformRowHeight(self, height: Optional[int] = 40) -> None:
+        '''
+        Give every row the same fixed height, declared to the vertical header and the delegate so that no row is ever measured;
+        None goes back to interactive, individually sized rows
+        '''
+        self.uniformRowHeight = height
+        verticalHeader = super().verticalHeader()
+        if height is not None:
+            verticalHeader.setMinimumSectionSize(min(verticalHeader.minimumSectionSize(), height))
+            verticalHeader.setDefaultSectionSize(height)
+            verticalHeader.setSectionResizeMode(QHeaderView.Fixed)
+        else:
+            verticalHeader.setSectionResizeMode(QHeaderView.Interactive)
+            verticalHeader.resetDefaultSectionSize()
+        self.itemDelegate().setUniformRowHeight(height)
 
     def setSectionVerticalResizeMode(self, row: int, mode: QHeaderView.ResizeMode) -> None:
         super().verticalHeader().setSectionResizeMode(row, mode)
 
+    def setColumnCellType(self, column: int, cellType: TableCellType) -> None:
+        '''
+        Paint the cells of the column as the given type, a cell can override it through TableItemDelegate.CellTypeRole
+        '''
+        self.itemDelegate().setColumnCellType(column + 1, cellType)
+        super().viewport().update()
+
     def setSectionHorizontalResizeMode(self, column: int, mode: QHeaderView.ResizeMode) -> None:
         super().horizontalHeader().setSectionResizeMode(column + 1, mode)
 
@@ -173,22 +1266,304 @@ class TableBase(QTableView):
         self.selectRow(modelIndex.row()) #if index.isValid() else None
 
     def addRow(self, layouts: list[QLayout], resizeModes: list[Optional[QHeaderView.ResizeMode]], columnWidth: list[Optional[int]], height: Optional[int], reverse: bool = False) -> None:
+        self.addRows([layouts], resizeModes, columnWidth, height, reverse)
+
+    def addRows(self, rows: list[list], resizeModes: Optional[list[Optional[QHeaderView.ResizeMode]]] = None, columnWidth: Optional[list[Optional[int]]] = None, height: Optional[int] = None, reverse: bool = False) -> None:
+        '''
+        Insert a block of rows at once, each cell being a layout or widget (placed as cell widget) or a value stored in the model
+        '''
+        if len(rows) == 0:
+            return
+        # Like calling addRow for each row, reversed rows are inserted on top one after another
+        rows = rows[::-1] if reverse else rows
         targetRow = self.rowCount() if not reverse else 0
         columnCount = self.columnCount()
-        self.insertRow(targetRow)
-        for columnCount in range(columnCount):
-            self.setCellWidget(targetRow, columnCount, QWidget())
-            self.cellWidget(targetRow, columnCount).setLayout(layouts[columnCount])
-            self.setSectionHorizontalResizeMode(columnCount, resizeModes[columnCount]) if resizeModes[columnCount] is not None else None
-            self.setColumnWidth(columnCount, columnWidth[columnCount]) if columnWidth[columnCount] is not None else None
-        self.setRowHeight(targetRow, height) if height is not None else None
+
+        updatesEnabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        self.model().insertRowValues(targetRow, [[None if isinstance(cell, (QLayout, QWidget)) else cell for cell in cells[:columnCount]] for cells in rows])
+        for row, cells in enumerate(rows, start = targetRow):
+            for column, cell in enumerate(cells[:columnCount]):
+                if isinstance(cell, QLayout):
+                    widget = QWidget()
+                    widget.setLayout(cell)
+                    self.setCellWidget(row, column, widget)
+                elif isinstance(cell, QWidget):
+                    self.setCellWidget(row, column, cell)
+        for column in range(columnCount):
+            self.setSectionHorizontalResizeMode(column, resizeModes[column]) if resizeModes is not None and resizeModes[column] is not None else None
+            self.setColumnWidth(column, columnWidth[column]) if columnWidth is not None and columnWidth[column] is not None else None
+        if height is not None and height != self.uniformRowHeight:
+            for row in range(targetRow, targetRow + len(rows)):
+                viewIndex = self._viewIndex(row, 0)
+                self.setRowHeight(viewIndex.row(), height) if viewIndex.isValid() else None
+        self.setUpdatesEnabled(updatesEnabled)
+
+    def extend(self, rows: list[list]) -> None:
+        '''
+        Append a block of rows of cell values
+        '''
+        self.addRows(rows)
 
     def delRow(self) -> None:
         self.removeRow(self.currentRow()) if self.rowCount() > 1 else None
 
     def clearRows(self):
-        while self.rowCount() > 0:
-            self.removeRow(0)
+        # A model reset drops the header sections and releases the cell widgets at once, restore the section sizes and modes afterwards
+        headerState = super().horizontalHeader().saveState()
+        self.model().clearRows()
+        super().horizontalHeader().restoreState(headerState)
+
+    def setStreamingMode(self, enabled: bool = True, maximumRowCount: int = 10000, interval: int = 50, columnTypes: Optional[list[Optional[str]]] = None) -> None:
+        '''
+        Switch to an append-only TableStreamModel holding at most maximumRowCount rows,
+        rows passed to streamRows are then inserted in one batch every interval ms;
+        the newest rows already shown are carried over with their cell widgets, column types default to those of a TableColumnModel
+        '''
+        if not enabled:
+            self.flushStream()
+            self.isStreaming = False
+            return
+        self._streamTimer.setInterval(interval)
+        if isinstance(self.model(), TableStreamModel):
+            self.model().setMaximumRowCount(maximumRowCount)
+        else:
+            previous = self.model()
+            if columnTypes is None:
+                columnTypes = [previous.columnType(column) for column in range(1, previous.columnCount())] if isinstance(previous, TableColumnModel) else [None] * self.columnCount()
+            headers = [previous.headerData(column, Qt.Horizontal) for column in range(1, previous.columnCount())]
+            model = TableStreamModel(self, columnTypes, maximumRowCount)
+            for column, header in enumerate(headers, start = 1):
+                model.setHeaderData(column, Qt.Horizontal, header) if header is not None else None
+            # Older rows would be evicted right away
+            first = max(previous.rowCount() - maximumRowCount, 0)
+            model.appendRowValues([[previous.index(row, column).data(Qt.EditRole) for column in range(1, len(columnTypes) + 1)] for row in range(first, previous.rowCount())])
+            cellWidgets, self._cellWidgets = self._cellWidgets, {}
+            headerState = super().horizontalHeader().saveState()
+            self.setModel(model)
+            super().horizontalHeader().restoreState(headerState)
+            # Cell widgets follow their rows into the new model, those of the rows left behind are deleted
+            for index, widget in cellWidgets.items():
+                if index.isValid() and index.row() >= first and index.column() <= len(columnTypes) and Shiboken.isValid(widget):
+                    self._cellWidgets[QPersistentModelIndex(model.index(index.row() - first, index.column()))] = widget
+                    continue
+                self._keptCellWidgets.discard(widget)
+                widget.deleteLater() if Shiboken.isValid(widget) else None
+            self._syncCellWidgets()
+            previous.deleteLater() if previous.parent() is self else None
+        self.isStreaming = True
+
+    def streamRows(self, rows: list[list]) -> None:
+        '''
+        Queue rows of cell values for the next batch, or append them right away outside of the streaming mode
+        '''
+        if not self.isStreaming:
+            return self.extend(rows)
+        self._pendingRows.extend(rows)
+        # Rows that would be evicted by the same batch are never inserted
+        if len(self._pendingRows) > self.model().maximumRowCount():
+            del self._pendingRows[:-self.model().maximumRowCount()]
+        self._streamTimer.start() if not self._streamTimer.isActive() else None
+
+    def streamRow(self, values: list) -> None:
+        self.streamRows([values])
+
+    def flushStream(self) -> None:
+        '''
+        Insert the queued rows, following the bottom of the table only if it was already scrolled there
+        '''
+        self._streamTimer.stop()
+        rows, self._pendingRows = self._pendingRows, []
+        if len(rows) == 0:
+            return
+        scrollBar = super().verticalScrollBar()
+        followBottom = scrollBar.value() >= scrollBar.maximum()
+        self.model().appendRowValues(rows) if isinstance(self.model(), TableStreamModel) else self.model().insertRowValues(self.rowCount(), rows)
+        super().scrollToBottom() if followBottom else None
+
+    def importCSV(self, filePath: str, delimiter: str = ',', hasHeader: bool = True, chunkSize: int = 2000, encoding: str = 'utf-8', threadPool: Optional[QThreadPool] = None) -> WorkerManager:
+        '''
+        Read a delimited text file on a worker thread and append its rows chunk by chunk,
+        values of typed TableColumnModel columns are converted while reading; emits importFinished with the number of rows
+        '''
+        self.cancelImport()
+        model = self.model()
+        columnTypes = [model.columnType(column) for column in range(1, model.columnCount())] if isinstance(model, TableColumnModel) else []
+        self._importCancelled = threading.Event()
+        self._importChunks = threading.Semaphore(2)
+        self._importHeader = hasHeader
+        self._importedRows = 0
+        self._importManager = WorkerManager(_readDelimitedChunks, threadPool = threadPool or QThreadPool.globalInstance())
+        self.destroyed.connect(lambda obj = None, cancelled = self._importCancelled: cancelled.set())
+        # Chunks still queued from a cancelled import are recognized by their event
+        signals = self._importManager.worker.signals
+        signals.result.connect(lambda rows, cancelled = self._importCancelled: self._importChunk(rows, cancelled))
+        signals.error.connect(lambda error, cancelled = self._importCancelled: self._failImport(error, cancelled))
+        signals.finished.connect(lambda cancelled = self._importCancelled: self._finishImport(cancelled))
+        self._importManager.execute(filePath, delimiter, encoding, hasHeader, chunkSize, columnTypes, self._importCancelled, self._importChunks)
+        return self._importManager
+
+    def _importChunk(self, rows: list[list], cancelled: threading.Event) -> None:
+        if cancelled is not self._importCancelled or cancelled.is_set():
+            return
+        if self._importHeader:
+            self._importHeader = False
+            headers = rows.pop(0)
+            for column, header in enumerate(headers, start = 1):
+                self.model().setHeaderData(column, Qt.Horizontal, str(header)) if column < self.model().columnCount() else None
+        # Rows read from text never hold widgets, they go to the model directly
+        self.streamRows(rows) if self.isStreaming else self.model().insertRowValues(self.rowCount(), rows)
+        self._importedRows += len(rows)
+        self._importChunks.release()
+
+    def _finishImport(self, cancelled: threading.Event) -> None:
+        if cancelled is not self._importCancelled or cancelled.is_set():
+            return
+        self._importManager = self._importCancelled = self._importChunks = None
+        self.importFinished.emit(self._importedRows)
+
+    def _failImport(self, error: Exception, cancelled: threading.Event) -> None:
+        if cancelled is not self._importCancelled or cancelled.is_set():
+            return
+        self._importManager = self._importCancelled = self._importChunks = None
+        self.importFailed.emit(error)
+
+    def cancelImport(self) -> None:
+        '''
+        Stop the running import, rows appended so far are kept
+        '''
+        if self._importCancelled is None:
+            return
+        self._importCancelled.set()
+        # Wake the reader up in case it waits for room
+        self._importChunks.release()
+        self._importManager = self._importCancelled = self._importChunks = None
+
+    def isImporting(self) -> bool:
+        return self._importManager is not None
+
+    def exportCSV(self, filePath: str, delimiter: str = ',', includeHeader: bool = True, encoding: str = 'utf-8') -> int:
+        '''
+        Write the rows in view order (sorted and filtered) to a delimited text file, one row at a time; return the number of rows
+        '''
+        model = self.model()
+        rows = self.sortFilterModel.sourceRows() if self.sortFilterModel is not None else range(model.rowCount())
+        count = 0
+        with open(filePath, 'w', encoding = encoding, newline = '') as file:
+            writer = csv.writer(file, delimiter = delimiter)
+            if includeHeader:
+                writer.writerow(['' if header is None else header for header in (model.headerData(column, Qt.Horizontal) for column in range(1, model.columnCount()))])
+            for row in rows:
+                writer.writerow(['' if value is None else value for value in model.rowValues(row)])
+                count += 1
+        return count
+
+    def _viewRowsToSource(self, viewRows: range) -> list[int]:
+        if self.sortFilterModel is None:
+            return list(viewRows)
+        sourceRows = self.sortFilterModel.sourceRows()
+        return sourceRows[viewRows.start:viewRows.stop]
+
+    def _selectionBlock(self) -> tuple[range, range]:
+        # Bounding block of the selection (or the current cell) in view rows and model columns, the index column left out
+        ranges = super().selectionModel().selection() if super().selectionModel() is not None else []
+        if len(ranges) > 0:
+            top, bottom = min(r.top() for r in ranges), max(r.bottom() for r in ranges)
+            left, right = min(r.left() for r in ranges), max(r.right() for r in ranges)
+        else:
+            index = super().currentIndex()
+            if not index.isValid():
+                return range(0), range(0)
+            top = bottom = index.row()
+            left = right = index.column()
+        return range(top, bottom + 1), range(max(left, 1), right + 1)
+
+    def _serializeBlock(self, rows: list[int], columns: range):
+        tsvFile, csvFile, htmlFile = io.StringIO(), io.StringIO(), io.StringIO()
+        tsvWriter = csv.writer(tsvFile, dialect = 'excel-tab', lineterminator = '\n')
+        csvWriter = csv.writer(csvFile, lineterminator = '\n')
+        htmlFile.write('<table>')
+        model = self.model()
+        for count, row in enumerate(rows, start = 1):
+            values = model.rowValues(row)
+            cells = ['' if values[column - 1] is None else values[column - 1] for column in columns]
+            tsvWriter.writerow(cells)
+            csvWriter.writerow(cells)
+            htmlFile.write('<tr>' + ''.join(f'<td>{html.escape(str(cell))}</td>' for cell in cells) + '</tr>')
+            if count % 256 == 0:
+                yield
+        htmlFile.write('</table>')
+        mimeData = QMimeData()
+        mimeData.setText(tsvFile.getvalue())
+        mimeData.setData('text/csv', csvFile.getvalue().encode('utf-8'))
+        mimeData.setHtml(htmlFile.getvalue())
+        QApplication.clipboard().setMimeData(mimeData)
+        self.copied.emit(len(rows))
+
+    def copySelection(self, timeBudget: int = 8) -> None:
+        '''
+        Put the selected block on the clipboard as TSV (text/plain), CSV (text/csv) and HTML, read straight from the model;
+        large blocks are serialized in slices of timeBudget ms between events, copied is emitted once the clipboard is set
+        '''
+        viewRows, columns = self._selectionBlock()
+        if len(viewRows) == 0 or len(columns) == 0:
+            return
+        self._copyTimer.stop()
+        self._copyTimeBudget = max(timeBudget, 1)
+        self._copyJob = self._serializeBlock(self._viewRowsToSource(viewRows), columns)
+        self._runCopySlice()
+
+    def _runCopySlice(self) -> None:
+        if self._copyJob is None:
+            return
+        deadline = time.perf_counter() + self._copyTimeBudget / 1000
+        for _ in self._copyJob:
+            if time.perf_counter() >= deadline:
+                self._copyTimer.start()
+                return
+        self._copyJob = None
+
+    def isCopying(self) -> bool:
+        return self._copyJob is not None
+
+    def paste(self) -> int:
+        '''
+        Write the clipboard block (text/csv, else tab separated text) over the cells from the top-left selected cell on,
+        one block per run of consecutive model rows; cells beyond the last row or column are dropped, return the number of rows written
+        '''
+        mimeData = QApplication.clipboard().mimeData()
+        if mimeData is None:
+            return 0
+        if mimeData.hasFormat('text/csv'):
+            block = list(csv.reader(io.StringIO(bytes(mimeData.data('text/csv')).decode('utf-8')), dialect = 'excel'))
+        else:
+            block = list(csv.reader(io.StringIO(mimeData.text()), dialect = 'excel-tab'))
+        viewRows, columns = self._selectionBlock()
+        if len(block) == 0 or len(viewRows) == 0:
+            return 0
+        model = self.model()
+        column = max(columns.start, 1)
+        width = model.columnCount() - column
+        sourceRows = self._viewRowsToSource(range(viewRows.start, min(viewRows.start + len(block), (self.sortFilterModel or model).rowCount())))
+        columnTypes = [model.columnType(cellColumn) for cellColumn in range(column, model.columnCount())] if isinstance(model, TableColumnModel) else [None] * width
+        # Text that does not fit a typed column falls back to the column default instead of failing the paste
+        block = [[_coerceValueOrDefault(columnType, value) for columnType, value in zip(columnTypes, values[:width])] for values in block[:len(sourceRows)]]
+        # Rows consecutive in the model are written as one block, whatever their order in the view
+        cells = sorted(zip(sourceRows, block), key = lambda pair: pair[0])
+        start = 0
+        for end in range(1, len(cells) + 1):
+            if end == len(cells) or cells[end][0] != cells[end - 1][0] + 1:
+                model.setBlockValues(cells[start][0], column, [values for _, values in cells[start:end]])
+                start = end
+        return len(cells)
+
+    def keyPressEvent(self, event: QKeyEvent) -> None:
+        if event.matches(QKeySequence.Copy):
+            self.copySelection()
+        elif event.matches(QKeySequence.Paste) and super().editTriggers() != QAbstractItemView.NoEditTriggers:
+            self.paste()
+        else:
+            super().keyPressEvent(event)
 
     def setBorderless(self, borderless: bool) -> None:
         self.setProperty("isBorderless", borderless)
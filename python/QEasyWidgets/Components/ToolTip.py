@@ -1,10 +1,9 @@
 from typing import Optional, overload
-from PyEasyUtils import singledispatchmethod
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
 
-from ..Common.Config import Position
+from ..Common.Config import Position, singledispatchmethod
 from ..Common.StyleSheet import StyleSheetBase
 from ..Common.QFunctions import getCurrentScreen, getScreenGeometry, setDropShadowEffect, setOpacityEffect
 
@@ -1,23 +1,46 @@
-from .Widget import WidgetBase
-from .Label import LabelBase
-from .ToolTip import ToolTipBase, ToolTipEventFilter
-from .Button import ButtonBase, MenuButton, NavigationButton, HollowButton
-from .CheckBox import CheckBoxBase
-from .ScrollArea import ScrollAreaBase, VerticalScrollArea
-from .Tree import TreeWidgetBase
-from .List import ListBase
-from .ToolBox import ToolBoxBase
-from .GroupBox import GroupBoxBase
-from .Slider import SliderBase
-from .SpinBox import SpinBoxBase, DoubleSpinBoxBase
-from .ComboBox import ComboBoxBase
-from .Edit import LineEditBase, TextEditBase
-from .Browser import TextBrowserBase
-from .ProgressBar import ProgressBarBase
-from .Player import MediaPlayerBase
-from .Tab import TabWidgetBase
-from .Table import TableBase
-from .ChatWidget import ChatRole, ChatWidgetBase
-from .StatusWidget import StatusWidgetBase
-from .DockWidget import DockWidgetBase
-from .Menu import MenuBase
\ No newline at end of file
+import importlib
+
+##############################################################################################################################
+
+# Components are only imported on first access: module -> names
+_lazyModules = {
+    '.Widget': ['WidgetBase'],
+    '.Label': ['LabelBase'],
+    '.ToolTip': ['ToolTipBase', 'ToolTipEventFilter'],
+    '.Button': ['ButtonBase', 'MenuButton', 'NavigationButton', 'HollowButton'],
+    '.CheckBox': ['CheckBoxBase'],
+    '.ScrollArea': ['ScrollAreaBase', 'VerticalScrollArea'],
+    '.Tree': ['TreeWidgetBase'],
+    '.List': ['ListBase'],
+    '.ToolBox': ['ToolBoxBase'],
+    '.GroupBox': ['GroupBoxBase'],
+    '.Slider': ['SliderBase'],
+    '.SpinBox': ['SpinBoxBase', 'DoubleSpinBoxBase'],
+    '.ComboBox': ['ComboBoxBase'],
+    '.Edit': ['LineEditBase', 'TextEditBase'],
+    '.Browser': ['TextBrowserBase'],
+    '.ProgressBar': ['ProgressBarBase'],
+    '.Player': ['MediaPlayerBase'],
+    '.Tab': ['TabWidgetBase'],
+    '.Table': ['TableCellType', 'TableItemDelegate', 'TableItemModel', 'TableColumnModel', 'TableStreamModel', 'TableSortFilterProxyModel', 'TableBase'],
+    '.ChatWidget': ['ChatRole', 'ChatWidgetBase'],
+    '.StatusWidget': ['StatusWidgetBase'],
+    '.DockWidget': ['DockWidgetBase'],
+    '.Menu': ['MenuBase'],
+}
+
+_lazyAttributes = {name: moduleName for moduleName, names in _lazyModules.items() for name in names}
+
+__all__ = list(_lazyAttributes)
+
+
+def __getattr__(name: str):
+    if name not in _lazyAttributes:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_lazyAttributes[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazyAttributes))
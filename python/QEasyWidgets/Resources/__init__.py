@@ -0,0 +1,57 @@
+import importlib
+from typing import Optional
+from PySide6.QtCore import QResource
+
+##############################################################################################################################
+
+# Resources are split into one bundle per (kind, theme), each compiled from its own sources_<kind>_<theme>.qrc
+_bundles = {
+    ('Icons', 'dark'): '.sources_icons_dark',
+    ('Icons', 'light'): '.sources_icons_light',
+    ('QSS', 'dark'): '.sources_qss_dark',
+    ('QSS', 'light'): '.sources_qss_light',
+}
+
+_loadedBundles: set[tuple[str, str]] = set()
+
+
+def _matchBundles(kind: Optional[str] = None, theme: Optional[str] = None) -> list[tuple[str, str]]:
+    return [key for key in _bundles if kind in (None, key[0]) and theme in (None, key[1])]
+
+
+def loadResources(
+    kind: Optional[str] = None,
+    theme: Optional[str] = None
+):
+    '''
+    Register the embedded Qt resources of the given kind ('Icons' or 'QSS') and theme on first use,
+    every bundle matching the unspecified arguments is registered
+    '''
+    for key in _matchBundles(kind, theme):
+        if key in _loadedBundles:
+            continue
+        importlib.import_module(_bundles[key], __name__)
+        _loadedBundles.add(key)
+
+
+def registerResourceFile(
+    fileName: str,
+    kind: Optional[str] = None,
+    theme: Optional[str] = None
+) -> bool:
+    '''
+    Register an external binary resource file (e.g. built by `pyside6-rcc --binary sources_qss_dark.qrc -o qss_dark.rcc`),
+    Qt memory-maps the file instead of copying it into the heap;
+    the embedded bundles it covers (by kind and theme) are not loaded afterwards
+    '''
+    if not QResource.registerResource(fileName):
+        return False
+    _loadedBundles.update(_matchBundles(kind, theme))
+    return True
+
+
+def isResourcesLoaded(
+    kind: Optional[str] = None,
+    theme: Optional[str] = None
+) -> bool:
+    return all(key in _loadedBundles for key in _matchBundles(kind, theme))
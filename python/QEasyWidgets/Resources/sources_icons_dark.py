@@ -0,0 +1,780 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.8.2
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x02\x22\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-fullscreen-\
+exit\x22 viewBox=\x220\
+ 0 16 16\x22>\x0a  <pa\
+th d=\x22M5.5 0a.5.\
+5 0 0 1 .5.5v4A1\
+.5 1.5 0 0 1 4.5\
+ 6h-4a.5.5 0 0 1\
+ 0-1h4a.5.5 0 0 \
+0 .5-.5v-4a.5.5 \
+0 0 1 .5-.5m5 0a\
+.5.5 0 0 1 .5.5v\
+4a.5.5 0 0 0 .5.\
+5h4a.5.5 0 0 1 0\
+ 1h-4A1.5 1.5 0 \
+0 1 10 4.5v-4a.5\
+.5 0 0 1 .5-.5M0\
+ 10.5a.5.5 0 0 1\
+ .5-.5h4A1.5 1.5\
+ 0 0 1 6 11.5v4a\
+.5.5 0 0 1-1 0v-\
+4a.5.5 0 0 0-.5-\
+.5h-4a.5.5 0 0 1\
+-.5-.5m10 1a1.5 \
+1.5 0 0 1 1.5-1.\
+5h4a.5.5 0 0 1 0\
+ 1h-4a.5.5 0 0 0\
+-.5.5v4a.5.5 0 0\
+ 1-1 0z\x22/>\x0a</svg\
+>\
+\x00\x00\x01n\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-send\x22 viewB\
+ox=\x220 0 16 16\x22>\x0a\
+  <path d=\x22M15.8\
+54.146a.5.5 0 0 \
+1 .11.54l-5.819 \
+14.547a.75.75 0 \
+0 1-1.329.124l-3\
+.178-4.995L.643 \
+7.184a.75.75 0 0\
+ 1 .124-1.33L15.\
+314.037a.5.5 0 0\
+ 1 .54.11ZM6.636\
+ 10.07l2.761 4.3\
+38L14.13 2.576zm\
+6.787-8.201L1.59\
+1 6.602l4.339 2.\
+76z\x22/>\x0a</svg>\
+\x00\x00\x013\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-chevron-com\
+pact-right\x22 view\
+Box=\x220 0 16 16\x22>\
+\x0a  <path fill-ru\
+le=\x22evenodd\x22 d=\x22\
+M6.776 1.553a.5.\
+5 0 0 1 .671.223\
+l3 6a.5.5 0 0 1 \
+0 .448l-3 6a.5.5\
+ 0 1 1-.894-.448\
+L9.44 8 6.553 2.\
+224a.5.5 0 0 1 .\
+223-.671\x22/>\x0a</sv\
+g>\
+\x00\x00\x01\x11\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-chevron-up\x22\
+ viewBox=\x220 0 16\
+ 16\x22>\x0a  <path fi\
+ll-rule=\x22evenodd\
+\x22 d=\x22M7.646 4.64\
+6a.5.5 0 0 1 .70\
+8 0l6 6a.5.5 0 0\
+ 1-.708.708L8 5.\
+707l-5.646 5.647\
+a.5.5 0 0 1-.708\
+-.708z\x22/>\x0a</svg>\
+\
+\x00\x00\x01[\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-play-circle\
+\x22 viewBox=\x220 0 1\
+6 16\x22>\x0a  <path d\
+=\x22M8 15A7 7 0 1 \
+1 8 1a7 7 0 0 1 \
+0 14m0 1A8 8 0 1\
+ 0 8 0a8 8 0 0 0\
+ 0 16\x22/>\x0a  <path\
+ d=\x22M6.271 5.055\
+a.5.5 0 0 1 .52.\
+038l3.5 2.5a.5.5\
+ 0 0 1 0 .814l-3\
+.5 2.5A.5.5 0 0 \
+1 6 10.5v-5a.5.5\
+ 0 0 1 .271-.445\
+\x22/>\x0a</svg>\
+\x00\x00\x01\xa5\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-scissors\x22 v\
+iewBox=\x220 0 16 1\
+6\x22>\x0a  <path d=\x22M\
+3.5 3.5c-.614-.8\
+84-.074-1.962.85\
+8-2.5L8 7.226 11\
+.642 1c.932.538 \
+1.472 1.616.858 \
+2.5L8.81 8.61l1.\
+556 2.661a2.5 2.\
+5 0 1 1-.794.637\
+L8 9.73l-1.572 2\
+.177a2.5 2.5 0 1\
+ 1-.794-.637L7.1\
+9 8.61zm2.5 10a1\
+.5 1.5 0 1 0-3 0\
+ 1.5 1.5 0 0 0 3\
+ 0m7 0a1.5 1.5 0\
+ 1 0-3 0 1.5 1.5\
+ 0 0 0 3 0\x22/>\x0a</\
+svg>\
+\x00\x00\x02=\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-arrow-repea\
+t\x22 viewBox=\x220 0 \
+16 16\x22>\x0a  <path \
+d=\x22M11.534 7h3.9\
+32a.25.25 0 0 1 \
+.192.41l-1.966 2\
+.36a.25.25 0 0 1\
+-.384 0l-1.966-2\
+.36a.25.25 0 0 1\
+ .192-.41m-11 2h\
+3.932a.25.25 0 0\
+ 0 .192-.41L2.69\
+2 6.23a.25.25 0 \
+0 0-.384 0L.342 \
+8.59A.25.25 0 0 \
+0 .534 9\x22/>\x0a  <p\
+ath fill-rule=\x22e\
+venodd\x22 d=\x22M8 3c\
+-1.552 0-2.94.70\
+7-3.857 1.818a.5\
+.5 0 1 1-.771-.6\
+36A6.002 6.002 0\
+ 0 1 13.917 7H12\
+.9A5 5 0 0 0 8 3\
+M3.1 9a5.002 5.0\
+02 0 0 0 8.757 2\
+.182.5.5 0 1 1 .\
+771.636A6.002 6.\
+002 0 0 1 2.083 \
+9z\x22/>\x0a</svg>\
+\x00\x00\x01&\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-chevron-lef\
+t\x22 viewBox=\x220 0 \
+16 16\x22>\x0a  <path \
+fill-rule=\x22eveno\
+dd\x22 d=\x22M11.354 1\
+.646a.5.5 0 0 1 \
+0 .708L5.707 8l5\
+.647 5.646a.5.5 \
+0 0 1-.708.708l-\
+6-6a.5.5 0 0 1 0\
+-.708l6-6a.5.5 0\
+ 0 1 .708 0\x22/>\x0a<\
+/svg>\
+\x00\x00\x01:\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-x-lg\x22 viewB\
+ox=\x220 0 16 16\x22>\x0a\
+  <path d=\x22M2.14\
+6 2.854a.5.5 0 1\
+ 1 .708-.708L8 7\
+.293l5.146-5.147\
+a.5.5 0 0 1 .708\
+.708L8.707 8l5.1\
+47 5.146a.5.5 0 \
+0 1-.708.708L8 8\
+.707l-5.146 5.14\
+7a.5.5 0 0 1-.70\
+8-.708L7.293 8z\x22\
+/>\x0a</svg>\
+\x00\x00\x03\x08\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-cloud-downl\
+oad\x22 viewBox=\x220 \
+0 16 16\x22>\x0a  <pat\
+h d=\x22M4.406 1.34\
+2A5.53 5.53 0 0 \
+1 8 0c2.69 0 4.9\
+23 2 5.166 4.579\
+C14.758 4.804 16\
+ 6.137 16 7.773 \
+16 9.569 14.502 \
+11 12.687 11H10a\
+.5.5 0 0 1 0-1h2\
+.688C13.979 10 1\
+5 8.988 15 7.773\
+c0-1.216-1.02-2.\
+228-2.313-2.228h\
+-.5v-.5C12.188 2\
+.825 10.328 1 8 \
+1a4.53 4.53 0 0 \
+0-2.941 1.1c-.75\
+7.652-1.153 1.43\
+8-1.153 2.055v.4\
+48l-.445.049C2.0\
+64 4.805 1 5.952\
+ 1 7.318 1 8.785\
+ 2.23 10 3.781 1\
+0H6a.5.5 0 0 1 0\
+ 1H3.781C1.708 1\
+1 0 9.366 0 7.31\
+8c0-1.763 1.266-\
+3.223 2.942-3.59\
+3.143-.863.698-1\
+.723 1.464-2.383\
+\x22/>\x0a  <path d=\x22M\
+7.646 15.854a.5.\
+5 0 0 0 .708 0l3\
+-3a.5.5 0 0 0-.7\
+08-.708L8.5 14.2\
+93V5.5a.5.5 0 0 \
+0-1 0v8.793l-2.1\
+46-2.147a.5.5 0 \
+0 0-.708.708z\x22/>\
+\x0a</svg>\
+\x00\x00\x01\xee\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-clipboard\x22 \
+viewBox=\x220 0 16 \
+16\x22>\x0a  <path d=\x22\
+M4 1.5H3a2 2 0 0\
+ 0-2 2V14a2 2 0 \
+0 0 2 2h10a2 2 0\
+ 0 0 2-2V3.5a2 2\
+ 0 0 0-2-2h-1v1h\
+1a1 1 0 0 1 1 1V\
+14a1 1 0 0 1-1 1\
+H3a1 1 0 0 1-1-1\
+V3.5a1 1 0 0 1 1\
+-1h1z\x22/>\x0a  <path\
+ d=\x22M9.5 1a.5.5 \
+0 0 1 .5.5v1a.5.\
+5 0 0 1-.5.5h-3a\
+.5.5 0 0 1-.5-.5\
+v-1a.5.5 0 0 1 .\
+5-.5zm-3-1A1.5 1\
+.5 0 0 0 5 1.5v1\
+A1.5 1.5 0 0 0 6\
+.5 4h3A1.5 1.5 0\
+ 0 0 11 2.5v-1A1\
+.5 1.5 0 0 0 9.5\
+ 0z\x22/>\x0a</svg>\
+\x00\x00\x01'\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-chevron-dow\
+n\x22 viewBox=\x220 0 \
+16 16\x22>\x0a  <path \
+fill-rule=\x22eveno\
+dd\x22 d=\x22M1.646 4.\
+646a.5.5 0 0 1 .\
+708 0L8 10.293l5\
+.646-5.647a.5.5 \
+0 0 1 .708.708l-\
+6 6a.5.5 0 0 1-.\
+708 0l-6-6a.5.5 \
+0 0 1 0-.708\x22/>\x0a\
+</svg>\
+\x00\x00\x01\x9c\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-copy\x22 viewB\
+ox=\x220 0 16 16\x22>\x0a\
+  <path fill-rul\
+e=\x22evenodd\x22 d=\x22M\
+4 2a2 2 0 0 1 2-\
+2h8a2 2 0 0 1 2 \
+2v8a2 2 0 0 1-2 \
+2H6a2 2 0 0 1-2-\
+2zm2-1a1 1 0 0 0\
+-1 1v8a1 1 0 0 0\
+ 1 1h8a1 1 0 0 0\
+ 1-1V2a1 1 0 0 0\
+-1-1zM2 5a1 1 0 \
+0 0-1 1v8a1 1 0 \
+0 0 1 1h8a1 1 0 \
+0 0 1-1v-1h1v1a2\
+ 2 0 0 1-2 2H2a2\
+ 2 0 0 1-2-2V6a2\
+ 2 0 0 1 2-2h1v1\
+z\x22/>\x0a</svg>\
+\x00\x00\x01(\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-chevron-rig\
+ht\x22 viewBox=\x220 0\
+ 16 16\x22>\x0a  <path\
+ fill-rule=\x22even\
+odd\x22 d=\x22M4.646 1\
+.646a.5.5 0 0 1 \
+.708 0l6 6a.5.5 \
+0 0 1 0 .708l-6 \
+6a.5.5 0 0 1-.70\
+8-.708L10.293 8 \
+4.646 2.354a.5.5\
+ 0 0 1 0-.708\x22/>\
+\x0a</svg>\
+\x00\x00\x01O\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-stop-circle\
+\x22 viewBox=\x220 0 1\
+6 16\x22>\x0a  <path d\
+=\x22M8 15A7 7 0 1 \
+1 8 1a7 7 0 0 1 \
+0 14m0 1A8 8 0 1\
+ 0 8 0a8 8 0 0 0\
+ 0 16\x22/>\x0a  <path\
+ d=\x22M5 6.5A1.5 1\
+.5 0 0 1 6.5 5h3\
+A1.5 1.5 0 0 1 1\
+1 6.5v3A1.5 1.5 \
+0 0 1 9.5 11h-3A\
+1.5 1.5 0 0 1 5 \
+9.5z\x22/>\x0a</svg>\
+\x00\x00\x02q\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-folder2-ope\
+n\x22 viewBox=\x220 0 \
+16 16\x22>\x0a  <path \
+d=\x22M1 3.5A1.5 1.\
+5 0 0 1 2.5 2h2.\
+764c.958 0 1.76.\
+56 2.311 1.184C7\
+.985 3.648 8.48 \
+4 9 4h4.5A1.5 1.\
+5 0 0 1 15 5.5v.\
+64c.57.265.94.87\
+6.856 1.546l-.64\
+ 5.124A2.5 2.5 0\
+ 0 1 12.733 15H3\
+.266a2.5 2.5 0 0\
+ 1-2.481-2.19l-.\
+64-5.124A1.5 1.5\
+ 0 0 1 1 6.14zM2\
+ 6h12v-.5a.5.5 0\
+ 0 0-.5-.5H9c-.9\
+64 0-1.71-.629-2\
+.174-1.154C6.374\
+ 3.334 5.82 3 5.\
+264 3H2.5a.5.5 0\
+ 0 0-.5.5zm-.367\
+ 1a.5.5 0 0 0-.4\
+96.562l.64 5.124\
+A1.5 1.5 0 0 0 3\
+.266 14h9.468a1.\
+5 1.5 0 0 0 1.48\
+9-1.314l.64-5.12\
+4A.5.5 0 0 0 14.\
+367 7z\x22/>\x0a</svg>\
+\
+\x00\x00\x01_\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-pause-circl\
+e\x22 viewBox=\x220 0 \
+16 16\x22>\x0a  <path \
+d=\x22M8 15A7 7 0 1\
+ 1 8 1a7 7 0 0 1\
+ 0 14m0 1A8 8 0 \
+1 0 8 0a8 8 0 0 \
+0 0 16\x22/>\x0a  <pat\
+h d=\x22M5 6.25a1.2\
+5 1.25 0 1 1 2.5\
+ 0v3.5a1.25 1.25\
+ 0 1 1-2.5 0zm3.\
+5 0a1.25 1.25 0 \
+1 1 2.5 0v3.5a1.\
+25 1.25 0 1 1-2.\
+5 0z\x22/>\x0a</svg>\
+\x00\x00\x01/\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-chevron-com\
+pact-left\x22 viewB\
+ox=\x220 0 16 16\x22>\x0a\
+  <path fill-rul\
+e=\x22evenodd\x22 d=\x22M\
+9.224 1.553a.5.5\
+ 0 0 1 .223.67L6\
+.56 8l2.888 5.77\
+6a.5.5 0 1 1-.89\
+4.448l-3-6a.5.5 \
+0 0 1 0-.448l3-6\
+a.5.5 0 0 1 .67-\
+.223\x22/>\x0a</svg>\
+\x00\x00\x00\xe7\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-dash-lg\x22 vi\
+ewBox=\x220 0 16 16\
+\x22>\x0a  <path fill-\
+rule=\x22evenodd\x22 d\
+=\x22M2 8a.5.5 0 0 \
+1 .5-.5h11a.5.5 \
+0 0 1 0 1h-11A.5\
+.5 0 0 1 2 8\x22/>\x0a\
+</svg>\
+\x00\x00\x01\x16\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-three-dots\x22\
+ viewBox=\x220 0 16\
+ 16\x22>\x0a  <path d=\
+\x22M3 9.5a1.5 1.5 \
+0 1 1 0-3 1.5 1.\
+5 0 0 1 0 3m5 0a\
+1.5 1.5 0 1 1 0-\
+3 1.5 1.5 0 0 1 \
+0 3m5 0a1.5 1.5 \
+0 1 1 0-3 1.5 1.\
+5 0 0 1 0 3\x22/>\x0a<\
+/svg>\
+\x00\x00\x02\x1e\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-fullscreen\x22\
+ viewBox=\x220 0 16\
+ 16\x22>\x0a  <path d=\
+\x22M1.5 1a.5.5 0 0\
+ 0-.5.5v4a.5.5 0\
+ 0 1-1 0v-4A1.5 \
+1.5 0 0 1 1.5 0h\
+4a.5.5 0 0 1 0 1\
+zM10 .5a.5.5 0 0\
+ 1 .5-.5h4A1.5 1\
+.5 0 0 1 16 1.5v\
+4a.5.5 0 0 1-1 0\
+v-4a.5.5 0 0 0-.\
+5-.5h-4a.5.5 0 0\
+ 1-.5-.5M.5 10a.\
+5.5 0 0 1 .5.5v4\
+a.5.5 0 0 0 .5.5\
+h4a.5.5 0 0 1 0 \
+1h-4A1.5 1.5 0 0\
+ 1 0 14.5v-4a.5.\
+5 0 0 1 .5-.5m15\
+ 0a.5.5 0 0 1 .5\
+.5v4a1.5 1.5 0 0\
+ 1-1.5 1.5h-4a.5\
+.5 0 0 1 0-1h4a.\
+5.5 0 0 0 .5-.5v\
+-4a.5.5 0 0 1 .5\
+-.5\x22/>\x0a</svg>\
+\x00\x00\x01c\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 fi\
+ll=\x22rgb(201, 210\
+, 222)\x22 class=\x22b\
+i bi-arrow-clock\
+wise\x22 viewBox=\x220\
+ 0 16 16\x22>\x0a  <pa\
+th fill-rule=\x22ev\
+enodd\x22 d=\x22M8 3a5\
+ 5 0 1 0 4.546 2\
+.914.5.5 0 0 1 .\
+908-.417A6 6 0 1\
+ 1 8 2z\x22/>\x0a  <pa\
+th d=\x22M8 4.466V.\
+534a.25.25 0 0 1\
+ .41-.192l2.36 1\
+.966c.12.1.12.28\
+4 0 .384L8.41 4.\
+658A.25.25 0 0 1\
+ 8 4.466\x22/>\x0a</sv\
+g>\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00O\xa6S\
+\x00I\
+\x00c\x00o\x00n\x00s\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x04\
+\x00\x06\xa8\x8b\
+\x00d\
+\x00a\x00r\x00k\
+\x00\x13\
+\x09{\x1d\x87\
+\x00F\
+\x00u\x00l\x00l\x00S\x00c\x00r\x00e\x00e\x00n\x00-\x00E\x00x\x00i\x00t\x00.\x00s\
+\x00v\x00g\
+\x00\x08\
+\x0cGQ\xe7\
+\x00S\
+\x00e\x00n\x00d\x00.\x00s\x00v\x00g\
+\x00\x18\
+\x00 \x8b\xc7\
+\x00C\
+\x00o\x00m\x00p\x00a\x00c\x00t\x00C\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00R\x00i\
+\x00g\x00h\x00t\x00.\x00s\x00v\x00g\
+\x00\x0e\
+\x0fXd\x87\
+\x00C\
+\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00U\x00p\x00.\x00s\x00v\x00g\
+\x00\x08\
+\x02\x8cP'\
+\x00P\
+\x00l\x00a\x00y\x00.\x00s\x00v\x00g\
+\x00\x0c\
+\x0d\xa2O\x87\
+\x00S\
+\x00c\x00i\x00s\x00s\x00o\x00r\x00s\x00.\x00s\x00v\x00g\
+\x00\x10\
+\x06\xd0dG\
+\x00A\
+\x00r\x00r\x00o\x00w\x00-\x00R\x00e\x00p\x00e\x00a\x00t\x00.\x00s\x00v\x00g\
+\x00\x10\
+\x00\xe9\x05\xa7\
+\x00C\
+\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00L\x00e\x00f\x00t\x00.\x00s\x00v\x00g\
+\x00\x05\
+\x00[Z\xc7\
+\x00X\
+\x00.\x00s\x00v\x00g\
+\x00\x0c\
+\x0c\x1a\x90\xa7\
+\x00D\
+\x00o\x00w\x00n\x00l\x00o\x00a\x00d\x00.\x00s\x00v\x00g\
+\x00\x0d\
+\x0c\xe7\x89G\
+\x00C\
+\x00l\x00i\x00p\x00b\x00o\x00a\x00r\x00d\x00.\x00s\x00v\x00g\
+\x00\x10\
+\x0e\x1f\x02\x87\
+\x00C\
+\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00D\x00o\x00w\x00n\x00.\x00s\x00v\x00g\
+\x00\x08\
+\x06|S\x87\
+\x00C\
+\x00o\x00p\x00y\x00.\x00s\x00v\x00g\
+\x00\x11\
+\x0e\x12\xb8G\
+\x00C\
+\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00R\x00i\x00g\x00h\x00t\x00.\x00s\x00v\x00g\
+\
+\x00\x08\
+\x0bcQ\x87\
+\x00S\
+\x00t\x00o\x00p\x00.\x00s\x00v\x00g\
+\x00\x10\
+\x03\xa1m\x87\
+\x00O\
+\x00p\x00e\x00n\x00e\x00d\x00F\x00o\x00l\x00d\x00e\x00r\x00.\x00s\x00v\x00g\
+\x00\x09\
+\x0c\x98\xf7\xc7\
+\x00P\
+\x00a\x00u\x00s\x00e\x00.\x00s\x00v\x00g\
+\x00\x17\
+\x0c\x0a&\x87\
+\x00C\
+\x00o\x00m\x00p\x00a\x00c\x00t\x00C\x00h\x00e\x00v\x00r\x00o\x00n\x00-\x00L\x00e\
+\x00f\x00t\x00.\x00s\x00v\x00g\
+\x00\x08\
+\x08\x9bS\x87\
+\x00D\
+\x00a\x00s\x00h\x00.\x00s\x00v\x00g\
+\x00\x0c\
+\x03\x84:'\
+\x00E\
+\x00l\x00l\x00i\x00p\x00s\x00i\x00s\x00.\x00s\x00v\x00g\
+\x00\x0e\
+\x03\xe2|\xa7\
+\x00F\
+\x00u\x00l\x00l\x00S\x00c\x00r\x00e\x00e\x00n\x00.\x00s\x00v\x00g\
+\x00\x13\
+\x06\x9a\xb5'\
+\x00A\
+\x00r\x00r\x00o\x00w\x00-\x00C\x00l\x00o\x00c\x00k\x00w\x00i\x00s\x00e\x00.\x00s\
+\x00v\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00 \x00\x02\x00\x00\x00\x16\x00\x00\x00\x04\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00p\x00\x00\x00\x00\x00\x01\x00\x00\x03\x98\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01H\x00\x00\x00\x00\x00\x01\x00\x00\x0cW\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\x22\x00\x00\x00\x00\x00\x01\x00\x00\x0b-\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00\xc8\x00\x00\x00\x00\x00\x01\x00\x00\x05\xe4\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x02\x98\x00\x00\x00\x00\x00\x01\x00\x00\x1d\xd3\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x02\x10\x00\x00\x00\x00\x00\x01\x00\x00\x17\xdd\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x02\xb6\x00\x00\x00\x00\x00\x01\x00\x00\x1e\xed\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\xbc\x00\x00\x00\x00\x00\x01\x00\x00\x13\xbe\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x02\xd8\x00\x00\x00\x00\x00\x01\x00\x00!\x0f\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x08\xec\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x02\x82\x00\x00\x00\x00\x00\x01\x00\x00\x1c\xe8\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00.\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x00\x16\x8a\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x02N\x00\x00\x00\x00\x00\x01\x00\x00\x1b\xb5\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01X\x00\x00\x00\x00\x00\x01\x00\x00\x0d\x95\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00Z\x00\x00\x00\x00\x00\x01\x00\x00\x02&\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x026\x00\x00\x00\x00\x00\x01\x00\x00\x1aR\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01v\x00\x00\x00\x00\x00\x01\x00\x00\x10\xa1\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00\xde\x00\x00\x00\x00\x00\x01\x00\x00\x07C\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\xd2\x00\x00\x00\x00\x00\x01\x00\x00\x15^\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\x96\x00\x00\x00\x00\x00\x01\x00\x00\x12\x93\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00\xa6\x00\x00\x00\x00\x00\x01\x00\x00\x04\xcf\
+\x00\x00\x01\x9b\x01L[`\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
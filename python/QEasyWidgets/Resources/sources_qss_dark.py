@@ -0,0 +1,1094 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.8.2
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x01\xed\
+P\
+rogressBarBase {\
+\x0a\x09text-align: ce\
+nter;\x0a    color:\
+ black;\x0a\x09backgro\
+und-color: rgba(\
+246, 246, 246, 1\
+8);\x0a    border: \
+1.2px solid rgba\
+(210, 222, 234, \
+12);\x0a    border-\
+radius: 3px;\x0a}\x0aP\
+rogressBarBase[i\
+sBorderless=true\
+] {\x0a    padding:\
+ 1.2px;\x0a\x09border:\
+ none;\x0a}\x0aProgres\
+sBarBase[isTrans\
+parent=true] {\x0a\x09\
+background-color\
+: transparent;\x0a}\
+\x0a\x0aProgressBarBas\
+e::chunk {\x0a\x09back\
+ground-color: ql\
+ineargradient(sp\
+read: pad, x1:0,\
+ y1:0, x2:1, y2:\
+0, stop:0 transp\
+arent, stop:1 rg\
+ba(120, 180, 240\
+, 123));\x0a    bor\
+der: none;\x0a}\
+\x00\x00\x06\xf5\
+B\
+uttonBase {\x0a    \
+color: rgb(210, \
+222, 234);\x0a\x09back\
+ground-color: rg\
+ba(246, 246, 246\
+, 18);\x0a    paddi\
+ng: 4.8px 12px 6\
+px 12px;\x0a    bor\
+der: 1.2px solid\
+ rgba(210, 222, \
+234, 12);\x0a    bo\
+rder-bottom-colo\
+r: rgba(210, 222\
+, 234, 48);\x0a\x09bor\
+der-radius: 3px;\
+\x0a    outline: no\
+ne;\x0a}\x0aButtonBase\
+[isBorderless=tr\
+ue] {\x0a    paddin\
+g: 1.2px;\x0a\x09borde\
+r: none;\x0a}\x0aButto\
+nBase[isTranspar\
+ent=true] {\x0a\x09bac\
+kground-color: t\
+ransparent;\x0a}\x0aBu\
+ttonBase:hover {\
+\x0a\x09background-col\
+or: rgba(246, 24\
+6, 246, 24);\x0a}\x0aB\
+uttonBase:presse\
+d, ButtonBase:ch\
+ecked {\x0a\x09color: \
+rgba(210, 222, 2\
+34, 123);\x0a    bo\
+rder-bottom-colo\
+r: rgba(120, 180\
+, 240, 246);\x0a}\x0aB\
+uttonBase:disabl\
+ed {\x0a\x09color: rgb\
+a(210, 222, 234,\
+ 90);\x0a}\x0a\x0a\x0aMenuBu\
+tton, HollowButt\
+on {\x0a\x09background\
+-color: transpar\
+ent;\x0a\x09border-wid\
+th: 1.2px;\x0a\x09bord\
+er-style: solid;\
+\x0a\x09border-color: \
+rgba(201, 210, 2\
+22, 123);\x0a}\x0aMenu\
+Button:hover, Ho\
+llowButton:hover\
+ {\x0a\x09border-color\
+: rgba(201, 210,\
+ 222, 210);\x0a}\x0a\x0aM\
+enuButton QMenu \
+{\x0a\x09background-co\
+lor: black;\x0a}\x0aMe\
+nuButton QMenu::\
+item {\x0a\x09backgrou\
+nd-color: rgba(2\
+10, 222, 234, 15\
+);\x0a\x09padding-top:\
+ 3px;\x0a\x09padding-l\
+eft: 6px;\x0a\x09paddi\
+ng-bottom: 3px;\x0a\
+\x09padding-right: \
+6px;\x0a\x09border: no\
+ne;\x0a}\x0aMenuButton\
+ QMenu::item:hov\
+er {\x0a\x09background\
+-color: rgba(120\
+, 120, 120, 120)\
+;\x0a}\x0aMenuButton Q\
+Menu::item:selec\
+ted {\x0a\x09backgroun\
+d-color: rgba(12\
+0, 120, 120, 120\
+);\x0a}\x0a\x0a\x0aNavigatio\
+nButton {\x0a\x09backg\
+round-color: tra\
+nsparent;\x0a    pa\
+dding: 0px;\x0a    \
+border: 0px soli\
+d transparent;\x0a\x09\
+border-radius: 0\
+px;\x0a}\x0aNavigation\
+Button:hover {\x0a\x09\
+background-color\
+: qlineargradien\
+t(spread: pad, x\
+1:0, y1:0, x2:1,\
+ y2:0, stop:0 rg\
+ba(120, 180, 240\
+, 123), stop:1 t\
+ransparent);\x0a}\x0aN\
+avigationButton:\
+checked {\x0a\x09backg\
+round-color: tra\
+nsparent;\x0a\x09borde\
+r-left: 3px soli\
+d rgba(120, 180,\
+ 240, 246);\x0a}\x0aNa\
+vigationButton[i\
+sHorizontal=true\
+]:checked {\x0a    \
+border: 0px soli\
+d transparent;\x0a\x09\
+border-bottom: 3\
+px solid rgba(12\
+0, 180, 240, 246\
+);\x0a}\
+\x00\x00\x00\x93\
+Q\
+Widget {\x0a    bac\
+kground-color: q\
+lineargradient(s\
+pread: pad, x1:0\
+, y1:0, x2:1, y2\
+:0, stop:0 rgba(\
+36, 36, 36, 246)\
+, stop:1 rgba(24\
+, 24, 24, 246));\
+\x0a}\
+\x00\x00\x01\x16\
+C\
+heckBoxBase {\x0a  \
+  background-col\
+or: transparent;\
+\x0a}\x0aCheckBoxBase:\
+:indicator {\x0a   \
+ background-colo\
+r: transparent;\x0a\
+    border: none\
+;\x0a}\x0a\x0aCheckBoxBas\
+e QLabel {\x0a    c\
+olor: white;\x0a   \
+ background-colo\
+r: transparent;\x0a\
+    border: none\
+;\x0a}\x0aCheckBoxBase\
+ QLabel:disabled\
+ {\x0a    color: gr\
+ey;\x0a}\
+\x00\x00\x01J\
+T\
+extBrowserBase {\
+\x0a    color: rgb(\
+210, 222, 234);\x0a\
+\x09text-align: lef\
+t;\x0a\x09selection-ba\
+ckground-color: \
+darkgrey;\x0a\x09backg\
+round-color: tra\
+nsparent;\x0a    pa\
+dding: 1.2px;\x0a\x09b\
+order: none;\x0a\x09bo\
+rder-radius: 3px\
+;\x0a}\x0aTextBrowserB\
+ase[isBorderless\
+=false] {\x0a    pa\
+dding: 0px;\x0a    \
+border: 1.2px so\
+lid rgba(201, 21\
+0, 222, 123);\x0a}\x0a\
+TextBrowserBase:\
+hover {\x0a}\
+\x00\x00\x01\xbd\
+T\
+oolBoxBase {\x0a   \
+ background-colo\
+r: transparent;\x0a\
+    padding: 0px\
+;\x0a    border: no\
+ne;\x0a\x09border-radi\
+us: 3px;\x0a}\x0a\x0aTool\
+Page {\x0a\x09backgrou\
+nd-color: transp\
+arent;\x0a    borde\
+r: none;\x0a}\x0a\x0aTool\
+Page Folder {\x0a  \
+  color: rgb(210\
+, 222, 234);\x0a\x09te\
+xt-align: left;\x0a\
+\x09background-colo\
+r: transparent;\x0a\
+\x09padding-top: 3p\
+x;\x0a\x09padding-left\
+: 12px;\x0a\x09padding\
+-bottom: 3px;\x0a\x09p\
+adding-right: 6p\
+x;\x0a    border: n\
+one;\x0a}\x0aToolPage \
+Folder:hover {\x0a\x09\
+background-color\
+: rgba(201, 210,\
+ 222, 12);\x0a}\
+\x00\x00\x00\xe8\
+C\
+hatWidgetBase {\x0a\
+    background-c\
+olor: transparen\
+t;\x0a    border: n\
+one;\x0a\x09border-rad\
+ius: 3px;\x0a}\x0aChat\
+WidgetBase:hover\
+ {\x0a}\x0a\x0a\x0aChatWidge\
+tBase QWidget {\x0a\
+    background-c\
+olor: transparen\
+t;\x0a    border: n\
+one;\x0a}\x0aChatWidge\
+tBase QWidget:ho\
+ver {\x0a}\
+\x00\x00\x02M\
+L\
+istBase {\x0a\x09backg\
+round-color: tra\
+nsparent;\x0a    pa\
+dding: 1.2px;\x0a\x09b\
+order: none;\x0a\x09bo\
+rder-radius: 3px\
+;\x0a    outline: n\
+one;\x0a}\x0aListBase[\
+isBorderless=fal\
+se] {\x0a    paddin\
+g: 0px;\x0a    bord\
+er: 1.2px solid \
+rgba(201, 210, 2\
+22, 123);\x0a}\x0aList\
+Base:hover {\x0a   \
+ border-color: r\
+gba(201, 210, 22\
+2, 210);\x0a}\x0a\x0aList\
+Base::item {\x0a   \
+ color: rgb(210,\
+ 222, 234);\x0a\x09bac\
+kground-color: t\
+ransparent;\x0a    \
+border: 2.4px so\
+lid transparent;\
+\x0a\x09padding: 2.4px\
+;\x0a}\x0aListBase::it\
+em:hover {\x0a\x09back\
+ground-color: rg\
+ba(201, 210, 222\
+, 33);\x0a}\x0aListBas\
+e::item:selected\
+ {\x0a\x09background-c\
+olor: transparen\
+t;\x0a\x09border-left-\
+color: rgb(120, \
+180, 240);\x0a}\
+\x00\x00\x03/\
+L\
+ineEditBase, Tex\
+tEditBase {\x0a    \
+color: rgb(210, \
+222, 234);\x0a\x09text\
+-align: left;\x0a\x09s\
+election-backgro\
+und-color: darkg\
+rey;\x0a    backgro\
+und-color: rgba(\
+246, 246, 246, 1\
+8);\x0a    padding:\
+ 4.8px 12px 6px \
+12px;\x0a    border\
+: 1.2px solid rg\
+ba(210, 222, 234\
+, 12);\x0a    borde\
+r-bottom: 1.2px \
+solid rgba(210, \
+222, 234, 48);\x0a\x09\
+border-radius: 3\
+px;\x0a    outline:\
+ none;\x0a}\x0aLineEdi\
+tBase[isBorderle\
+ss=true], TextEd\
+itBase[isBorderl\
+ess=true] {\x0a    \
+padding: 1.2px;\x0a\
+\x09border: none;\x0a}\
+\x0aLineEditBase[is\
+Transparent=true\
+], TextEditBase[\
+isTransparent=tr\
+ue] {\x0a\x09backgroun\
+d-color: transpa\
+rent;\x0a}\x0aLineEdit\
+Base:hover, Text\
+EditBase:hover {\
+\x0a\x09background-col\
+or: rgba(246, 24\
+6, 246, 24);\x0a}\x0aL\
+ineEditBase:focu\
+s, TextEditBase:\
+focus {\x0a    bord\
+er-bottom-color:\
+ rgba(120, 180, \
+240, 246);\x0a}\x0aLin\
+eEditBase:disabl\
+ed, TextEditBase\
+:disabled {\x0a\x09col\
+or: rgba(201, 21\
+0, 222, 90);\x0a}\
+\x00\x00\x01B\
+(\
+\xb5/\xfd`\xc4\x04\xc5\x09\x002L&\x19`\xd7\x03\
+\x0c%\x1d]hv\x94K\x9d]\xd1\x11\x98\xd3d\x17\
+\xbb\x94\x82&7+\xcf]B\xb6\xd2\xe6S\x9f9\xcf\
+\xa7~^\xaf3j):N\x96\xbe\x94\x8e\x04\x81\xf0\
+\x1dn/\xce\x9dQ\xd08:6\xa1$P\x00\x1e\xec\
+X+\xb7\xd8\xf5IVfV\xb6b\x1d\xa9\xa4\x8a\xc7\
+\xca\x03\xd7>\xef#\xb3\xf5\xd8e\xcb\xba\xfc\xe2\xa7?\
+\x1e\xde\x01\x9b@\xe0!\xc8\x87~\xc7\xc7\x17C\x85O\
+\x16~\x1aA\xf2A\xe6\x85\xf1\xd3\x18\x04]\xc0dT\
+\x02;V\x95\xdaY;\xe0\xfa\xcaj\xc2\x9b}\x5c\xe3\
+O\xb7\xd7i\x02>\xa0Q\x1e\xa2\x11!)HRX\
+\xc6@F0\xa4\xce\xea\xbb\x01\x15\x18\x7fk<\xd06\
+\x5c\x9e\xe2$\xda\x9c\xdb@\x0a\x90\xec\xd48\xca\xbb\x10\
+*\x07\x04\xed\xa4\xb9,.\xdd\x81=tBpa\xaa\
+N\x93\xc4\xb7]\xedN\x8cLG`2\x96\xa3\x05A\
+#\xe9\x88\xb4x;\x83\x0c\xff\xa2\xee\x01\xa4E\x90\xc5\
+\x0c\xb0\xb8k\xa18\x00b\xe0\xbc\x0f\x7f\xe2h\x18\x91\
+*\xbfyIB\x0a\x00\x1dOJl{\x0c\x91\xf6s\
+5\xb8YODU9v\x84\xb3\xe3\xf6\xc3\xbd\xd0\xf9\
+\x89n\x07\x13\xa6\x08\xa6\x06D\xb5\x956\xbf?\xc0\xa9\
+\x01\
+\x00\x00\x06C\
+C\
+omboBoxBase {\x0a  \
+  color: rgb(210\
+, 222, 234);\x0a\x09te\
+xt-align: left;\x0a\
+\x09selection-backg\
+round-color: dar\
+kgrey;\x0a\x09backgrou\
+nd-color: rgba(2\
+46, 246, 246, 18\
+);\x0a    padding: \
+4.8px 12px 6px 1\
+2px;\x0a    border:\
+ 1.2px solid rgb\
+a(210, 222, 234,\
+ 12);\x0a    border\
+-bottom: 1.2px s\
+olid rgba(210, 2\
+22, 234, 48);\x0a\x09b\
+order-radius: 3p\
+x;\x0a    outline: \
+none;\x0a}\x0aComboBox\
+Base[isBorderles\
+s=true] {\x0a    pa\
+dding: 1.2px;\x0a\x09b\
+order: none;\x0a}\x0aC\
+omboBoxBase[isTr\
+ansparent=true] \
+{\x0a\x09background-co\
+lor: transparent\
+;\x0a}\x0aComboBoxBase\
+:hover {\x0a\x09backgr\
+ound-color: rgba\
+(246, 246, 246, \
+24);\x0a}\x0aComboBoxB\
+ase:focus {\x0a    \
+border-bottom-co\
+lor: rgba(120, 1\
+80, 240, 246);\x0a}\
+\x0aComboBoxBase:di\
+sabled {\x0a\x09color:\
+ rgba(210, 222, \
+234, 90);\x0a}\x0a\x0aCom\
+boBoxBase::drop-\
+down {\x0a\x09subcontr\
+ol-origin: paddi\
+ng;\x0a\x09subcontrol-\
+position: right;\
+\x0a\x09margin-right: \
+6px;\x0a\x09border: no\
+ne;\x0a}\x0a\x0aComboBoxB\
+ase::down-arrow \
+{\x0a\x09border-image:\
+ url(:/Icons/ico\
+ns/dark/Chevron-\
+Down.svg);\x0a}\x0aCom\
+boBoxBase::down-\
+arrow:on {\x0a\x09bord\
+er-image: url(:I\
+cons/icons/dark/\
+Chevron-Up.svg);\
+\x0a}\x0a\x0a\x0aComboBoxBas\
+e QAbstractItemV\
+iew {\x0a\x09backgroun\
+d-color: black;\x0a\
+\x09border: 1.2px s\
+olid rgba(201, 2\
+10, 222, 123);\x0a\x09\
+outline: none;\x0a}\
+\x0aComboBoxBase QA\
+bstractItemView[\
+isBorderless=tru\
+e] {\x0a    padding\
+: 1.2px;\x0a\x09border\
+: none;\x0a}\x0aComboB\
+oxBase QAbstract\
+ItemView[isTrans\
+parent=true] {\x0a\x09\
+background-color\
+: transparent;\x0a}\
+\x0a\x0aComboBoxBase Q\
+AbstractItemView\
+::item {\x0a    col\
+or: rgb(210, 222\
+, 234);\x0a\x09backgro\
+und-color: rgba(\
+210, 222, 234, 1\
+5);\x0a\x09padding: 3p\
+x 6px;\x0a\x09border: \
+none;\x0a}\x0aComboBox\
+Base QAbstractIt\
+emView::item:hov\
+er {\x0a\x09background\
+-color: rgba(123\
+, 123, 123, 123)\
+;\x0a}\x0aComboBoxBase\
+ QAbstractItemVi\
+ew::item:selecte\
+d {\x0a\x09background-\
+color: rgba(123,\
+ 123, 123, 123);\
+\x0a}\
+\x00\x00\x01\xb9\
+G\
+roupBoxBase {\x0a  \
+  color: rgb(210\
+, 222, 234);\x0a\x09ma\
+rgin-top: 1.5ex;\
+\x0a\x09background-col\
+or: transparent;\
+\x0a\x09border: 1.2px \
+solid transparen\
+t;\x0a\x09border-radiu\
+s: 3px;\x0a}\x0a\x0aGroup\
+BoxBase::title {\
+\x0a\x09subcontrol-ori\
+gin: margin;\x0a\x09su\
+bcontrol-positio\
+n: top left;\x0a\x09pa\
+dding: 3px;\x0a}\x0a\x0aG\
+roupBoxBase::ind\
+icator:checked {\
+\x0a\x09border-image: \
+url(:/Icons/icon\
+s/dark/Chevron-D\
+own.svg);\x0a}\x0aGrou\
+pBoxBase::indica\
+tor:unchecked {\x0a\
+\x09border-image: u\
+rl(:/Icons/icons\
+/dark/Chevron-Up\
+.svg);\x0a}\
+\x00\x00\x00\xe4\
+S\
+crollAreaBase {\x0a\
+\x09border: 0px sol\
+id;\x0a\x09border-radi\
+us: 3px;\x0a}\x0aScrol\
+lAreaBase[isBord\
+erless=true] {\x0a \
+   padding: 1.2p\
+x;\x0a\x09border: none\
+;\x0a}\x0aScrollAreaBa\
+se[isTransparent\
+=true] {\x0a\x09backgr\
+ound-color: tran\
+sparent;\x0a}\x0aScrol\
+lAreaBase:hover \
+{\x0a}\
+\x00\x00\x00\x9c\
+L\
+abelBase {\x0a    c\
+olor: rgb(210, 2\
+22, 234);\x0a    ba\
+ckground-color: \
+transparent;\x0a   \
+ padding: 0px;\x0a \
+   border: none;\
+\x0a\x09border-radius:\
+ 3px;\x0a}\x0aLabelBas\
+e:hover {\x0a}\
+\x00\x00\x02\x0d\
+Q\
+TabWidget::tab-b\
+ar {\x0a    alignme\
+nt: left;\x0a}\x0a\x0a\x0aQT\
+abBar::tab {\x0a   \
+ color: rgb(210,\
+ 222, 234);\x0a\x09bac\
+kground-color: r\
+gba(246, 246, 24\
+6, 18);\x0a    padd\
+ing: 2.4px 4.8px\
+;\x0a    border: 1.\
+2px solid rgba(2\
+10, 222, 234, 12\
+);\x0a}\x0aQTabBar::ta\
+b[isBorderless=t\
+rue] {\x0a    paddi\
+ng: 3.6px 6.0px;\
+\x0a\x09border: none;\x0a\
+}\x0aQTabBar::tab:h\
+over {\x0a\x09backgrou\
+nd-color: rgba(2\
+46, 246, 246, 24\
+);\x0a}\x0aQTabBar::ta\
+b:selected {\x0a\x09ba\
+ckground-color: \
+rgba(246, 246, 2\
+46, 30);\x0a}\x0a\x0a\x0aQTa\
+bWidget::pane {\x0a\
+\x09background: tra\
+nsparent;\x0a    bo\
+rder: 1.2px soli\
+d rgba(210, 222,\
+ 234, 12);\x0a}\
+\x00\x00\x02l\
+Q\
+TreeView {\x0a\x09back\
+ground-color: tr\
+ansparent;\x0a    o\
+utline: none;\x0a\x09b\
+order: none;\x0a\x09bo\
+rder-radius: 3px\
+;\x0a}\x0a\x0aQTreeView::\
+item {\x0a    color\
+: rgb(210, 222, \
+234);\x0a\x09backgroun\
+d-color: transpa\
+rent;\x0a\x09padding: \
+3px;\x0a\x09border: no\
+ne;\x0a\x09border-radi\
+us: 3px;\x0a}\x0aQTree\
+View::item:hover\
+ {\x0a\x09background-c\
+olor: rgba(201, \
+210, 222, 33);\x0a}\
+\x0aQTreeView::item\
+:selected {\x0a}\x0a\x0aQ\
+TreeView::branch\
+ {\x0a    backgroun\
+d-color: transpa\
+rent;\x0a\x09border: n\
+one;\x0a}\x0aQTreeView\
+::branch:open:ha\
+s-children {\x0a\x09im\
+age: url(:/Icons\
+/icons/dark/Chev\
+ron-Down.svg);\x0a\x09\
+padding: 3px;\x0a}\x0a\
+QTreeView::branc\
+h:closed:has-chi\
+ldren {\x0a\x09image: \
+url(:/Icons/icon\
+s/dark/Chevron-R\
+ight.svg);\x0a\x09padd\
+ing: 3px;\x0a}\
+\x00\x00\x044\
+M\
+ediaPlayerBase {\
+\x0a    padding: 4.\
+8px 12px 6px 12p\
+x;\x0a}\x0aMediaPlayer\
+Base[isBorderles\
+s=true] {\x0a    pa\
+dding: 1.2px;\x0a\x09b\
+order: none;\x0a}\x0aM\
+ediaPlayerBase[i\
+sTransparent=tru\
+e] {\x0a\x09background\
+-color: transpar\
+ent;\x0a}\x0a\x0aMediaPla\
+yerBase ButtonBa\
+se {\x0a    backgro\
+und-color: trans\
+parent;\x0a    bord\
+er: none;\x0a    bo\
+rder-radius: 12p\
+x;\x0a}\x0aMediaPlayer\
+Base ButtonBase:\
+hover {\x0a    back\
+ground-color: rg\
+ba(201, 210, 222\
+, 33);\x0a}\x0a\x0a\x0aMedia\
+PlayerBase QSlid\
+er::groove:horiz\
+ontal {\x0a\x09height:\
+ 1.2px;\x0a\x09backgro\
+und-color: rgba(\
+201, 210, 222, 1\
+23);\x0a\x09border: no\
+ne;\x0a\x09border-radi\
+us: 6px;\x0a}\x0aMedia\
+PlayerBase QSlid\
+er::groove:horiz\
+ontal:hover {\x0a\x09b\
+ackground-color:\
+ rgba(201, 210, \
+222, 210);\x0a}\x0a\x0aMe\
+diaPlayerBase QS\
+lider::handle:ho\
+rizontal {\x0a\x09widt\
+h: 12px;\x0a\x09height\
+: 12px;\x0a\x09backgro\
+und-color: rgba(\
+201, 210, 222, 2\
+10);\x0a\x09margin-top\
+: -6px;\x0a\x09margin-\
+bottom: -6px;\x0a\x09b\
+order: 1.2px sol\
+id transparent;\x0a\
+\x09border-radius: \
+6px;\x0a}\x0aMediaPlay\
+erBase QSlider::\
+handle:horizonta\
+l:hover {\x0a\x09backg\
+round-color: rgb\
+a(210, 222, 234,\
+ 234);\x0a}\x0a\x0a\x0aEmbed\
+dedMediaPlayer {\
+\x0a\x09background-col\
+or: transparent;\
+\x0a    padding: 1.\
+2px;\x0a\x09border: no\
+ne;\x0a}\x0aEmbeddedMe\
+diaPlayer:hover \
+{\x0a}\
+\x00\x00\x01/\
+T\
+oolTipBase {\x0a   \
+ background-colo\
+r: rgba(246, 246\
+, 246, 18);\x0a    \
+border: 1.2px so\
+lid rgba(210, 22\
+2, 234, 12);\x0a   \
+ border-radius: \
+3px;\x0a}\x0aToolTipBa\
+se[isTransparent\
+=true] {\x0a    bac\
+kground-color: t\
+ransparent;\x0a}\x0a\x0a\x0a\
+QLabel {\x0a    col\
+or: rgb(210, 222\
+, 234);\x0a    back\
+ground-color: tr\
+ansparent;\x0a    b\
+order: none;\x0a}\
+\x00\x00\x03\x8e\
+M\
+enuBase {\x0a    ba\
+ckground-color: \
+transparent;\x0a   \
+ border: none;\x0a}\
+\x0a\x0aMenuActionList\
+Widget {\x0a    fon\
+t: 12px --FontFa\
+milies;\x0a    back\
+ground-color: rg\
+ba(246, 246, 246\
+, 18);\x0a    borde\
+r: 1.2px solid r\
+gba(210, 222, 23\
+4, 12);\x0a    bord\
+er-radius: 3px;\x0a\
+    outline: non\
+e;\x0a}\x0aMenuActionL\
+istWidget[transp\
+arent=true] {\x0a  \
+  background-col\
+or: transparent;\
+\x0a}\x0a\x0aMenuActionLi\
+stWidget::item {\
+\x0a    padding-lef\
+t: 9px;\x0a    padd\
+ing-right: 9px;\x0a\
+    border-radiu\
+s: 3px;\x0a    marg\
+in-left: 6px;\x0a  \
+  margin-right: \
+6px;\x0a    color: \
+rgb(210, 222, 23\
+4);\x0a    border: \
+none;\x0a}\x0aMenuActi\
+onListWidget::it\
+em:hover {\x0a    b\
+ackground-color:\
+ rgba(246, 246, \
+246, 24);\x0a}\x0aMenu\
+ActionListWidget\
+::item:selected \
+{\x0a    color: rgb\
+a(210, 222, 234,\
+ 123);\x0a    backg\
+round-color: rgb\
+a(120, 180, 240,\
+ 246);\x0a}\x0aMenuAct\
+ionListWidget::i\
+tem:disabled {\x0a \
+   padding-left:\
+ 9px;\x0a    paddin\
+g-right: 9px;\x0a  \
+  border-radius:\
+ 3px;\x0a    color:\
+ rgba(210, 222, \
+234, 90);\x0a    bo\
+rder: none;\x0a}\
+\x00\x00\x00\xfb\
+Q\
+DockWidget {\x0a   \
+ border: none;\x0a}\
+\x0aQDockWidget[isB\
+orderless=false]\
+ {\x0a    padding: \
+0px;\x0a    border:\
+ 1.2px solid rgb\
+a(201, 210, 222,\
+ 123);\x0a}\x0aQDockWi\
+dget[isTranspare\
+nt=true] {\x0a\x09back\
+ground-color: tr\
+ansparent;\x0a}\x0a\x0aQD\
+ockWidget::title\
+ {\x0a    text-alig\
+n: left;\x0a}\
+\x00\x00\x03\x92\
+Q\
+HeaderView {\x0a   \
+ background-colo\
+r: transparent;\x0a\
+}\x0a\x0aQHeaderView::\
+section {\x0a    co\
+lor: rgb(210, 22\
+2, 234);\x0a\x09backgr\
+ound-color: tran\
+sparent;\x0a    pad\
+ding: 2.4px 4.8p\
+x;\x0a    border: 1\
+.2px solid rgba(\
+201, 210, 222, 1\
+23);\x0a}\x0aQHeaderVi\
+ew::section:hori\
+zontal {\x0a    bor\
+der-top: none;\x0a \
+   border-left: \
+none;\x0a}\x0aQHeaderV\
+iew::section:ver\
+tical {\x0a    bord\
+er-top: none;\x0a}\x0a\
+\x0a\x0aQTableView {\x0a\x09\
+background-color\
+: transparent;\x0a \
+   selection-bac\
+kground-color: t\
+ransparent;\x0a    \
+gridline-color: \
+rgba(201, 210, 2\
+22, 123);\x0a\x09borde\
+r: 1.2px solid r\
+gba(201, 210, 22\
+2, 123);\x0a\x09border\
+-radius: 3px;\x0a  \
+  outline: none;\
+\x0a}\x0aQTableView[is\
+Borderless=true]\
+ {\x0a    padding: \
+1.2px;\x0a\x09border: \
+none;\x0a}\x0a\x0aQTableV\
+iew::item {\x0a    \
+color: rgb(210, \
+222, 234);\x0a    p\
+adding: 3px 6px;\
+\x0a    border: 0px\
+ solid rgba(201,\
+ 210, 222, 123);\
+\x0a\x09border-bottom-\
+width: 1.2px;\x0a}\x0a\
+QTableView::item\
+::selected {\x0a\x09bo\
+rder-color: rgba\
+(201, 210, 222, \
+210);\x0a}\x0aQTableVi\
+ew::item:!altern\
+ate:!selected {\x0a\
+}\
+\x00\x00\x05n\
+S\
+pinBoxBase, Doub\
+leSpinBoxBase {\x0a\
+    color: rgb(2\
+10, 222, 234);\x0a\x09\
+text-align: left\
+;\x0a\x09selection-bac\
+kground-color: d\
+arkgrey;\x0a\x09backgr\
+ound-color: rgba\
+(246, 246, 246, \
+18);\x0a    padding\
+: 4.8px 12px 6px\
+ 12px;\x0a    borde\
+r: 1.2px solid r\
+gba(201, 210, 22\
+2, 12);\x0a    bord\
+er-bottom: 1.2px\
+ solid rgba(201,\
+ 210, 222, 48);\x0a\
+\x09border-radius: \
+3px;\x0a    outline\
+: none;\x0a}\x0aSpinBo\
+xBase[isBorderle\
+ss=true] DoubleS\
+pinBoxBase[isBor\
+derless=true] {\x0a\
+    padding: 1.2\
+px;\x0a\x09border: non\
+e;\x0a}\x0aSpinBoxBase\
+[isTransparent=t\
+rue] DoubleSpinB\
+oxBase[isBorderl\
+ess=true] {\x0a\x09bac\
+kground-color: t\
+ransparent;\x0a}\x0aSp\
+inBoxBase:hover,\
+ DoubleSpinBoxBa\
+se:hover {\x0a\x09back\
+ground-color: rg\
+ba(246, 246, 246\
+, 24);\x0a}\x0aSpinBox\
+Base:focus, Doub\
+leSpinBoxBase:fo\
+cus {\x0a    border\
+-bottom-color: r\
+gba(120, 180, 24\
+0, 246);\x0a}\x0aSpinB\
+oxBase:disabled,\
+ DoubleSpinBoxBa\
+se:disabled {\x0a\x09c\
+olor: rgba(201, \
+210, 222, 90);\x0a}\
+\x0a\x0aSpinBoxBase::u\
+p-button, Double\
+SpinBoxBase::up-\
+button {\x0a\x09subcon\
+trol-origin: pad\
+ding;\x0a\x09subcontro\
+l-position: top \
+right;\x0a\x09margin-r\
+ight: 4.5px;\x0a\x09bo\
+rder-width: 0px;\
+\x0a}\x0aSpinBoxBase::\
+up-arrow, Double\
+SpinBoxBase::up-\
+arrow {\x0a\x09border-\
+image: url(:/Ico\
+ns/icons/dark/Ch\
+evron-Up.svg);\x0a}\
+\x0a\x0aSpinBoxBase::d\
+own-button, Doub\
+leSpinBoxBase::d\
+own-button {\x0a\x09su\
+bcontrol-origin:\
+ padding;\x0a\x09subco\
+ntrol-position: \
+bottom right;\x0a\x09m\
+argin-right: 4.5\
+px;\x0a\x09border-widt\
+h: 0px;\x0a}\x0aSpinBo\
+xBase::down-arro\
+w, DoubleSpinBox\
+Base::down-arrow\
+ {\x0a\x09border-image\
+: url(:/Icons/ic\
+ons/dark/Chevron\
+-Down.svg);\x0a}\
+"
+
+qt_resource_name = b"\
+\x00\x03\
+\x00\x00V\x83\
+\x00Q\
+\x00S\x00S\
+\x00\x03\
+\x00\x00x\xa3\
+\x00q\
+\x00s\x00s\
+\x00\x04\
+\x00\x06\xa8\x8b\
+\x00d\
+\x00a\x00r\x00k\
+\x00\x0f\
+\x03U\x92\x03\
+\x00P\
+\x00r\x00o\x00g\x00r\x00e\x00s\x00s\x00B\x00a\x00r\x00.\x00q\x00s\x00s\
+\x00\x0a\
+\x0bha\xc3\
+\x00B\
+\x00u\x00t\x00t\x00o\x00n\x00.\x00q\x00s\x00s\
+\x00\x07\
+\x08\x85X#\
+\x00B\
+\x00a\x00r\x00.\x00q\x00s\x00s\
+\x00\x0c\
+\x00V+C\
+\x00C\
+\x00h\x00e\x00c\x00k\x00B\x00o\x00x\x00.\x00q\x00s\x00s\
+\x00\x0b\
+\x09Vuc\
+\x00B\
+\x00r\x00o\x00w\x00s\x00e\x00r\x00.\x00q\x00s\x00s\
+\x00\x0b\
+\x09\xdd\x94\xa3\
+\x00T\
+\x00o\x00o\x00l\x00B\x00o\x00x\x00.\x00q\x00s\x00s\
+\x00\x0e\
+\x00\xd4\xf5\x83\
+\x00C\
+\x00h\x00a\x00t\x00W\x00i\x00d\x00g\x00e\x00t\x00.\x00q\x00s\x00s\
+\x00\x08\
+\x00\xa7R\xc3\
+\x00L\
+\x00i\x00s\x00t\x00.\x00q\x00s\x00s\
+\x00\x08\
+\x0b\x07Q\xc3\
+\x00E\
+\x00d\x00i\x00t\x00.\x00q\x00s\x00s\
+\x00\x0a\
+\x0a\xce\x1dC\
+\x00S\
+\x00l\x00i\x00d\x00e\x00r\x00.\x00q\x00s\x00s\
+\x00\x0c\
+\x00'*\xc3\
+\x00C\
+\x00o\x00m\x00b\x00o\x00B\x00o\x00x\x00.\x00q\x00s\x00s\
+\x00\x0c\
+\x00\xb9\x80#\
+\x00G\
+\x00r\x00o\x00u\x00p\x00B\x00o\x00x\x00.\x00q\x00s\x00s\
+\x00\x0e\
+\x0d\xa0/\xc3\
+\x00S\
+\x00c\x00r\x00o\x00l\x00l\x00A\x00r\x00e\x00a\x00.\x00q\x00s\x00s\
+\x00\x09\
+\x08\xbf\xfcC\
+\x00L\
+\x00a\x00b\x00e\x00l\x00.\x00q\x00s\x00s\
+\x00\x07\
+\x0auX\x03\
+\x00T\
+\x00a\x00b\x00.\x00q\x00s\x00s\
+\x00\x08\
+\x08\xb8S\xc3\
+\x00T\
+\x00r\x00e\x00e\x00.\x00q\x00s\x00s\
+\x00\x0a\
+\x0f\xcf\xbd\xa3\
+\x00P\
+\x00l\x00a\x00y\x00e\x00r\x00.\x00q\x00s\x00s\
+\x00\x0b\
+\x0b\xb5\x94\x83\
+\x00T\
+\x00o\x00o\x00l\x00T\x00i\x00p\x00.\x00q\x00s\x00s\
+\x00\x08\
+\x0cXR\xc3\
+\x00M\
+\x00e\x00n\x00u\x00.\x00q\x00s\x00s\
+\x00\x0e\
+\x06\x86\xf5#\
+\x00D\
+\x00o\x00c\x00k\x00W\x00i\x00d\x00g\x00e\x00t\x00.\x00q\x00s\x00s\
+\x00\x09\
+\x09(\xecC\
+\x00T\
+\x00a\x00b\x00l\x00e\x00.\x00q\x00s\x00s\
+\x00\x0b\
+\x09\xdf\xb8\xe3\
+\x00S\
+\x00p\x00i\x00n\x00B\x00o\x00x\x00.\x00q\x00s\x00s\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x0c\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x18\x00\x02\x00\x00\x00\x16\x00\x00\x00\x04\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x016\x00\x00\x00\x00\x00\x01\x00\x00\x15`\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00x\x00\x00\x00\x00\x00\x01\x00\x00\x09\x81\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x00\x0e\x96\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01T\x00\x00\x00\x00\x00\x01\x00\x00\x1b\xa7\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x00\x0d\xaa\
+\x00\x00\x01\xa1ON\xf6\xe8\
+\x00\x00\x00&\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x02\x22\x00\x00\x00\x00\x00\x01\x00\x00,j\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00d\x00\x00\x00\x00\x00\x01\x00\x00\x08\xea\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\xc0\x00\x00\x00\x00\x00\x01\x00\x00 \xfd\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\x94\x00\x00\x00\x00\x00\x01\x00\x00\x1eL\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x02D\x00\x00\x00\x00\x00\x01\x00\x00-i\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x9b\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00\xb2\x00\x00\x00\x00\x00\x01\x00\x00\x0b\xe9\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x02\x5c\x00\x00\x00\x00\x00\x01\x00\x000\xff\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\xac\x00\x00\x00\x00\x00\x01\x00\x00\x1e\xec\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\x1c\x00\x04\x00\x00\x00\x01\x00\x00\x14\x1a\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\x06\x00\x00\x00\x00\x00\x01\x00\x00\x10\xe7\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00J\x00\x00\x00\x00\x00\x01\x00\x00\x01\xf1\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\xf0\x00\x00\x00\x00\x00\x01\x00\x00'\xa5\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x02\x0c\x00\x00\x00\x00\x00\x01\x00\x00(\xd8\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01r\x00\x00\x00\x00\x00\x01\x00\x00\x1dd\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\xd6\x00\x00\x00\x00\x00\x01\x00\x00#m\
+\x00\x00\x01\xa1N\xb4\x8d\xfb\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,1083 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.8.2
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x01\xe6\
+P\
+rogressBarBase {\
+\x0a\x09text-align: ce\
+nter;\x0a    color:\
+ black;\x0a\x09backgro\
+und-color: rgba(\
+24, 24, 24, 6);\x0a\
+    border: 1.2p\
+x solid rgba(54,\
+ 45, 33, 12);\x0a  \
+  border-radius:\
+ 3px;\x0a}\x0aProgress\
+BarBase[isBorder\
+less=true] {\x0a   \
+ padding: 1.2px;\
+\x0a\x09border: none;\x0a\
+}\x0aProgressBarBas\
+e[isTransparent=\
+true] {\x0a\x09backgro\
+und-color: trans\
+parent;\x0a}\x0a\x0aProgr\
+essBarBase::chun\
+k {\x0a\x09background-\
+color: qlineargr\
+adient(spread: p\
+ad, x1:0, y1:0, \
+x2:1, y2:0, stop\
+:0 transparent, \
+stop:1 rgba(120,\
+ 180, 240, 123))\
+;\x0a    border: no\
+ne;\x0a}\
+\x00\x00\x06\xd6\
+B\
+uttonBase {\x0a    \
+color: rgb(45, 3\
+3, 21);\x0a\x09backgro\
+und-color: rgba(\
+24, 24, 24, 6);\x0a\
+    padding: 4.8\
+px 12px 6px 12px\
+;\x0a    border: 1.\
+2px solid rgba(5\
+4, 45, 33, 12);\x0a\
+    border-botto\
+m-color: rgba(54\
+, 45, 33, 48);\x0a\x09\
+border-radius: 3\
+px;\x0a    outline:\
+ none;\x0a}\x0aButtonB\
+ase[isBorderless\
+=true] {\x0a    pad\
+ding: 1.2px;\x0a\x09bo\
+rder: none;\x0a}\x0aBu\
+ttonBase[isTrans\
+parent=true] {\x0a\x09\
+background-color\
+: transparent;\x0a}\
+\x0aButtonBase:hove\
+r {\x0a\x09background-\
+color: rgba(24, \
+24, 24, 12);\x0a}\x0aB\
+uttonBase:presse\
+d, ButtonBase:ch\
+ecked {\x0a\x09color: \
+rgba(45, 33, 21,\
+ 123);\x0a    borde\
+r-bottom-color: \
+rgba(120, 180, 2\
+40, 246);\x0a}\x0aButt\
+onBase:disabled \
+{\x0a\x09color: rgba(4\
+5, 33, 21, 90);\x0a\
+}\x0a\x0a\x0aMenuButton, \
+HollowButton {\x0a\x09\
+background-color\
+: transparent;\x0a\x09\
+border-width: 1.\
+2px;\x0a\x09border-sty\
+le: solid;\x0a\x09bord\
+er-color: rgba(5\
+4, 45, 33, 123);\
+\x0a}\x0aMenuButton:ho\
+ver, HollowButto\
+n:hover {\x0a\x09borde\
+r-color: rgba(54\
+, 45, 33, 210);\x0a\
+}\x0a\x0aMenuButton QM\
+enu {\x0a\x09backgroun\
+d-color: white;\x0a\
+}\x0aMenuButton QMe\
+nu::item {\x0a\x09back\
+ground-color: rg\
+ba(54, 45, 33, 1\
+5);\x0a\x09padding-top\
+: 3px;\x0a\x09padding-\
+left: 6px;\x0a\x09padd\
+ing-bottom: 3px;\
+\x0a\x09padding-right:\
+ 6px;\x0a\x09border: n\
+one;\x0a}\x0aMenuButto\
+n QMenu::item:ho\
+ver {\x0a\x09backgroun\
+d-color: rgba(12\
+0, 120, 120, 120\
+);\x0a}\x0aMenuButton \
+QMenu::item:sele\
+cted {\x0a\x09backgrou\
+nd-color: rgba(1\
+20, 120, 120, 12\
+0);\x0a}\x0a\x0a\x0aNavigati\
+onButton {\x0a\x09back\
+ground-color: tr\
+ansparent;\x0a    p\
+adding: 0px;\x0a   \
+ border: 0px sol\
+id transparent;\x0a\
+\x09border-radius: \
+0px;\x0a}\x0aNavigatio\
+nButton:hover {\x0a\
+\x09background-colo\
+r: qlineargradie\
+nt(spread: pad, \
+x1:0, y1:0, x2:1\
+, y2:0, stop:0 r\
+gba(120, 180, 24\
+0, 123), stop:1 \
+transparent);\x0a}\x0a\
+NavigationButton\
+:checked {\x0a\x09back\
+ground-color: tr\
+ansparent;\x0a\x09bord\
+er-left: 3px sol\
+id rgba(120, 180\
+, 240, 246);\x0a}\x0aN\
+avigationButton[\
+isHorizontal=tru\
+e]:checked {\x0a   \
+ border: 0px sol\
+id transparent;\x0a\
+\x09border-bottom: \
+3px solid rgba(1\
+20, 180, 240, 24\
+6);\x0a}\
+\x00\x00\x00\x99\
+Q\
+Widget {\x0a    bac\
+kground-color: q\
+lineargradient(s\
+pread: pad, x1:0\
+, y1:0, x2:1, y2\
+:0, stop:0 rgba(\
+246, 246, 246, 2\
+46), stop:1 rgba\
+(234, 234, 234, \
+246));\x0a}\
+\x00\x00\x01\x16\
+C\
+heckBoxBase {\x0a  \
+  background-col\
+or: transparent;\
+\x0a}\x0aCheckBoxBase:\
+:indicator {\x0a   \
+ background-colo\
+r: transparent;\x0a\
+    border: none\
+;\x0a}\x0a\x0aCheckBoxBas\
+e QLabel {\x0a    c\
+olor: black;\x0a   \
+ background-colo\
+r: transparent;\x0a\
+    border: none\
+;\x0a}\x0aCheckBoxBase\
+ QLabel:disabled\
+ {\x0a    color: gr\
+ey;\x0a}\
+\x00\x00\x01D\
+T\
+extBrowserBase {\
+\x0a    color: rgb(\
+45, 33, 21);\x0a\x09te\
+xt-align: left;\x0a\
+\x09selection-backg\
+round-color: dar\
+kgrey;\x0a\x09backgrou\
+nd-color: transp\
+arent;\x0a    paddi\
+ng: 1.2px;\x0a\x09bord\
+er: none;\x0a\x09borde\
+r-radius: 3px;\x0a}\
+\x0aTextBrowserBase\
+[isBorderless=fa\
+lse] {\x0a    paddi\
+ng: 0px;\x0a    bor\
+der: 1.2px solid\
+ rgba(54, 45, 33\
+, 123);\x0a}\x0aTextBr\
+owserBase:hover \
+{\x0a}\
+\x00\x00\x01\xb7\
+T\
+oolBoxBase {\x0a   \
+ background-colo\
+r: transparent;\x0a\
+    padding: 0px\
+;\x0a    border: no\
+ne;\x0a\x09border-radi\
+us: 3px;\x0a}\x0a\x0aTool\
+Page {\x0a\x09backgrou\
+nd-color: transp\
+arent;\x0a    borde\
+r: none;\x0a}\x0a\x0aTool\
+Page Folder {\x0a  \
+  color: rgb(45,\
+ 33, 21);\x0a\x09text-\
+align: left;\x0a\x09ba\
+ckground-color: \
+transparent;\x0a\x09pa\
+dding-top: 3px;\x0a\
+\x09padding-left: 1\
+2px;\x0a\x09padding-bo\
+ttom: 3px;\x0a\x09padd\
+ing-right: 6px;\x0a\
+    border: none\
+;\x0a}\x0aToolPage Fol\
+der:hover {\x0a\x09bac\
+kground-color: r\
+gba(54, 45, 33, \
+12);\x0a}\
+\x00\x00\x00\xe8\
+C\
+hatWidgetBase {\x0a\
+    background-c\
+olor: transparen\
+t;\x0a    border: n\
+one;\x0a\x09border-rad\
+ius: 3px;\x0a}\x0aChat\
+WidgetBase:hover\
+ {\x0a}\x0a\x0a\x0aChatWidge\
+tBase QWidget {\x0a\
+    background-c\
+olor: transparen\
+t;\x0a    border: n\
+one;\x0a}\x0aChatWidge\
+tBase QWidget:ho\
+ver {\x0a}\
+\x00\x00\x02A\
+L\
+istBase {\x0a\x09backg\
+round-color: tra\
+nsparent;\x0a    pa\
+dding: 1.2px;\x0a\x09b\
+order: none;\x0a\x09bo\
+rder-radius: 3px\
+;\x0a    outline: n\
+one;\x0a}\x0aListBase[\
+isBorderless=fal\
+se] {\x0a    paddin\
+g: 0px;\x0a    bord\
+er: 1.2px solid \
+rgba(54, 45, 33,\
+ 123);\x0a}\x0aListBas\
+e:hover {\x0a    bo\
+rder-color: rgba\
+(54, 45, 33, 210\
+);\x0a}\x0a\x0aListBase::\
+item {\x0a    color\
+: rgb(45, 33, 21\
+);\x0a\x09background-c\
+olor: transparen\
+t;\x0a    border: 2\
+.4px solid trans\
+parent;\x0a\x09padding\
+: 2.4px;\x0a}\x0aListB\
+ase::item:hover \
+{\x0a\x09background-co\
+lor: rgba(54, 45\
+, 33, 12);\x0a}\x0aLis\
+tBase::item:sele\
+cted {\x0a\x09backgrou\
+nd-color: transp\
+arent;\x0a\x09border-l\
+eft-color: rgb(1\
+20, 180, 240);\x0a}\
+\
+\x00\x00\x03\x19\
+L\
+ineEditBase, Tex\
+tEditBase {\x0a    \
+color: rgb(45, 3\
+3, 21);\x0a\x09text-al\
+ign: left;\x0a\x09sele\
+ction-background\
+-color: darkgrey\
+;\x0a\x09background-co\
+lor: rgba(24, 24\
+, 24, 6);\x0a    pa\
+dding: 4.8px 12p\
+x 6px 12px;\x0a    \
+border: 1.2px so\
+lid rgba(54, 45,\
+ 33, 12);\x0a    bo\
+rder-bottom: 1.2\
+px solid rgba(54\
+, 45, 33, 48);\x0a\x09\
+border-radius: 3\
+px;\x0a    outline:\
+ none;\x0a}\x0aLineEdi\
+tBase[isBorderle\
+ss=true], TextEd\
+itBase[isBorderl\
+ess=true] {\x0a    \
+padding: 1.2px;\x0a\
+\x09border: none;\x0a}\
+\x0aLineEditBase[is\
+Transparent=true\
+], TextEditBase[\
+isTransparent=tr\
+ue] {\x0a\x09backgroun\
+d-color: transpa\
+rent;\x0a}\x0aLineEdit\
+Base:hover, Text\
+EditBase:hover {\
+\x0a\x09background-col\
+or: rgba(24, 24,\
+ 24, 12);\x0a}\x0aLine\
+EditBase:focus, \
+TextEditBase:foc\
+us {\x0a    border-\
+bottom-color: rg\
+ba(120, 180, 240\
+, 246);\x0a}\x0aLineEd\
+itBase:disabled,\
+ TextEditBase:di\
+sabled {\x0a\x09color:\
+ rgba(45, 33, 21\
+, 90);\x0a}\
+\x00\x00\x01?\
+(\
+\xb5/\xfd`\xb8\x04\xad\x09\x00\xd2K%\x19`\xd7\x03\
+\x0c%\x1d]hv\x94K:\xff`\x0b\xba\xe6a\xf5\
+:\x8e\x00\xfe\xe7\x15\x87{\x84l\xa5\xcd\xa7>s\x9e\
+O\xfd\xbc\x0e\xa6h8Y\xfaQB\x92\xa4\x89EY\
+\xdc^\x9c;\xa3\x9e\x814lBy\x02p\xbc\x86\xb5\
+r\x8b]\x9fbm\xaelH#UH+\x0f\x5c\xfb\
+\xbc2f\xeb\xb0\xcb\x96\xf5\xf8\xc5O\x7f<\x1c\xc8k\
+\x22y\x88\x10%\xfd\x86\x8f/\x86\x0a\x9f,\xfc4\x82\
+\xa2L\xe6\x85\xf1S\x18\x04]\xd0d\x94\xf2\x1aV\x95\
+\xdaY;\xe0\xfa\xc6j\xc2\x9b}\x5c\xe1O\xb7\xf7q\
+\x02?\xa0A\xaa\x80h\x84\x82$\xa9,c0\x86\x18\
+Sfu\xaf\x01\x15\x19g\xebx\xd0v\x9b\x1e?N\
+\xda\x84[\x00!\xf0\xf9t\xb7\xc8]\x09\xf9\x16(\xfa\
+\x048\xd9\xdc9\x01s\xe2\x84\xe2\xc3\x95\xdc&\xd9\xcf\
+\xb9\xda`0r\x1dAcle\x8b\x00\xc6\xd2\x11i\
+\xb1\xa6%\x99\xe6Y\xcd\x03l\x1b\xe1\x18C\x00l\x7f\
+\xd1\x94\xa1B\xc0\xcd|\xe1A\xe7\xcc!\xd5~\xf3\x9c\
+\x0c\x94\x00\x1aO\xcalz\x0d\xd5\xe6\x99!\xb0\xc2\x96\
+V&\xa5\x8e\x1c:\xd8\xd9\xd1;\xc2\xbd\xdc\xa5i\x0e\
+\x02\x0aS\x84\xa9\x81\x5cm\xa5\xcd\xde\x1f\x00\xd4\
+\x00\x00\x06*\
+C\
+omboBoxBase {\x0a  \
+  color: rgb(45,\
+ 33, 21);\x0a\x09text-\
+align: left;\x0a\x09se\
+lection-backgrou\
+nd-color: darkgr\
+ey;\x0a\x09background-\
+color: rgba(24, \
+24, 24, 6);\x0a    \
+padding: 4.8px 1\
+2px 6px 12px;\x0a  \
+  border: 1.2px \
+solid rgba(54, 4\
+5, 33, 12);\x0a    \
+border-bottom: 1\
+.2px solid rgba(\
+54, 45, 33, 48);\
+\x0a\x09border-radius:\
+ 3px;\x0a    outlin\
+e: none;\x0a}\x0aCombo\
+BoxBase[isBorder\
+less=true] {\x0a   \
+ padding: 1.2px;\
+\x0a\x09border: none;\x0a\
+}\x0aComboBoxBase[i\
+sTransparent=tru\
+e] {\x0a\x09background\
+-color: transpar\
+ent;\x0a}\x0aComboBoxB\
+ase:hover {\x0a\x09bac\
+kground-color: r\
+gba(24, 24, 24, \
+12);\x0a}\x0aComboBoxB\
+ase:focus {\x0a    \
+border-bottom-co\
+lor: rgba(120, 1\
+80, 240, 246);\x0a}\
+\x0aComboBoxBase:di\
+sabled {\x0a\x09color:\
+ rgba(45, 33, 21\
+, 90);\x0a}\x0a\x0aComboB\
+oxBase::drop-dow\
+n {\x0a\x09subcontrol-\
+origin: padding;\
+\x0a\x09subcontrol-pos\
+ition: right;\x0a\x09m\
+argin-right: 6px\
+;\x0a\x09border: none;\
+\x0a}\x0a\x0aComboBoxBase\
+::down-arrow {\x0a\x09\
+border-image: ur\
+l(:/Icons/icons/\
+light/Chevron-Do\
+wn.svg);\x0a}\x0aCombo\
+BoxBase::down-ar\
+row:on {\x0a\x09border\
+-image: url(:/Ic\
+ons/icons/light/\
+Chevron-Up.svg);\
+\x0a}\x0a\x0a\x0aComboBoxBas\
+e QAbstractItemV\
+iew {\x0a\x09backgroun\
+d-color: white;\x0a\
+\x09border: 1.2px s\
+olid rgba(54, 45\
+, 33, 123);\x0a\x09out\
+line: none;\x0a}\x0aCo\
+mboBoxBase QAbst\
+ractItemView[isB\
+orderless=true] \
+{\x0a    padding: 1\
+.2px;\x0a\x09border: n\
+one;\x0a}\x0aComboBoxB\
+ase QAbstractIte\
+mView[isTranspar\
+ent=true] {\x0a\x09bac\
+kground-color: t\
+ransparent;\x0a}\x0a\x0aC\
+omboBoxBase QAbs\
+tractItemView::i\
+tem {\x0a    color:\
+ rgb(45, 33, 21)\
+;\x0a\x09background-co\
+lor: rgba(54, 45\
+, 33, 15);\x0a\x09padd\
+ing: 3px 6px;\x0a\x09b\
+order: none;\x0a}\x0aC\
+omboBoxBase QAbs\
+tractItemView::i\
+tem:hover {\x0a\x09bac\
+kground-color: r\
+gba(123, 123, 12\
+3, 123);\x0a}\x0aCombo\
+BoxBase QAbstrac\
+tItemView::item:\
+selected {\x0a\x09back\
+ground-color: rg\
+ba(123, 123, 123\
+, 123);\x0a}\
+\x00\x00\x01\xb8\
+G\
+roupBoxBase {\x0a  \
+  color: rgb(45,\
+ 33, 21);\x0a\x09margi\
+n-top: 1.5ex;\x0a\x09b\
+ackground-color:\
+ transparent;\x0a\x09b\
+order: 1.2px sol\
+id transparent;\x0a\
+\x09border-radius: \
+3px;\x0a}\x0a\x0aGroupBox\
+Base::title {\x0a\x09s\
+ubcontrol-origin\
+: margin;\x0a\x09subco\
+ntrol-position: \
+top left;\x0a\x09paddi\
+ng: 3px;\x0a}\x0a\x0aGrou\
+pBoxBase::indica\
+tor:checked {\x0a\x09b\
+order-image: url\
+(:/Icons/icons/l\
+ight/Chevron-Dow\
+n.svg);\x0a}\x0aGroupB\
+oxBase::indicato\
+r:unchecked {\x0a\x09b\
+order-image: url\
+(:/Icons/icons/l\
+ight/Chevron-Up.\
+svg);\x0a}\
+\x00\x00\x00\xe4\
+S\
+crollAreaBase {\x0a\
+\x09border: 0px sol\
+id;\x0a\x09border-radi\
+us: 3px;\x0a}\x0aScrol\
+lAreaBase[isBord\
+erless=true] {\x0a \
+   padding: 1.2p\
+x;\x0a\x09border: none\
+;\x0a}\x0aScrollAreaBa\
+se[isTransparent\
+=true] {\x0a\x09backgr\
+ound-color: tran\
+sparent;\x0a}\x0aScrol\
+lAreaBase:hover \
+{\x0a}\
+\x00\x00\x00\x99\
+L\
+abelBase {\x0a    c\
+olor: rgb(45, 33\
+, 21);\x0a    backg\
+round-color: tra\
+nsparent;\x0a    pa\
+dding: 0px;\x0a    \
+border: none;\x0a\x09b\
+order-radius: 3p\
+x;\x0a}\x0aLabelBase:h\
+over {\x0a}\
+\x00\x00\x01\xfa\
+Q\
+TabWidget::tab-b\
+ar {\x0a    alignme\
+nt: left;\x0a}\x0a\x0a\x0aQT\
+abBar::tab {\x0a   \
+ color: rgb(45, \
+33, 21);\x0a\x09backgr\
+ound-color: rgba\
+(24, 24, 24, 6);\
+\x0a    padding: 2.\
+4px 4.8px;\x0a    b\
+order: 1.2px sol\
+id rgba(54, 45, \
+33, 12);\x0a}\x0aQTabB\
+ar::tab[isBorder\
+less=true] {\x0a   \
+ padding: 3.6px \
+6.0px;\x0a\x09border: \
+none;\x0a}\x0aQTabBar:\
+:tab:hover {\x0a\x09ba\
+ckground-color: \
+rgba(24, 24, 24,\
+ 12);\x0a}\x0aQTabBar:\
+:tab:selected {\x0a\
+\x09background-colo\
+r: rgba(24, 24, \
+24, 18);\x0a}\x0a\x0a\x0aQTa\
+bWidget::pane {\x0a\
+\x09background: tra\
+nsparent;\x0a    bo\
+rder: 1.2px soli\
+d rgba(54, 45, 3\
+3, 12);\x0a}\
+\x00\x00\x02h\
+Q\
+TreeView {\x0a\x09back\
+ground-color: tr\
+ansparent;\x0a    o\
+utline: none;\x0a\x09b\
+order: none;\x0a\x09bo\
+rder-radius: 3px\
+;\x0a}\x0a\x0aQTreeView::\
+item {\x0a    color\
+: rgb(45, 33, 21\
+);\x0a\x09background-c\
+olor: transparen\
+t;\x0a\x09padding: 3px\
+;\x0a\x09border: none;\
+\x0a\x09border-radius:\
+ 3px;\x0a}\x0aQTreeVie\
+w::item:hover {\x0a\
+\x09background-colo\
+r: rgba(54, 45, \
+33, 12);\x0a}\x0aQTree\
+View::item:selec\
+ted {\x0a}\x0a\x0aQTreeVi\
+ew::branch {\x0a   \
+ background-colo\
+r: transparent;\x0a\
+\x09border: none;\x0a}\
+\x0aQTreeView::bran\
+ch:open:has-chil\
+dren {\x0a\x09image: u\
+rl(:/Icons/icons\
+/light/Chevron-D\
+own.svg);\x0a\x09paddi\
+ng: 3px;\x0a}\x0aQTree\
+View::branch:clo\
+sed:has-children\
+ {\x0a\x09image: url(:\
+/Icons/icons/lig\
+ht/Chevron-Right\
+.svg);\x0a\x09padding:\
+ 3px;\x0a}\
+\x00\x00\x04%\
+M\
+ediaPlayerBase {\
+\x0a    padding: 4.\
+8px 12px 6px 12p\
+x;\x0a}\x0aMediaPlayer\
+Base[isBorderles\
+s=true] {\x0a    pa\
+dding: 1.2px;\x0a\x09b\
+order: none;\x0a}\x0aM\
+ediaPlayerBase[i\
+sTransparent=tru\
+e] {\x0a\x09background\
+-color: transpar\
+ent;\x0a}\x0a\x0aMediaPla\
+yerBase ButtonBa\
+se {\x0a    backgro\
+und-color: trans\
+parent;\x0a    bord\
+er: none;\x0a    bo\
+rder-radius: 12p\
+x;\x0a}\x0aMediaPlayer\
+Base ButtonBase:\
+hover {\x0a    back\
+ground-color: rg\
+ba(54, 45, 33, 3\
+3);\x0a}\x0a\x0a\x0aMediaPla\
+yerBase QSlider:\
+:groove:horizont\
+al {\x0a\x09height: 1.\
+2px;\x0a\x09background\
+-color: rgba(54,\
+ 45, 33, 123);\x0a\x09\
+border: none;\x0a\x09b\
+order-radius: 6p\
+x;\x0a}\x0aMediaPlayer\
+Base QSlider::gr\
+oove:horizontal:\
+hover {\x0a\x09backgro\
+und-color: rgba(\
+54, 45, 33, 210)\
+;\x0a}\x0a\x0aMediaPlayer\
+Base QSlider::ha\
+ndle:horizontal \
+{\x0a\x09width: 12px;\x0a\
+\x09height: 12px;\x0a\x09\
+background-color\
+: rgba(54, 45, 3\
+3, 210);\x0a\x09margin\
+-top: -6px;\x0a\x09mar\
+gin-bottom: -6px\
+;\x0a\x09border: 1.2px\
+ solid transpare\
+nt;\x0a\x09border-radi\
+us: 6px;\x0a}\x0aMedia\
+PlayerBase QSlid\
+er::handle:horiz\
+ontal:hover {\x0a\x09b\
+ackground-color:\
+ rgba(45, 33, 21\
+, 234);\x0a}\x0a\x0a\x0aEmbe\
+ddedMediaPlayer \
+{\x0a\x09background-co\
+lor: transparent\
+;\x0a    padding: 1\
+.2px;\x0a\x09border: n\
+one;\x0a}\x0aEmbeddedM\
+ediaPlayer:hover\
+ {\x0a}\
+\x00\x00\x01%\
+T\
+oolTipBase {\x0a   \
+ background-colo\
+r: rgba(24, 24, \
+24, 6);\x0a    bord\
+er: 1.2px solid \
+rgba(54, 45, 33,\
+ 12);\x0a    border\
+-radius: 3px;\x0a}\x0a\
+ToolTipBase[isTr\
+ansparent=true] \
+{\x0a    background\
+-color: transpar\
+ent;\x0a}\x0a\x0a\x0aQLabel \
+{\x0a    color: rgb\
+(45, 33, 21);\x0a  \
+  background-col\
+or: transparent;\
+\x0a    border: non\
+e;\x0a}\
+\x00\x00\x03{\
+M\
+enuBase {\x0a    ba\
+ckground-color: \
+transparent;\x0a   \
+ border: none;\x0a}\
+\x0a\x0aMenuActionList\
+Widget {\x0a    fon\
+t: 12px --FontFa\
+milies;\x0a    back\
+ground-color: rg\
+ba(24, 24, 24, 6\
+);\x0a    border: 1\
+.2px solid rgba(\
+54, 45, 33, 12);\
+\x0a    border-radi\
+us: 3px;\x0a    out\
+line: none;\x0a}\x0aMe\
+nuActionListWidg\
+et[transparent=t\
+rue] {\x0a    backg\
+round-color: tra\
+nsparent;\x0a}\x0a\x0aMen\
+uActionListWidge\
+t::item {\x0a    pa\
+dding-left: 9px;\
+\x0a    padding-rig\
+ht: 9px;\x0a    bor\
+der-radius: 3px;\
+\x0a    margin-left\
+: 6px;\x0a    margi\
+n-right: 6px;\x0a  \
+  color: rgb(45,\
+ 33, 21);\x0a    bo\
+rder: none;\x0a}\x0aMe\
+nuActionListWidg\
+et::item:hover {\
+\x0a    background-\
+color: rgba(24, \
+24, 24, 12);\x0a}\x0aM\
+enuActionListWid\
+get::item:select\
+ed {\x0a    color: \
+rgba(45, 33, 21,\
+ 123);\x0a    backg\
+round-color: rgb\
+a(120, 180, 240,\
+ 246);\x0a}\x0aMenuAct\
+ionListWidget::i\
+tem:disabled {\x0a \
+   padding-left:\
+ 9px;\x0a    paddin\
+g-right: 9px;\x0a  \
+  border-radius:\
+ 3px;\x0a    color:\
+ rgba(45, 33, 21\
+, 90);\x0a    borde\
+r: none;\x0a}\
+\x00\x00\x00\xf8\
+Q\
+DockWidget {\x0a   \
+ border: none;\x0a}\
+\x0aQDockWidget[isB\
+orderless=false]\
+ {\x0a    padding: \
+0px;\x0a    border:\
+ 1.2px solid rgb\
+a(54, 45, 33, 12\
+3);\x0a}\x0aQDockWidge\
+t[isTransparent=\
+true] {\x0a\x09backgro\
+und-color: trans\
+parent;\x0a}\x0a\x0aQDock\
+Widget::title {\x0a\
+    text-align: \
+left;\x0a}\
+\x00\x00\x03\x82\
+Q\
+HeaderView {\x0a   \
+ background-colo\
+r: transparent;\x0a\
+}\x0a\x0aQHeaderView::\
+section {\x0a    co\
+lor: rgb(45, 33,\
+ 21);\x0a\x09backgroun\
+d-color: transpa\
+rent;\x0a    paddin\
+g: 2.4px 4.8px;\x0a\
+    border: 1.2p\
+x solid rgba(54,\
+ 45, 33, 123);\x0a}\
+\x0aQHeaderView::se\
+ction:horizontal\
+ {\x0a    border-to\
+p: none;\x0a    bor\
+der-left: none;\x0a\
+}\x0aQHeaderView::s\
+ection:vertical \
+{\x0a    border-top\
+: none;\x0a}\x0a\x0a\x0aQTab\
+leView {\x0a\x09backgr\
+ound-color: tran\
+sparent;\x0a    sel\
+ection-backgroun\
+d-color: transpa\
+rent;\x0a    gridli\
+ne-color: rgba(5\
+4, 45, 33, 123);\
+\x0a\x09border: 1.2px \
+solid rgba(54, 4\
+5, 33, 123);\x0a\x09bo\
+rder-radius: 3px\
+;\x0a    outline: n\
+one;\x0a}\x0aQTableVie\
+w[isBorderless=t\
+rue] {\x0a    paddi\
+ng: 1.2px;\x0a\x09bord\
+er: none;\x0a}\x0a\x0aQTa\
+bleView::item {\x0a\
+    color: rgb(4\
+5, 33, 21);\x0a    \
+padding: 3px 6px\
+;\x0a    border: 0p\
+x solid rgba(54,\
+ 45, 33, 123);\x0a\x09\
+border-bottom-wi\
+dth: 1.2px;\x0a}\x0aQT\
+ableView::item::\
+selected {\x0a\x09bord\
+er-color: rgba(5\
+4, 45, 33, 210);\
+\x0a}\x0aQTableView::i\
+tem:!alternate:!\
+selected {\x0a    \x0a\
+}\
+\x00\x00\x05]\
+S\
+pinBoxBase, Doub\
+leSpinBoxBase {\x0a\
+    color: rgb(4\
+5, 33, 21);\x0a\x09tex\
+t-align: left;\x0a\x09\
+selection-backgr\
+ound-color: dark\
+grey;\x0a\x09backgroun\
+d-color: rgba(24\
+, 24, 24, 6);\x0a  \
+  padding: 4.8px\
+ 12px 6px 12px;\x0a\
+    border: 1.2p\
+x solid rgba(54,\
+ 45, 33, 12);\x0a  \
+  border-bottom:\
+ 1.2px solid rgb\
+a(54, 45, 33, 48\
+);\x0a\x09border-radiu\
+s: 3px;\x0a    outl\
+ine: none;\x0a}\x0aSpi\
+nBoxBase[isBorde\
+rless=true] Doub\
+leSpinBoxBase[is\
+Borderless=true]\
+ {\x0a    padding: \
+1.2px;\x0a\x09border: \
+none;\x0a}\x0aSpinBoxB\
+ase[isTransparen\
+t=true] DoubleSp\
+inBoxBase[isBord\
+erless=true] {\x0a\x09\
+background-color\
+: transparent;\x0a}\
+\x0aSpinBoxBase:hov\
+er, DoubleSpinBo\
+xBase:hover {\x0a\x09b\
+ackground-color:\
+ rgba(24, 24, 24\
+, 12);\x0a}\x0aSpinBox\
+Base:focus, Doub\
+leSpinBoxBase:fo\
+cus {\x0a    border\
+-bottom-color: r\
+gba(120, 180, 24\
+0, 246);\x0a}\x0aSpinB\
+oxBase:disabled,\
+ DoubleSpinBoxBa\
+se:disabled {\x0a\x09c\
+olor: rgba(45, 3\
+3, 21, 90);\x0a}\x0a\x0aS\
+pinBoxBase::up-b\
+utton, DoubleSpi\
+nBoxBase::up-but\
+ton {\x0a\x09subcontro\
+l-origin: paddin\
+g;\x0a\x09subcontrol-p\
+osition: top rig\
+ht;\x0a\x09margin-righ\
+t: 4.5px;\x0a\x09borde\
+r-width: 0px;\x0a}\x0a\
+SpinBoxBase::up-\
+arrow, DoubleSpi\
+nBoxBase::up-arr\
+ow {\x0a\x09border-ima\
+ge: url(:/Icons/\
+icons/light/Chev\
+ron-Up.svg);\x0a}\x0a\x0a\
+SpinBoxBase::dow\
+n-button, Double\
+SpinBoxBase::dow\
+n-button {\x0a\x09subc\
+ontrol-origin: p\
+adding;\x0a\x09subcont\
+rol-position: bo\
+ttom right;\x0a\x09mar\
+gin-right: 4.5px\
+;\x0a\x09border-width:\
+ 0px;\x0a}\x0aSpinBoxB\
+ase::down-arrow,\
+ DoubleSpinBoxBa\
+se::down-arrow {\
+\x0a\x09border-image: \
+url(:/Icons/icon\
+s/light/Chevron-\
+Down.svg);\x0a}\
+"
+
+qt_resource_name = b"\
+\x00\x03\
+\x00\x00V\x83\
+\x00Q\
+\x00S\x00S\
+\x00\x03\
+\x00\x00x\xa3\
+\x00q\
+\x00s\x00s\
+\x00\x05\
+\x00r\xfd\xf4\
+\x00l\
+\x00i\x00g\x00h\x00t\
+\x00\x0f\
+\x03U\x92\x03\
+\x00P\
+\x00r\x00o\x00g\x00r\x00e\x00s\x00s\x00B\x00a\x00r\x00.\x00q\x00s\x00s\
+\x00\x0a\
+\x0bha\xc3\
+\x00B\
+\x00u\x00t\x00t\x00o\x00n\x00.\x00q\x00s\x00s\
+\x00\x07\
+\x08\x85X#\
+\x00B\
+\x00a\x00r\x00.\x00q\x00s\x00s\
+\x00\x0c\
+\x00V+C\
+\x00C\
+\x00h\x00e\x00c\x00k\x00B\x00o\x00x\x00.\x00q\x00s\x00s\
+\x00\x0b\
+\x09Vuc\
+\x00B\
+\x00r\x00o\x00w\x00s\x00e\x00r\x00.\x00q\x00s\x00s\
+\x00\x0b\
+\x09\xdd\x94\xa3\
+\x00T\
+\x00o\x00o\x00l\x00B\x00o\x00x\x00.\x00q\x00s\x00s\
+\x00\x0e\
+\x00\xd4\xf5\x83\
+\x00C\
+\x00h\x00a\x00t\x00W\x00i\x00d\x00g\x00e\x00t\x00.\x00q\x00s\x00s\
+\x00\x08\
+\x00\xa7R\xc3\
+\x00L\
+\x00i\x00s\x00t\x00.\x00q\x00s\x00s\
+\x00\x08\
+\x0b\x07Q\xc3\
+\x00E\
+\x00d\x00i\x00t\x00.\x00q\x00s\x00s\
+\x00\x0a\
+\x0a\xce\x1dC\
+\x00S\
+\x00l\x00i\x00d\x00e\x00r\x00.\x00q\x00s\x00s\
+\x00\x0c\
+\x00'*\xc3\
+\x00C\
+\x00o\x00m\x00b\x00o\x00B\x00o\x00x\x00.\x00q\x00s\x00s\
+\x00\x0c\
+\x00\xb9\x80#\
+\x00G\
+\x00r\x00o\x00u\x00p\x00B\x00o\x00x\x00.\x00q\x00s\x00s\
+\x00\x0e\
+\x0d\xa0/\xc3\
+\x00S\
+\x00c\x00r\x00o\x00l\x00l\x00A\x00r\x00e\x00a\x00.\x00q\x00s\x00s\
+\x00\x09\
+\x08\xbf\xfcC\
+\x00L\
+\x00a\x00b\x00e\x00l\x00.\x00q\x00s\x00s\
+\x00\x07\
+\x0auX\x03\
+\x00T\
+\x00a\x00b\x00.\x00q\x00s\x00s\
+\x00\x08\
+\x08\xb8S\xc3\
+\x00T\
+\x00r\x00e\x00e\x00.\x00q\x00s\x00s\
+\x00\x0a\
+\x0f\xcf\xbd\xa3\
+\x00P\
+\x00l\x00a\x00y\x00e\x00r\x00.\x00q\x00s\x00s\
+\x00\x0b\
+\x0b\xb5\x94\x83\
+\x00T\
+\x00o\x00o\x00l\x00T\x00i\x00p\x00.\x00q\x00s\x00s\
+\x00\x08\
+\x0cXR\xc3\
+\x00M\
+\x00e\x00n\x00u\x00.\x00q\x00s\x00s\
+\x00\x0e\
+\x06\x86\xf5#\
+\x00D\
+\x00o\x00c\x00k\x00W\x00i\x00d\x00g\x00e\x00t\x00.\x00q\x00s\x00s\
+\x00\x09\
+\x09(\xecC\
+\x00T\
+\x00a\x00b\x00l\x00e\x00.\x00q\x00s\x00s\
+\x00\x0b\
+\x09\xdf\xb8\xe3\
+\x00S\
+\x00p\x00i\x00n\x00B\x00o\x00x\x00.\x00q\x00s\x00s\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x0c\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x18\x00\x02\x00\x00\x00\x16\x00\x00\x00\x04\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x018\x00\x00\x00\x00\x00\x01\x00\x00\x15\x0f\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00z\x00\x00\x00\x00\x00\x01\x00\x00\x09a\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00\xf2\x00\x00\x00\x00\x00\x01\x00\x00\x0ej\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01V\x00\x00\x00\x00\x00\x01\x00\x00\x1b=\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00\xd0\x00\x00\x00\x00\x00\x01\x00\x00\x0d~\
+\x00\x00\x01\xa1ON\xf6\xe9\
+\x00\x00\x00(\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x02$\x00\x00\x00\x00\x00\x01\x00\x00+\xb9\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00f\x00\x00\x00\x00\x00\x01\x00\x00\x08\xc4\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\xc2\x00\x00\x00\x00\x00\x01\x00\x00 |\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\x96\x00\x00\x00\x00\x00\x01\x00\x00\x1d\xe1\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x02F\x00\x00\x00\x00\x00\x01\x00\x00,\xb5\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00\x98\x00\x00\x00\x00\x00\x01\x00\x00\x0a{\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x0b\xc3\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x02^\x00\x00\x00\x00\x00\x01\x00\x000;\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\xae\x00\x00\x00\x00\x00\x01\x00\x00\x1e~\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\x1e\x00\x04\x00\x00\x00\x01\x00\x00\x13\xcc\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\x08\x00\x00\x00\x00\x00\x01\x00\x00\x10\xaf\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x00L\x00\x00\x00\x00\x00\x01\x00\x00\x01\xea\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\xf2\x00\x00\x00\x00\x00\x01\x00\x00'\x11\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x02\x0e\x00\x00\x00\x00\x00\x01\x00\x00(:\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01t\x00\x00\x00\x00\x00\x01\x00\x00\x1c\xf9\
+\x00\x00\x01\x9b\x01L[`\
+\x00\x00\x01\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x22\xe8\
+\x00\x00\x01\xa1N\xb4\x8d\xfd\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
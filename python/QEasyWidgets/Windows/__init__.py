@@ -1,3 +1,26 @@
-#from .FramelessWindow import TitleBarBase
-from .Window import WindowBase, MainWindowBase, ChildWindowBase
-from .Dialog import DialogBase, InputDialogBase, MessageBoxBase
\ No newline at end of file
+import importlib
+
+##############################################################################################################################
+
+# Windows are only imported on first access: module -> names
+_lazyModules = {
+    #'.FramelessWindow': ['TitleBarBase'],
+    '.Window': ['WindowBase', 'MainWindowBase', 'ChildWindowBase'],
+    '.Dialog': ['DialogBase', 'InputDialogBase', 'MessageBoxBase'],
+}
+
+_lazyAttributes = {name: moduleName for moduleName, names in _lazyModules.items() for name in names}
+
+__all__ = list(_lazyAttributes)
+
+
+def __getattr__(name: str):
+    if name not in _lazyAttributes:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_lazyAttributes[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazyAttributes))
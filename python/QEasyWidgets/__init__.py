@@ -1,3 +1,32 @@
-from .Common import componentsSignals, Theme, isDarkTheme, currentTheme, currentColor, Language, currentLanguage, TranslationBase, updateLanguage, IconBase, Status, ChatRole
-from .Common import QFunctions, QWorker, QTasks
-from .Resources import sources
\ No newline at end of file
+import importlib
+
+from .Common import componentsSignals, Theme, isDarkTheme, currentTheme, currentColor, Language, currentLanguage, TranslationBase, updateLanguage, Status, ChatRole
+
+##############################################################################################################################
+
+# Heavy modules are only imported on first access: name -> (module, attribute), the module itself is returned when attribute is None
+_lazyAttributes = {
+    'IconBase': ('.Common.Icon', 'IconBase'),
+    'QFunctions': ('.Common.QFunctions', None),
+    'QWorker': ('.Common.QWorker', None),
+    'QTasks': ('.Common.QTasks', None),
+    'sources': ('.Resources.sources', None),
+}
+
+__all__ = [
+    'componentsSignals', 'Theme', 'isDarkTheme', 'currentTheme', 'currentColor', 'Language', 'currentLanguage', 'TranslationBase', 'updateLanguage', 'Status', 'ChatRole'
+] + list(_lazyAttributes)
+
+
+def __getattr__(name: str):
+    if name not in _lazyAttributes:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    moduleName, attributeName = _lazyAttributes[name]
+    module = importlib.import_module(moduleName, __name__)
+    value = getattr(module, attributeName) if attributeName is not None else module
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazyAttributes))
@@ -0,0 +1,45 @@
+'''
+Paints per second of ButtonBase and NavigationButton, offscreen
+
+    python benchmarks/benchmark_button.py [iterations]
+'''
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QApplication
+
+##############################################################################################################################
+
+def benchmark(buttonType, iterations: int) -> float:
+    button = buttonType()
+    button.setText('Benchmark button')
+    button.setIcon(IconBase.OpenedFolder)
+    button.resize(QSize(160, 36))
+    button.show()
+    QApplication.processEvents()
+    pixmap = QPixmap(button.size())
+    button.render(pixmap)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        button.render(pixmap)
+    return iterations / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    from QEasyWidgets.Common.Icon import IconBase
+    from QEasyWidgets.Components.Button import ButtonBase, NavigationButton
+
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    for buttonType in (ButtonBase, NavigationButton):
+        print(f'{buttonType.__name__:<18}{benchmark(buttonType, iterations):>10.0f} paints/s')
+
+##############################################################################################################################
@@ -0,0 +1,52 @@
+'''
+TableBase.clearRows on a shown 3-column table with cell widgets attached, offscreen;
+fails unless clearing 5 times as many rows takes well under 25 times as long (linear, not quadratic)
+
+    python benchmarks/benchmark_clear_rows.py [rows] [widget interval]
+'''
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from PySide6.QtWidgets import QApplication, QLabel
+
+##############################################################################################################################
+
+def benchmark(rowCount: int, widgetInterval: int) -> float:
+    table = TableBase()
+    table.setColumnCount(3)
+    table.model().insertRowValues(0, [[f'{row}', f'{row * 2}', f'{row * 3}'] for row in range(rowCount)])
+    for row in range(0, rowCount, widgetInterval):
+        table.setCellWidget(row, 2, QLabel(f'{row}'))
+    table.show()
+    QApplication.processEvents()
+    start = time.perf_counter()
+    table.clearRows()
+    QApplication.processEvents()
+    duration = time.perf_counter() - start
+    assert table.rowCount() == 0
+    table.deleteLater()
+    QApplication.processEvents()
+    return duration
+
+
+if __name__ == '__main__':
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    from QEasyWidgets.Components.Table import TableBase
+
+    rowCount = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    widgetInterval = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    small = benchmark(rowCount, widgetInterval)
+    large = benchmark(rowCount * 5, widgetInterval)
+    ratio = large / small
+    print(f'{rowCount:>8} rows {small:>8.3f}s')
+    print(f'{rowCount * 5:>8} rows {large:>8.3f}s')
+    print(f'ratio    {ratio:>13.1f} (linear ~5, quadratic ~25)')
+    sys.exit(0 if ratio < 10 else 1)
+
+##############################################################################################################################
@@ -0,0 +1,53 @@
+'''
+Import time of the package and of a single widget, each in a fresh interpreter;
+fails when a deferred dependency (darkdetect, psutil, pynvml, the resource modules) is loaded by the import
+
+    python benchmarks/benchmark_import.py [runs]
+'''
+import os
+import sys
+import json
+import statistics
+import subprocess
+from pathlib import Path
+
+##############################################################################################################################
+
+statements = [
+    'import QEasyWidgets',
+    'from QEasyWidgets.Components.Button import ButtonBase',
+]
+
+deferredModules = ['darkdetect', 'psutil', 'pynvml', 'QEasyWidgets.Resources.sources']
+
+measure = '''
+import sys, json, time
+start = time.perf_counter()
+exec(sys.argv[1])
+duration = time.perf_counter() - start
+print(json.dumps([duration, [name for name in sys.modules if any(name == module or name.startswith(module) for module in sys.argv[2:])]]))
+'''
+
+
+def benchmark(statement: str, runs: int) -> tuple[float, set]:
+    environment = dict(os.environ, QT_QPA_PLATFORM = os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+    environment['PYTHONPATH'] = os.pathsep.join(filter(None, [str(Path(__file__).resolve().parents[1]), environment.get('PYTHONPATH')]))
+    durations, loaded = [], set()
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', measure, statement, *deferredModules], env = environment, capture_output = True, text = True, check = True).stdout
+        duration, modules = json.loads(output.strip().splitlines()[-1])
+        durations.append(duration)
+        loaded.update(modules)
+    return statistics.median(durations), loaded
+
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    failed = False
+    for statement in statements:
+        duration, loaded = benchmark(statement, runs)
+        print(f'{statement:<56}{duration:>8.3f}s{"  loads " + ", ".join(sorted(loaded)) if loaded else ""}')
+        failed = failed or len(loaded) > 0
+    sys.exit(1 if failed else 0)
+
+##############################################################################################################################
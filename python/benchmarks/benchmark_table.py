@@ -0,0 +1,38 @@
+'''
+Rows appended one at a time to a shown 3-column TableBase, offscreen
+
+    python benchmarks/benchmark_table.py [rows ...]
+'''
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from PySide6.QtWidgets import QApplication
+
+##############################################################################################################################
+
+def benchmark(rowCount: int) -> float:
+    table = TableBase()
+    table.setColumnCount(3)
+    table.show()
+    QApplication.processEvents()
+    start = time.perf_counter()
+    for row in range(rowCount):
+        table.insertRow(row)
+    QApplication.processEvents()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    from QEasyWidgets.Components.Table import TableBase
+
+    for rowCount in [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000]:
+        print(f'{rowCount:>8} rows {benchmark(rowCount):>8.3f}s')
+
+##############################################################################################################################
@@ -0,0 +1,74 @@
+'''
+Animated theme switches of a TextColorAnimationBase window over a deep widget tree, offscreen
+
+    python benchmarks/benchmark_theme.py [depth] [switches]
+'''
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout
+
+##############################################################################################################################
+
+def buildTree(parent: QWidget, depth: int) -> None:
+    layout = QVBoxLayout(parent)
+    for _ in range(3):
+        if depth > 1:
+            child = QWidget(parent)
+            buildTree(child, depth - 1)
+        else:
+            child = QLabel('Label', parent)
+        layout.addWidget(child)
+
+
+if __name__ == '__main__':
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    from QEasyWidgets.Common.Signals import componentsSignals
+    from QEasyWidgets.Common.Theme import Theme, TextColorAnimationBase, colorAnimationDriver, isDarkTheme
+
+    class Window(TextColorAnimationBase, QWidget):
+        setPaletteCalls = 0
+        setPaletteTime = 0.
+
+        def __init__(self):
+            QWidget.__init__(self)
+            TextColorAnimationBase.__init__(self)
+
+        def setPalette(self, palette: QPalette) -> None:
+            start = time.perf_counter()
+            super().setPalette(palette)
+            Window.setPaletteTime += time.perf_counter() - start
+            Window.setPaletteCalls += 1
+
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    switches = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    window = Window()
+    buildTree(window, depth)
+    window.show()
+    QApplication.processEvents()
+    Window.setPaletteCalls, Window.setPaletteTime = 0, 0.
+
+    eventTime = 0.
+    for _ in range(switches):
+        componentsSignals.setTheme.emit(Theme.Light if isDarkTheme() else Theme.Dark)
+        # Every transition has settled well within twice the animation duration
+        deadline = time.perf_counter() + 2 * colorAnimationDriver.duration() / 1000
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            QApplication.processEvents()
+            eventTime += time.perf_counter() - start
+            time.sleep(0.001)
+
+    print(f'descendants        {len(window.findChildren(QWidget))}')
+    print(f'setPalette calls   {Window.setPaletteCalls} ({Window.setPaletteTime:.2f}s)')
+    print(f'processEvents      {eventTime:.2f}s over {switches} switches')
+
+##############################################################################################################################